@@ -0,0 +1,398 @@
+"""Micro-benchmarks of the hot paths of py42195.
+
+Run from the repository root (or via `just bench`):
+
+    python benchmarks/bench.py                      # print the results
+    python benchmarks/bench.py -o results.json      # store them
+    python benchmarks/bench.py --compare results.json --max-regression 0.1
+
+Each case reports the best time per item (in ns) out of several repeats,
+batch cases being normalized by their number of items. The inputs of a case
+are only built if it is selected (e.g. with `-k`). The stored JSON
+can be compared with a later run; the script fails if any case is slower
+than the allowed regression.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from datetime import datetime, timezone
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import py42195  # noqa: E402
+from py42195 import Distance, Duration, Pace, Speed  # noqa: E402
+from py42195.splits import split_plan  # noqa: E402
+from py42195.utils import format_interval, parse_interval  # noqa: E402
+
+# (callable without arguments, number of items processed by one call)
+Case = tuple[Callable[[], Any], int]
+
+# Builds the inputs of a case and returns it, called only for the selected cases
+CaseFactory = Callable[[], Case]
+
+BATCH_SIZE = 10_000
+
+# Large enough for the intermediate arrays not to fit in the cache
+BIG_SIZE = 1_000_000
+
+
+@cache
+def race_data(n: int = BATCH_SIZE, seed: int = 42195) -> dict[str, list]:
+    """Deterministic sample of marathon results in various forms."""
+    rng = random.Random(seed)
+    seconds = [rng.gauss(4 * 3600 + 15 * 60, 40 * 60) for _ in range(n)]
+    seconds = [max(2 * 3600 + 5 * 60, s) for s in seconds]
+    paces = [s / 42.195 for s in seconds]
+    return {
+        "seconds": seconds,
+        "durations": [Duration(s) for s in seconds],
+        "paces": [Pace(seconds_per_km=p) for p in paces],
+        "speeds": [Speed(km_h=3600 / p) for p in paces],
+        "distances": [Distance(km=rng.uniform(0.4, 42.195)) for _ in range(n)],
+        "duration_strings": [format_interval(s, int_seconds=True) for s in seconds],
+        "pace_strings": [format_interval(p, int_seconds=True) for p in paces],
+        "distance_strings": [
+            rng.choice(["5 km", "10km", "21.0975 km", "13.1 mi", "400 m", "42.195"])
+            for _ in range(n)
+        ],
+        "speed_strings": [f"{3600 / p:.2f} km/h" for p in paces],
+    }
+
+
+def _batch(make: Callable[[dict[str, list]], Callable[[], Any]]) -> CaseFactory:
+    """Case over the race data, created when the case is selected."""
+
+    def factory() -> Case:
+        data = race_data()
+        return make(data), len(data["seconds"])
+
+    return factory
+
+
+def construction_cases() -> Iterator[tuple[str, CaseFactory]]:
+    for unit in Distance.ALLOWED_UNITS:
+        yield (
+            f"construct.Distance({unit}=)",
+            lambda u=unit: (lambda: Distance(**{u: 5.0}), 1),
+        )
+    yield "construct.Duration(float)", lambda: (lambda: Duration(1234.5), 1)
+    for unit in ("seconds_per_km", "seconds_per_mile"):
+        yield (
+            f"construct.Pace({unit}=)",
+            lambda u=unit: (lambda: Pace(**{u: 300.0}), 1),
+        )
+    for unit in ("km_h", "mph", "m_s"):
+        yield (
+            f"construct.Speed({unit}=)",
+            lambda u=unit: (lambda: Speed(**{u: 12.0}), 1),
+        )
+
+
+def operator_cases() -> Iterator[tuple[str, CaseFactory]]:
+    d = Distance(km=10)
+    t = Duration(2700)
+    p = Pace(seconds_per_km=270)
+    s = Speed(km_h=13.3)
+    operands = {"Distance": d, "Duration": t, "Pace": p, "Speed": s, "float": 2.5}
+    operations = [
+        ("Distance", "+", "Distance"),
+        ("Distance", "-", "Distance"),
+        ("Distance", "*", "float"),
+        ("float", "*", "Distance"),
+        ("Distance", "*", "Pace"),
+        ("Distance", "/", "float"),
+        ("Distance", "/", "Distance"),
+        ("Distance", "/", "Duration"),
+        ("Distance", "/", "Speed"),
+        ("Duration", "+", "Duration"),
+        ("Duration", "-", "Duration"),
+        ("Duration", "*", "float"),
+        ("Duration", "*", "Speed"),
+        ("Duration", "/", "float"),
+        ("Duration", "/", "Distance"),
+        ("Duration", "/", "Pace"),
+        ("Duration", "/", "Duration"),
+        ("Pace", "+", "Pace"),
+        ("Pace", "-", "Pace"),
+        ("Pace", "*", "float"),
+        ("Pace", "*", "Distance"),
+        ("Pace", "/", "float"),
+        ("Pace", "/", "Pace"),
+        ("Speed", "+", "Speed"),
+        ("Speed", "-", "Speed"),
+        ("Speed", "*", "float"),
+        ("Speed", "*", "Duration"),
+        ("Speed", "/", "float"),
+        ("Speed", "/", "Speed"),
+        ("Distance", "==", "Distance"),
+        ("Pace", "<", "Pace"),
+    ]
+    for left, op, right in operations:
+        # A plain function doing just the operation (compiled once, not on every call)
+        namespace = {"a": operands[left], "b": operands[right]}
+        func = eval(f"lambda: a {op} b", namespace)
+        yield f"op.{left}{op}{right}", lambda f=func: (f, 1)
+    yield "convert.Pace.to_speed", lambda: (p.to_speed, 1)
+    yield "convert.Speed.to_pace", lambda: (s.to_pace, 1)
+
+
+def parsing_cases() -> Iterator[tuple[str, CaseFactory]]:
+    yield (
+        "parse.parse_interval",
+        _batch(
+            lambda data: lambda: [parse_interval(s) for s in data["duration_strings"]]
+        ),
+    )
+    for quantity, key in (
+        (Duration, "duration_strings"),
+        (Pace, "pace_strings"),
+        (Distance, "distance_strings"),
+        (Speed, "speed_strings"),
+    ):
+        yield (
+            f"parse.{quantity.__name__}.parse",
+            _batch(
+                lambda data, q=quantity, k=key: lambda: [q.parse(s) for s in data[k]]
+            ),
+        )
+        yield (
+            f"parse.{quantity.__name__}.parse_values",
+            _batch(lambda data, q=quantity, k=key: lambda: q.parse_values(data[k])),
+        )
+
+
+def formatting_cases() -> Iterator[tuple[str, CaseFactory]]:
+    yield (
+        "format.format_interval",
+        _batch(lambda data: lambda: [format_interval(s) for s in data["seconds"]]),
+    )
+    for quantity, key, attr in (
+        (Duration, "durations", "seconds"),
+        (Pace, "paces", "seconds_per_km"),
+        (Distance, "distances", "km"),
+        (Speed, "speeds", "km_h"),
+    ):
+        yield (
+            f"format.{quantity.__name__}.__str__",
+            _batch(lambda data, k=key: lambda: [str(v) for v in data[k]]),
+        )
+
+        def format_many(data, q=quantity, k=key, a=attr):
+            canonical = [getattr(value, a) for value in data[k]]
+            return lambda: q.format_many(canonical)
+
+        yield f"format.{quantity.__name__}.format_many", _batch(format_many)
+
+
+def aggregation_cases() -> Iterator[tuple[str, CaseFactory]]:
+    for key in ("durations", "distances", "paces", "speeds"):
+        yield f"sum.{key}", _batch(lambda data, k=key: lambda: sum(data[k]))
+    yield (
+        "sum.Duration.sum",
+        _batch(lambda data: lambda: Duration.sum(data["durations"])),
+    )
+    yield (
+        "sum.Distance.sum",
+        _batch(lambda data: lambda: Distance.sum(data["distances"])),
+    )
+    yield "mean.Pace.mean", _batch(lambda data: lambda: Pace.mean(data["paces"]))
+    yield (
+        "mean.Pace.mean(weights=distances)",
+        _batch(
+            lambda data: lambda: Pace.mean(data["paces"], weights=data["distances"])
+        ),
+    )
+    yield "mean.Speed.mean", _batch(lambda data: lambda: Speed.mean(data["speeds"]))
+
+
+def array_cases() -> Iterator[tuple[str, CaseFactory]]:
+    try:
+        from py42195.arrays import DistanceArray, DurationArray
+    except ImportError:
+        return
+
+    @cache
+    def arrays() -> tuple[DistanceArray, DurationArray]:
+        data = race_data()
+        return DistanceArray(km=[d.km for d in data["distances"]]), DurationArray(
+            data["seconds"]
+        )
+
+    def array_case(
+        make: Callable[[DistanceArray, DurationArray], Callable[[], Any]],
+    ) -> CaseFactory:
+        return lambda: (make(*arrays()), BATCH_SIZE)
+
+    yield (
+        "array.durations(strings)",
+        _batch(lambda data: lambda: py42195.durations(data["duration_strings"])),
+    )
+    yield (
+        "array.paces(strings)",
+        _batch(lambda data: lambda: py42195.paces(data["pace_strings"])),
+    )
+    yield (
+        "array.from_scalars",
+        _batch(lambda data: lambda: DurationArray.from_scalars(data["durations"])),
+    )
+    yield (
+        "array.Duration/Distance",
+        array_case(lambda distances, durations: lambda: durations / distances),
+    )
+    yield (
+        "array.Distance+Distance",
+        array_case(lambda distances, durations: lambda: distances + distances),
+    )
+    yield (
+        "array.to_strings",
+        array_case(lambda distances, durations: durations.to_strings),
+    )
+
+    from py42195.splits import goal_range, split_grid
+
+    @cache
+    def goals() -> Any:
+        return goal_range(Duration(2 * 3600), Duration(6.5 * 3600), Duration(30))
+
+    def splits_case(make: Callable[[Any], Callable[[], Any]]) -> CaseFactory:
+        return lambda: (make(goals()), len(goals()) * 43)
+
+    yield (
+        "splits.split_plan",
+        splits_case(
+            lambda gs: lambda: [list(split_plan(g, Distance.MARATHON)) for g in gs]
+        ),
+    )
+    yield (
+        "splits.split_grid",
+        splits_case(lambda gs: lambda: split_grid(gs, Distance.MARATHON)),
+    )
+
+    from py42195.lazy import lazy
+
+    @cache
+    def big_arrays() -> tuple[DistanceArray, DurationArray]:
+        data = race_data()
+        repeat = BIG_SIZE // len(data["seconds"])
+        return (
+            DistanceArray(km=[d.km for d in data["distances"]] * repeat),
+            DurationArray(data["seconds"] * repeat),
+        )
+
+    goal_pace = Pace(seconds_per_km=247)
+
+    def eager() -> Case:
+        distances, rests = big_arrays()
+        return (lambda: (goal_pace * distances + rests) / Distance.MARATHON), BIG_SIZE
+
+    def lazy_case() -> Case:
+        distances, rests = big_arrays()
+        expression = (lazy(goal_pace) * distances + rests) / Distance.MARATHON
+        return expression.evaluate, BIG_SIZE
+
+    yield "array.expression.eager", eager
+    yield "array.expression.lazy", lazy_case
+
+
+def collect_cases() -> dict[str, CaseFactory]:
+    """All cases by name, their inputs not built yet."""
+    cases: dict[str, CaseFactory] = {}
+    for group in (
+        construction_cases(),
+        operator_cases(),
+        parsing_cases(),
+        formatting_cases(),
+        aggregation_cases(),
+        array_cases(),
+    ):
+        cases.update(group)
+    return cases
+
+
+def measure(func: Callable[[], Any], items: int, repeat: int) -> float:
+    """Best time per item in ns."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number / items * 1e9
+
+
+def _version() -> Optional[str]:
+    try:
+        return metadata.version("py42195")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def run(pattern: Optional[str] = None, repeat: int = 5) -> dict[str, Any]:
+    results = {}
+    for name, factory in collect_cases().items():
+        if pattern and pattern not in name:
+            continue
+        func, items = factory()
+        ns = measure(func, items, repeat)
+        results[name] = {"ns_per_item": ns, "items_per_s": 1e9 / ns}
+        print(f"{name:<40} {ns:12.1f} ns {1e9 / ns:14,.0f} /s", flush=True)
+    return {
+        "version": _version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], max_regression: float
+) -> bool:
+    """Print the relative changes, return False if any case regressed too much."""
+    ok = True
+    print(f"\n{'case':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        old = baseline["results"][name]["ns_per_item"]
+        new = result["ns_per_item"]
+        change = new / old - 1
+        flag = ""
+        if change > max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{name:<40} {old:12.1f} {new:12.1f} {change:+8.1%}{flag}")
+    return ok
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="pattern", help="Run only cases containing this")
+    parser.add_argument("-o", "--output", type=Path, help="Store results as JSON")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--compare", type=Path, help="Baseline results (JSON)")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="Allowed relative slowdown against the baseline (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    current = run(args.pattern, args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(current, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if not compare(current, baseline, args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
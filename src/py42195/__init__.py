@@ -1,13 +1,25 @@
-from py42195.config import IMPERIAL, METRIC, get_unit_system, set_unit_system
+import os
+
+from py42195.config import (
+    IMPERIAL,
+    INSTRUMENT_ENV_VARIABLE,
+    METRIC,
+    get_unit_system,
+    set_unit_system,
+)
 from py42195.types import (
     Distance,
     Duration,
     Pace,
     distance,
+    distances,
     duration,
+    durations,
     pace,
+    paces,
     Speed,
     speed,
+    speeds,
 )
 
 __all__ = [
@@ -19,8 +31,17 @@ __all__ = [
     "duration",
     "pace",
     "speed",
+    "distances",
+    "durations",
+    "paces",
+    "speeds",
     "set_unit_system",
     "get_unit_system",
     "METRIC",
     "IMPERIAL",
 ]
+
+if os.environ.get(INSTRUMENT_ENV_VARIABLE):
+    from py42195 import instrumentation
+
+    instrumentation.enable()
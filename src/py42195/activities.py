@@ -0,0 +1,260 @@
+"""Streaming readers of activity files (GPX, TCX, CSV).
+
+The files are read incrementally (XML using iterparse, with every processed
+element discarded), so that the memory usage does not depend on the length
+of the track. The readers yield cumulative distance and elapsed time samples:
+
+>>> from py42195.activities import read_activity
+>>> for sample in read_activity("morning_run.gpx"):
+...     print(sample.distance, sample.elapsed)
+
+or chunks of arrays (requires numpy) using `read_chunks`.
+"""
+
+import csv
+import math
+import xml.etree.ElementTree as ET
+from array import array
+from datetime import datetime
+from os import PathLike, fspath
+from typing import IO, TYPE_CHECKING, Iterable, Iterator, NamedTuple, Optional
+
+from py42195.constants import EARTH_RADIUS_IN_KM
+from py42195.types import Distance, Duration
+from py42195.utils import parse_interval_seconds
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from py42195.arrays import DistanceArray, DurationArray
+
+Source = str | PathLike | IO
+
+# (cumulative km, elapsed seconds, elevation in m or NaN)
+RawSample = tuple[float, float, float]
+
+
+class Sample(NamedTuple):
+    """One point of a track."""
+
+    distance: Distance
+    elapsed: Duration
+    elevation: Optional[float] = None
+    """Elevation in metres (if available)."""
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance (in km) between two points given in degrees."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_IN_KM * math.asin(math.sqrt(a))
+
+
+def read_activity(
+    source: Source, /, *, format: Optional[str] = None
+) -> Iterator[Sample]:
+    """Read samples from an activity file.
+
+    :param format: "gpx", "tcx" or "csv", guessed from the file name if not given
+    """
+    for km, seconds, elevation in _read_raw(source, format):
+        yield Sample(
+            Distance._from_km(km),
+            Duration._from_seconds(seconds),
+            None if math.isnan(elevation) else elevation,
+        )
+
+
+def read_gpx(source: Source, /) -> Iterator[Sample]:
+    """Read samples from a GPX file."""
+    return read_activity(source, format="gpx")
+
+
+def read_tcx(source: Source, /) -> Iterator[Sample]:
+    """Read samples from a TCX file."""
+    return read_activity(source, format="tcx")
+
+
+def read_csv(source: Source, /) -> Iterator[Sample]:
+    """Read samples from a CSV file with a header.
+
+    Recognized columns:
+    - "time" (required): seconds, "[h:]mm:ss" intervals or ISO timestamps
+    - "distance": cumulative distance ("10.2" meaning km, "400 m", ...)
+    - "lat" and "lon": coordinates in degrees (used if there is no distance)
+    - "elevation" or "ele": elevation in metres
+    """
+    return read_activity(source, format="csv")
+
+
+def read_chunks(
+    source: Source, /, *, format: Optional[str] = None, size: int = 65536
+) -> Iterator[tuple["DistanceArray", "DurationArray", "np.ndarray"]]:
+    """Read an activity file in chunks of arrays (requires numpy).
+
+    :param size: Maximum number of samples in a chunk
+    :return: Cumulative distances, elapsed times and elevations (in metres, NaN if missing)
+    """
+    import numpy as np
+
+    from py42195.arrays import DistanceArray, DurationArray
+
+    def _chunk() -> tuple[DistanceArray, DurationArray, np.ndarray]:
+        km, seconds, elevation = (
+            np.frombuffer(buffer, dtype=np.float64) for buffer in buffers
+        )
+        return (
+            DistanceArray._from_values(km),
+            DurationArray._from_values(seconds),
+            elevation,
+        )
+
+    buffers = (array("d"), array("d"), array("d"))
+    for sample in _read_raw(source, format):
+        for buffer, value in zip(buffers, sample):
+            buffer.append(value)
+        if len(buffers[0]) >= size:
+            yield _chunk()
+            buffers = (array("d"), array("d"), array("d"))
+    if buffers[0]:
+        yield _chunk()
+
+
+def _read_raw(source: Source, format: Optional[str]) -> Iterator[RawSample]:
+    if format is None:
+        if isinstance(source, (str, PathLike)):
+            name = fspath(source)
+        else:
+            name = getattr(source, "name", "")
+        format = str(name).rsplit(".", 1)[-1].lower()
+    if format == "gpx":
+        return _iter_points(
+            source, point_tag="trkpt", time_tag="time", elevation_tag="ele"
+        )
+    if format == "tcx":
+        return _iter_points(
+            source,
+            point_tag="Trackpoint",
+            time_tag="Time",
+            elevation_tag="AltitudeMeters",
+            distance_tag="DistanceMeters",
+        )
+    if format == "csv":
+        return _iter_csv(source)
+    raise ValueError(f"Unknown activity format: {format}")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _iter_points(
+    source: Source,
+    *,
+    point_tag: str,
+    time_tag: str,
+    elevation_tag: str,
+    distance_tag: Optional[str] = None,
+) -> Iterator[RawSample]:
+    """Stream track points from GPX / TCX (namespaces are ignored)."""
+    start_time: Optional[datetime] = None
+    km = 0.0
+    last_position: Optional[tuple[float, float]] = None
+    # Open elements, so that processed ones can be detached from their parents
+    stack: list[ET.Element] = []
+    in_point = False
+    point: dict[str, str] = {}
+
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        tag = _local_name(element.tag)
+        if event == "start":
+            stack.append(element)
+            in_point = in_point or tag == point_tag
+            continue
+        stack.pop()
+
+        if tag == point_tag:
+            in_point = False
+            # GPX has coordinates as attributes, TCX as nested elements
+            lat = element.get("lat") or point.get("LatitudeDegrees")
+            lon = element.get("lon") or point.get("LongitudeDegrees")
+            if time_tag not in point:
+                raise ValueError("Track point without time")
+            time = datetime.fromisoformat(point[time_tag])
+            if start_time is None:
+                start_time = time
+
+            if distance_tag and point.get(distance_tag):
+                km = float(point[distance_tag]) / 1000
+            elif lat is not None and lon is not None:
+                position = (float(lat), float(lon))
+                if last_position is not None:
+                    km += haversine(*last_position, *position)
+                last_position = position
+
+            elevation = point.get(elevation_tag)
+            yield (
+                km,
+                (time - start_time).total_seconds(),
+                float(elevation) if elevation else math.nan,
+            )
+            point = {}
+        elif in_point:
+            point[tag] = (element.text or "").strip()
+            # Cleared together with the point
+            continue
+
+        element.clear()
+        if stack:
+            stack[-1].remove(element)
+
+
+def _parse_time(value: str) -> float | datetime:
+    """Number of seconds, interval ("1:02:03") or ISO timestamp."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parse_interval_seconds(value)
+    except ValueError:
+        return datetime.fromisoformat(value)
+
+
+def _iter_csv(source: Source) -> Iterator[RawSample]:
+    """Stream samples from a CSV file (see `read_csv`)."""
+    if isinstance(source, (str, PathLike)):
+        with open(source, newline="") as f:
+            yield from _iter_csv_rows(csv.DictReader(f))
+    else:
+        yield from _iter_csv_rows(csv.DictReader(source))
+
+
+def _iter_csv_rows(rows: Iterable[dict[str, str]]) -> Iterator[RawSample]:
+    start: Optional[float | datetime] = None
+    km = 0.0
+    last_position: Optional[tuple[float, float]] = None
+    for row in rows:
+        time = _parse_time(row["time"])
+        if start is None:
+            start = time
+        elapsed = (
+            (time - start).total_seconds()  # type: ignore[operator]
+            if isinstance(time, datetime)
+            else time - start  # type: ignore[operator]
+        )
+        if row.get("distance"):
+            km = Distance._parse_km(row["distance"])
+        elif row.get("lat") and row.get("lon"):
+            position = (float(row["lat"]), float(row["lon"]))
+            if last_position is not None:
+                km += haversine(*last_position, *position)
+            last_position = position
+        elevation = row.get("elevation") or row.get("ele")
+        yield km, elapsed, float(elevation) if elevation else math.nan
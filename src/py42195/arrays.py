@@ -0,0 +1,377 @@
+"""Array counterparts of the scalar quantities.
+
+Each array stores a single float64 buffer in the canonical unit
+of its scalar type (km, seconds, seconds per km, km/h) and supports
+the same arithmetics as the scalars, including broadcasting of scalars.
+"""
+
+from datetime import timedelta
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, Self
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Array types require numpy, install it with `pip install py42195[numpy]`."
+    ) from exc
+
+from py42195.config import get_unit_system
+from py42195.constants import KM_FACTORS, MILES_IN_KM
+from py42195.types import Distance, Duration, Pace, Speed
+
+Quantity = type[Distance] | type[Duration] | type[Pace] | type[Speed]
+
+# Dimensional rules for multiplication and division in canonical units.
+# Keys are (left type, right type), `None` standing for a plain number,
+# values are (result type, operation on the canonical values).
+MUL_RULES: dict[tuple[Optional[Quantity], Optional[Quantity]], tuple] = {
+    (Distance, Pace): (Duration, lambda a, b: a * b),
+    (Pace, Distance): (Duration, lambda a, b: a * b),
+    (Duration, Speed): (Distance, lambda a, b: a * b / 3600),
+    (Speed, Duration): (Distance, lambda a, b: a * b / 3600),
+}
+TRUEDIV_RULES: dict[tuple[Optional[Quantity], Optional[Quantity]], tuple] = {
+    (Distance, Duration): (Speed, lambda a, b: a / b * 3600),
+    (Distance, Speed): (Duration, lambda a, b: a / b * 3600),
+    (Duration, Distance): (Pace, lambda a, b: a / b),
+    (Duration, Pace): (Distance, lambda a, b: a / b),
+}
+for _quantity in (Distance, Duration, Pace, Speed):
+    MUL_RULES[_quantity, None] = (_quantity, lambda a, b: a * b)
+    MUL_RULES[None, _quantity] = (_quantity, lambda a, b: a * b)
+    TRUEDIV_RULES[_quantity, None] = (_quantity, lambda a, b: a / b)
+    TRUEDIV_RULES[_quantity, _quantity] = (None, lambda a, b: a / b)
+
+
+def canonical_value(obj: Any) -> tuple[Optional[Quantity], Any]:
+    """Split an operand into its quantity type and value(s) in canonical units.
+
+    :raises TypeError: if the operand is not supported
+    """
+    if isinstance(obj, QuantityArray):
+        return obj.quantity, obj._values
+    if isinstance(obj, Distance):
+        return Distance, obj.km
+    if isinstance(obj, Duration):
+        return Duration, obj.seconds
+    if isinstance(obj, Pace):
+        return Pace, obj.seconds_per_km
+    if isinstance(obj, Speed):
+        return Speed, obj.km_h
+    if isinstance(obj, timedelta):
+        return Duration, obj.total_seconds()
+    if isinstance(obj, (int, float, np.ndarray, np.number)):
+        return None, obj
+    raise TypeError(f"Unsupported operand: {type(obj)}")
+
+
+class QuantityArray:
+    """Base class for all quantity arrays."""
+
+    __slots__ = ("_values",)
+
+    quantity: ClassVar[Quantity]
+    unit: ClassVar[str]
+    _values: np.ndarray
+
+    # Constructor of scalars from canonical values, without validation
+    _scalar_factory: ClassVar[Callable[[float], Any]]
+
+    @classmethod
+    def _from_values(cls, values: Any) -> Self:
+        """Wrap values in canonical units without any validation."""
+        obj = object.__new__(cls)
+        obj._values = np.asarray(values, dtype=np.float64)
+        return obj
+
+    @classmethod
+    def from_scalars(cls, scalars: Iterable[Any]) -> Self:
+        """Collect the scalar quantities into an array."""
+        attr = cls.unit
+        return cls._from_values(
+            np.fromiter((getattr(scalar, attr) for scalar in scalars), np.float64)
+        )
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._values.shape
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator:
+        """Scalars of a 1-D array, sub-arrays (rows) of an N-D one, as `self[i]`."""
+        if self._values.ndim == 1:
+            for value in self._values.tolist():
+                yield self._scalar_factory(value)
+        else:
+            for row in self._values:
+                yield self._from_values(row)
+
+    def __getitem__(self, key: Any) -> Any:
+        result = self._values[key]
+        if np.ndim(result) == 0:
+            return self._scalar(result)
+        return self._from_values(result)
+
+    def _scalar(self, value: Any) -> Any:
+        return self._scalar_factory(float(value))
+
+    def __repr__(self) -> str:
+        values = np.array2string(self._values, separator=", ")
+        return f"{type(self).__name__}({self.unit}={values})"
+
+    def to_strings(self, **kwargs) -> list[str]:
+        """Format all values the same way as `str()` of the scalars.
+
+        See `format_many` of the scalar type for the options.
+        """
+        return self.quantity.format_many(self._values.ravel(), **kwargs)
+
+    def _binary(self, other: Any, rules: dict, reflected: bool = False) -> Any:
+        try:
+            other_type, other_values = canonical_value(other)
+        except TypeError:
+            return NotImplemented
+        if reflected:
+            key = (other_type, self.quantity)
+            operands = (other_values, self._values)
+        else:
+            key = (self.quantity, other_type)
+            operands = (self._values, other_values)
+        if key not in rules:
+            return NotImplemented
+        result_type, op = rules[key]
+        result = op(*operands)
+        if result_type is None:
+            return result
+        return ARRAY_TYPES[result_type]._from_values(result)
+
+    def _same_type(
+        self, other: Any, op: Callable[[Any, Any], Any], wrap: bool = True
+    ) -> Any:
+        try:
+            other_type, other_values = canonical_value(other)
+        except TypeError:
+            return NotImplemented
+        if other_type is not self.quantity:
+            return NotImplemented
+        result = op(self._values, other_values)
+        return self._from_values(result) if wrap else result
+
+    def __add__(self, other: Any) -> Any:
+        return self._same_type(other, np.add)
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, int) and other == 0:
+            # Support sum
+            return self
+        return self._same_type(other, lambda a, b: b + a)
+
+    def __sub__(self, other: Any) -> Any:
+        return self._same_type(other, np.subtract)
+
+    def __rsub__(self, other: Any) -> Any:
+        return self._same_type(other, lambda a, b: b - a)
+
+    def __neg__(self) -> Self:
+        return self._from_values(-self._values)
+
+    def __mul__(self, other: Any) -> Any:
+        return self._binary(other, MUL_RULES)
+
+    def __rmul__(self, other: Any) -> Any:
+        return self._binary(other, MUL_RULES, reflected=True)
+
+    def __truediv__(self, other: Any) -> Any:
+        return self._binary(other, TRUEDIV_RULES)
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return self._binary(other, TRUEDIV_RULES, reflected=True)
+
+    def __eq__(self, other: object) -> Any:  # type: ignore[override]
+        return self._same_type(other, np.equal, wrap=False)
+
+    def __ne__(self, other: object) -> Any:  # type: ignore[override]
+        return self._same_type(other, np.not_equal, wrap=False)
+
+    def __lt__(self, other: Any) -> Any:
+        return self._same_type(other, np.less, wrap=False)
+
+    def __le__(self, other: Any) -> Any:
+        return self._same_type(other, np.less_equal, wrap=False)
+
+    def __gt__(self, other: Any) -> Any:
+        return self._same_type(other, np.greater, wrap=False)
+
+    def __ge__(self, other: Any) -> Any:
+        return self._same_type(other, np.greater_equal, wrap=False)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    # Make numpy defer to our reflected operators
+    __array_ufunc__ = None
+
+
+class DistanceArray(QuantityArray):
+    __slots__ = ()
+
+    quantity = Distance
+    unit = "km"
+    _scalar_factory = Distance._from_km
+
+    def __init__(
+        self,
+        *,
+        km: Optional[Any] = None,
+        m: Optional[Any] = None,
+        mi: Optional[Any] = None,
+        yd: Optional[Any] = None,
+        ft: Optional[Any] = None,
+    ):
+        args_given = {
+            unit: val
+            for unit, val in (("km", km), ("m", m), ("mi", mi), ("yd", yd), ("ft", ft))
+            if val is not None
+        }
+        if len(args_given) != 1:
+            raise ValueError(
+                f"Exactly one of the following arguments should be provided: {', '.join(Distance.ALLOWED_UNITS)}, "
+                f"got {len(args_given)}: {', '.join(args_given)}"
+            )
+        ((unit, values),) = args_given.items()
+        values = np.asarray(values, dtype=np.float64)
+        if unit != "km":
+            values = values * KM_FACTORS[unit]
+        self._values = values
+
+    @property
+    def km(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def mi(self) -> np.ndarray:
+        return self._values / MILES_IN_KM
+
+    def __repr__(self) -> str:
+        if get_unit_system() == "imperial":
+            return f"DistanceArray(mi={np.array2string(self.mi, separator=', ')})"
+        return super().__repr__()
+
+
+class DurationArray(QuantityArray):
+    __slots__ = ()
+
+    quantity = Duration
+    unit = "seconds"
+    _scalar_factory = Duration._from_seconds
+
+    def __init__(self, seconds: Any, /):
+        values = np.asarray(seconds)
+        if np.issubdtype(values.dtype, np.timedelta64):
+            values = values / np.timedelta64(1, "s")
+        self._values = np.asarray(values, dtype=np.float64)
+
+    @property
+    def seconds(self) -> np.ndarray:
+        return self._values
+
+
+class PaceArray(QuantityArray):
+    __slots__ = ()
+
+    quantity = Pace
+    unit = "seconds_per_km"
+    _scalar_factory = Pace._from_seconds_per_km
+
+    def __init__(
+        self,
+        *,
+        seconds_per_km: Optional[Any] = None,
+        seconds_per_mile: Optional[Any] = None,
+    ):
+        if (seconds_per_mile is not None) and (seconds_per_km is not None):
+            raise ValueError(
+                "Either seconds_per_mile or seconds_per_km should be provided"
+            )
+        elif seconds_per_km is not None:
+            self._values = np.asarray(seconds_per_km, dtype=np.float64)
+        elif seconds_per_mile is not None:
+            self._values = np.asarray(seconds_per_mile, dtype=np.float64) / MILES_IN_KM
+        else:
+            raise ValueError(
+                "Either seconds_per_mile or seconds_per_km should be provided"
+            )
+
+    @property
+    def seconds_per_km(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def seconds_per_mile(self) -> np.ndarray:
+        return self._values * MILES_IN_KM
+
+    def __repr__(self) -> str:
+        if get_unit_system() == "imperial":
+            values = np.array2string(self.seconds_per_mile, separator=", ")
+            return f"PaceArray(seconds_per_mile={values})"
+        return super().__repr__()
+
+    def to_speed(self) -> "SpeedArray":
+        return SpeedArray._from_values(3600 / self._values)
+
+
+class SpeedArray(QuantityArray):
+    __slots__ = ()
+
+    quantity = Speed
+    unit = "km_h"
+    _scalar_factory = Speed._from_km_h
+
+    def __init__(
+        self,
+        *,
+        km_h: Optional[Any] = None,
+        mph: Optional[Any] = None,
+        m_s: Optional[Any] = None,
+    ):
+        args_given = {
+            unit: val
+            for unit, val in (("km_h", km_h), ("mph", mph), ("m_s", m_s))
+            if val is not None
+        }
+        if len(args_given) != 1:
+            raise ValueError(
+                "Exactly one of the following arguments should be provided: km_h, mph, m_s, "
+                f"got {len(args_given)}: {', '.join(args_given)}"
+            )
+        ((unit, values),) = args_given.items()
+        values = np.asarray(values, dtype=np.float64)
+        if unit == "mph":
+            values = values * MILES_IN_KM
+        elif unit == "m_s":
+            values = values * 3600 / 1000
+        self._values = values
+
+    @property
+    def km_h(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def mph(self) -> np.ndarray:
+        return self._values / MILES_IN_KM
+
+    @property
+    def m_s(self) -> np.ndarray:
+        return self._values * 1000 / 3600
+
+    def to_pace(self) -> PaceArray:
+        return PaceArray._from_values(3600 / self._values)
+
+
+ARRAY_TYPES: dict[Quantity, type[QuantityArray]] = {
+    Distance: DistanceArray,
+    Duration: DurationArray,
+    Pace: PaceArray,
+    Speed: SpeedArray,
+}
@@ -0,0 +1,170 @@
+"""Arrow extension types and columnar I/O for the quantities.
+
+Each quantity is stored as a float64 column in its canonical unit
+(km, seconds, seconds per km, km/h) wrapped in an extension type
+called "py42195.<quantity>", e.g. "py42195.pace". The serialized
+metadata of the type records the unit as JSON, e.g. `{"unit": "seconds_per_km"}`,
+so that the columns stay readable even without this library.
+
+Conversion between the arrays of `py42195.arrays` and Arrow does not copy
+the data (as long as there are no nulls and the column has a single chunk).
+Files in the Arrow IPC (Feather v2) format are memory-mapped on read.
+"""
+
+import json
+from os import PathLike
+from typing import Any, ClassVar, Mapping
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Arrow support requires pyarrow, install it with `pip install py42195[arrow]`."
+    ) from exc
+
+from py42195.arrays import ARRAY_TYPES, Quantity, QuantityArray
+from py42195.types import Distance, Duration, Pace, Speed
+
+
+class QuantityScalar(pa.ExtensionScalar):
+    def as_py(self, **kwargs) -> Any:
+        if self.value is None:
+            return None
+        return ARRAY_TYPES[self.type.quantity]._scalar_factory(self.value.as_py())
+
+
+class QuantityType(pa.ExtensionType):
+    """Base class of the Arrow extension types."""
+
+    quantity: ClassVar[Quantity]
+
+    def __init__(self) -> None:
+        super().__init__(pa.float64(), f"py42195.{self.quantity.__name__.lower()}")
+
+    @property
+    def unit(self) -> str:
+        """Name of the canonical unit."""
+        return ARRAY_TYPES[self.quantity].unit
+
+    def __arrow_ext_serialize__(self) -> bytes:
+        return json.dumps({"unit": self.unit}).encode()
+
+    @classmethod
+    def __arrow_ext_deserialize__(
+        cls, storage_type: pa.DataType, serialized: bytes
+    ) -> "QuantityType":
+        instance = cls()
+        unit = json.loads(serialized.decode())["unit"]
+        if unit != instance.unit:
+            raise ValueError(f"Unexpected unit of {instance}: {unit}")
+        return instance
+
+    def __arrow_ext_scalar_class__(self) -> type:
+        return QuantityScalar
+
+    def to_pandas_dtype(self) -> Any:
+        from py42195.pandas import EXTENSION_ARRAY_TYPES
+
+        return EXTENSION_ARRAY_TYPES[self.quantity]._dtype
+
+
+class DistanceType(QuantityType):
+    quantity = Distance
+
+
+class DurationType(QuantityType):
+    quantity = Duration
+
+
+class PaceType(QuantityType):
+    quantity = Pace
+
+
+class SpeedType(QuantityType):
+    quantity = Speed
+
+
+ARROW_TYPES: dict[Quantity, type[QuantityType]] = {
+    Distance: DistanceType,
+    Duration: DurationType,
+    Pace: PaceType,
+    Speed: SpeedType,
+}
+
+for _arrow_type in ARROW_TYPES.values():
+    try:
+        pa.register_extension_type(_arrow_type())
+    except pa.ArrowKeyError:
+        # Already registered (e.g. on module reload)
+        pass
+
+
+def to_arrow(values: QuantityArray, /) -> pa.ExtensionArray:
+    """Wrap a quantity array as an Arrow array (without copying)."""
+    storage = pa.array(values._values.ravel(), type=pa.float64())
+    return pa.ExtensionArray.from_storage(ARROW_TYPES[values.quantity](), storage)
+
+
+def from_arrow(array: pa.Array | pa.ChunkedArray, /) -> QuantityArray:
+    """Convert an Arrow array of a quantity type into a quantity array.
+
+    The data are not copied unless there are nulls (converted to NaN)
+    or more chunks.
+    """
+    if not isinstance(array.type, QuantityType):
+        raise TypeError(f"Expected a py42195 extension type, got {array.type}")
+    quantity = array.type.quantity
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    storage = array.storage
+    values = storage.to_numpy(zero_copy_only=storage.null_count == 0)
+    return ARRAY_TYPES[quantity]._from_values(values)
+
+
+def to_table(columns: Mapping[str, Any], /) -> pa.Table:
+    """Create an Arrow table, quantity arrays becoming extension columns."""
+    return pa.table(
+        {
+            name: to_arrow(column) if isinstance(column, QuantityArray) else column
+            for name, column in columns.items()
+        }
+    )
+
+
+def from_table(table: pa.Table, /) -> dict[str, Any]:
+    """Split an Arrow table into columns, quantity columns becoming quantity arrays."""
+    return {
+        name: from_arrow(column) if isinstance(column.type, QuantityType) else column
+        for name, column in zip(table.column_names, table.columns)
+    }
+
+
+def write_parquet(
+    columns: Mapping[str, Any] | pa.Table, path: str | PathLike, /, **kwargs
+) -> None:
+    """Write columns (quantity arrays or anything Arrow accepts) into a Parquet file."""
+    table = columns if isinstance(columns, pa.Table) else to_table(columns)
+    pq.write_table(table, path, **kwargs)
+
+
+def read_parquet(path: str | PathLike, /, **kwargs) -> dict[str, Any]:
+    """Read a Parquet file into columns."""
+    return from_table(pq.read_table(path, memory_map=True, **kwargs))
+
+
+def write_feather(
+    columns: Mapping[str, Any] | pa.Table, path: str | PathLike, /, **kwargs
+) -> None:
+    """Write columns into an Arrow IPC (Feather v2) file.
+
+    The file is uncompressed by default so that it can be memory-mapped on read.
+    """
+    table = columns if isinstance(columns, pa.Table) else to_table(columns)
+    feather.write_feather(table, path, **({"compression": "uncompressed"} | kwargs))
+
+
+def read_feather(path: str | PathLike, /, **kwargs) -> dict[str, Any]:
+    """Memory-map an Arrow IPC (Feather v2) file, without copying quantity columns."""
+    return from_table(feather.read_table(path, memory_map=True, **kwargs))
@@ -0,0 +1,65 @@
+"""Opt-in LRU cache of parsed values.
+
+Real inputs are repetitive (target paces, pace bands, standard distances...),
+so caching `Distance.parse`, `Duration.parse`, `Pace.parse` and `Speed.parse`
+(and the `distance()`, `duration()`, `pace()` and `speed()` factories built on them)
+avoids running the same regular expressions over and over:
+
+>>> from py42195.cache import enable_parse_cache, parse_cache_info
+>>> enable_parse_cache(maxsize=4096)
+>>> ...
+>>> parse_cache_info()
+CacheInfo(hits=..., misses=..., maxsize=4096, currsize=...)
+
+The default unit (depending on the unit system) is part of the cache key,
+so switching the unit system never returns stale values. Cached values are
+shared, which is safe as the quantities are immutable.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Optional
+
+cached_parse: Optional[Callable[[Any, str, Optional[str]], Any]] = None
+"""Cached parsing function (quantity, source, default unit) -> value, None if disabled."""
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _parse(quantity: Any, source: str, default_unit: Optional[str]) -> Any:
+    return quantity._parse(source, default_unit)
+
+
+def enable_parse_cache(maxsize: int = 4096) -> None:
+    """Start caching parsed values (any previous cache is dropped).
+
+    :param maxsize: Maximum number of cached values, the least recently used
+        ones are evicted first.
+    """
+    global cached_parse
+    if maxsize <= 0:
+        raise ValueError(f"Cache size must be positive, got {maxsize}")
+    cached_parse = lru_cache(maxsize=maxsize)(_parse)
+
+
+def disable_parse_cache() -> None:
+    """Stop caching parsed values and drop the cache."""
+    global cached_parse
+    cached_parse = None
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached values and statistics (the cache stays enabled)."""
+    if cached_parse is not None:
+        cached_parse.cache_clear()  # type: ignore[attr-defined]
+
+
+def parse_cache_info() -> Optional[CacheInfo]:
+    """Hit/miss statistics of the cache, None if disabled."""
+    if cached_parse is None:
+        return None
+    return CacheInfo(*cached_parse.cache_info())  # type: ignore[attr-defined]
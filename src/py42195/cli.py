@@ -0,0 +1,269 @@
+"""Command-line conversion of running quantities.
+
+Values are read from the standard input (one per line, or a column of a CSV),
+converted in chunks and streamed to the standard output:
+
+    $ printf "4:07\\n5:00/mi\\n" | py42195 pace "* 42.195 km"
+    2:53:42.2
+    2:11:05.6
+
+    $ echo "12 km/h" | py42195 --unit-system imperial speed to-pace
+    8:02.8/mi
+
+Steps are applied in order: arithmetic ("* 10 mi", "/ 2", "+ 0:30",
+operands using the same grammar as `distance()`, `duration()`, `pace()`
+and `speed()`) or conversions ("to-pace", "to-speed").
+"""
+
+import argparse
+import csv
+import re
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, TextIO
+
+from py42195.config import IMPERIAL, METRIC, get_unit_system, set_unit_system
+from py42195.parallel import imap_ordered
+from py42195.types import Distance, Duration, Pace, Speed
+
+QUANTITIES: dict[str, Any] = {
+    "distance": Distance,
+    "duration": Duration,
+    "pace": Pace,
+    "speed": Speed,
+}
+
+CONVERSIONS: dict[str, Callable[[Any], Any]] = {
+    "to-pace": lambda value: value.to_pace(),
+    "to-speed": lambda value: value.to_speed(),
+}
+
+OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "*": lambda a, b: a * b,
+    "/": lambda a, b: a / b,
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+}
+
+STEP_PATTERN = re.compile(r"^\s*(?P<op>[*/+-])\s*(?P<operand>.+?)\s*$")
+
+
+def parse_operand(s: str) -> Any:
+    """Number, distance, speed, pace (with "/km" or "/mi") or duration."""
+    try:
+        return float(s)
+    except ValueError:
+        pass
+    quantities = (Pace,) if "/" in s and ":" in s else (Distance, Speed, Duration)
+    for quantity in quantities:
+        try:
+            return quantity.parse(s)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid operand: {s}")
+
+
+def parse_step(s: str) -> Callable[[Any], Any]:
+    """Make a function applying one step (arithmetic or conversion)."""
+    if s in CONVERSIONS:
+        return CONVERSIONS[s]
+    match = STEP_PATTERN.match(s)
+    if not match:
+        raise ValueError(
+            f"Invalid step: {s} (use e.g. '* 10 km', '/ 2' or one of {', '.join(CONVERSIONS)})"
+        )
+    op = OPERATORS[match["op"]]
+    operand = parse_operand(match["operand"])
+    return lambda value: op(value, operand)
+
+
+def format_value(value: Any, unit_system: str) -> str:
+    if isinstance(value, float):
+        return repr(value)
+    return value._format(unit_system)
+
+
+def convert(
+    values: Sequence[str],
+    quantity: str,
+    steps: Sequence[str],
+    *,
+    unit_system: Optional[str] = None,
+    errors: str = "raise",
+) -> list[str]:
+    """Convert a chunk of input values into output strings.
+
+    This is a plain function of picklable arguments, so that chunks
+    can be processed in other processes.
+
+    :param errors: "raise" or "empty" (output an empty string for invalid values)
+    :raises ValueError: for an invalid value (with its index in the chunk)
+    """
+    # Resolved once for the whole chunk, not for every value
+    unit_system = unit_system or get_unit_system()
+    with set_unit_system(unit_system):
+        parse = QUANTITIES[quantity]._parser(unit_system)
+        functions = [parse_step(step) for step in steps]
+        results = []
+        for i, source in enumerate(values):
+            source = source.strip()
+            if not source:
+                results.append("")
+                continue
+            try:
+                value = parse(source)
+            except ValueError as exc:
+                if errors == "raise":
+                    raise ValueError(f"{i}: {exc}") from None
+                results.append("")
+                continue
+            for function in functions:
+                value = function(value)
+            results.append(format_value(value, unit_system))
+        return results
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="py42195",
+        description="Convert running quantities read from stdin (one per line or a CSV column).",
+        epilog='Example: printf "4:07\\n5:00\\n" | py42195 pace "* 42.195 km"',
+    )
+    parser.add_argument("quantity", choices=QUANTITIES, help="Type of the input values")
+    parser.add_argument(
+        "steps",
+        nargs="*",
+        metavar="step",
+        help=f"Arithmetic step ('* 10 km', '/ 2', '+ 0:30') or one of {', '.join(CONVERSIONS)}",
+    )
+    parser.add_argument(
+        "-u", "--unit-system", choices=[METRIC, IMPERIAL], help="Default units"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of parallel processes"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=10_000, help="Values processed at once"
+    )
+    parser.add_argument(
+        "--errors",
+        choices=["raise", "empty"],
+        default="raise",
+        help="What to do with invalid values",
+    )
+    parser.add_argument(
+        "--csv", action="store_true", help="Input is a CSV file with a header"
+    )
+    parser.add_argument("--column", help="CSV column to convert (default: the first)")
+    parser.add_argument(
+        "--output-column", default="result", help="Name of the added CSV column"
+    )
+    return parser
+
+
+class _ChunkConverter:
+    """Picklable converter of chunks with the options of the command."""
+
+    def __init__(self, args: argparse.Namespace, unit_system: str):
+        self.quantity = args.quantity
+        self.steps = args.steps
+        self.errors = args.errors
+        self.unit_system = unit_system
+
+    def __call__(self, chunk: list[str]) -> list[str]:
+        return convert(
+            chunk,
+            self.quantity,
+            self.steps,
+            unit_system=self.unit_system,
+            errors=self.errors,
+        )
+
+
+def run(
+    args: argparse.Namespace,
+    stdin: TextIO,
+    stdout: TextIO,
+    executor: Optional[Executor],
+) -> None:
+    unit_system = args.unit_system or get_unit_system()
+    converter = _ChunkConverter(args, unit_system)
+    # Fail early on invalid steps
+    for step in args.steps:
+        parse_step(step)
+
+    if not args.csv:
+        lines = (line.rstrip("\n") for line in stdin)
+        for _, results in _zip_chunks(lines, converter, args, executor):
+            stdout.writelines(result + "\n" for result in results)
+        return
+
+    reader = csv.reader(stdin)
+    writer = csv.writer(stdout, lineterminator="\n")
+    header = next(reader, None)
+    if header is None:
+        return
+    column = header.index(args.column) if args.column else 0
+    writer.writerow(header + [args.output_column])
+    for rows, results in _zip_chunks(reader, converter, args, executor, column):
+        writer.writerows(row + [result] for row, result in zip(rows, results))
+
+
+def _zip_chunks(
+    items: Iterable[Any],
+    converter: _ChunkConverter,
+    args: argparse.Namespace,
+    executor: Optional[Executor],
+    column: Optional[int] = None,
+) -> Iterator[tuple[list, list[str]]]:
+    """Chunks of input items with their converted values."""
+    # Keep chunks of the input to zip them with the results
+    chunks: deque[list] = deque()
+
+    def values() -> Iterator[list[str]]:
+        for chunk in _chunks(items, args.chunk_size):
+            chunks.append(chunk)
+            yield chunk if column is None else [row[column] for row in chunk]
+
+    offset = 0
+    try:
+        for results in imap_ordered(
+            converter, values(), executor, prefetch=2 * args.jobs
+        ):
+            chunk = chunks.popleft()
+            yield chunk, results
+            offset += len(chunk)
+    except ValueError as exc:
+        index, _, message = str(exc).partition(": ")
+        if index.isdigit():
+            raise ValueError(f"value {offset + int(index) + 1}: {message}") from None
+        raise
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = _make_parser().parse_args(argv)
+    try:
+        if args.jobs > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                run(args, sys.stdin, sys.stdout, executor)
+        else:
+            run(args, sys.stdin, sys.stdout, None)
+    except (ValueError, TypeError) as exc:
+        print(f"py42195: error: {exc}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # E.g. piped into `head`
+        sys.stderr.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
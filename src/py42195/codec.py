@@ -0,0 +1,186 @@
+"""Compact binary encoding of the quantities.
+
+A single value is encoded as a type tag (1 byte) followed by a little-endian
+float64 in canonical units (km, seconds, seconds per km, km/h), 9 bytes in total:
+
+>>> from py42195.codec import decode, encode
+>>> encode(pace("4:00"))
+b'\\x03\\x00\\x00\\x00\\x00\\x00\\x00n@'
+>>> decode(_)
+Pace(seconds_per_km=240.0)
+
+Sequences of values of the same type are encoded in bulk as an 8-byte header
+(magic, tag and count) followed by the float64 values, which are decoded
+without copying (as a `memoryview` over the buffer):
+
+>>> from py42195.codec import from_bytes, to_bytes
+>>> view = from_bytes(to_bytes([duration("1:00"), duration("1:30")]))
+>>> view.values.tolist()
+[60.0, 90.0]
+>>> view[1]
+duration('1:30.0')
+
+Round-trips are exact.
+"""
+
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence, overload
+
+from py42195.types import Distance, Duration, Pace, Speed
+
+if TYPE_CHECKING:
+    from py42195.arrays import QuantityArray
+
+TAGS: dict[type, int] = {
+    Distance: 1,
+    Duration: 2,
+    Pace: 3,
+    Speed: 4,
+}
+QUANTITIES: dict[int, type] = {tag: quantity for quantity, tag in TAGS.items()}
+
+MAGIC = b"Q4"
+
+SCALAR = struct.Struct("<Bd")
+"""Type tag and value."""
+
+HEADER = struct.Struct("<2sBxI")
+"""Magic, type tag, padding and number of values (8 bytes, keeping values aligned)."""
+
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _tag(quantity: type) -> int:
+    for cls in quantity.__mro__:
+        if cls in TAGS:
+            return TAGS[cls]
+    raise TypeError(f"Cannot encode {quantity}")
+
+
+def _quantity(tag: int) -> type:
+    try:
+        return QUANTITIES[tag]
+    except KeyError:
+        raise ValueError(f"Unknown type tag: {tag}") from None
+
+
+def encode(value: Any, /) -> bytes:
+    """Encode a single value into 9 bytes."""
+    return SCALAR.pack(_tag(type(value)), value.__getstate__())
+
+
+def decode(data: bytes | memoryview, /) -> Any:
+    """Decode a single value."""
+    tag, value = SCALAR.unpack(data)
+    quantity = _quantity(tag)
+    return quantity._from_canonical(value)
+
+
+def to_bytes(
+    values: "Iterable[Any] | QuantityArray", /, *, quantity: Optional[type] = None
+) -> bytes:
+    """Encode many values of the same type (or a quantity array).
+
+    :param quantity: Type of the values, required if there are none
+    """
+    if hasattr(values, "_values"):
+        # Quantity array
+        quantity = values.quantity  # type: ignore[union-attr]
+        buffer = array("d", values._values.ravel())  # type: ignore[union-attr]
+    else:
+        iterator = iter(values)
+        if quantity is None:
+            first = next(iterator, None)
+            if first is None:
+                raise TypeError("Cannot encode empty values without their quantity")
+            quantity = type(first)
+            buffer = array("d", [first.__getstate__()])
+        else:
+            buffer = array("d")
+        buffer.extend(_canonical_values(iterator, quantity))
+    if not _NATIVE_LITTLE_ENDIAN:
+        buffer.byteswap()
+    return HEADER.pack(MAGIC, _tag(quantity), len(buffer)) + buffer.tobytes()
+
+
+def _canonical_values(values: Iterable[Any], quantity: type) -> Iterator[float]:
+    for value in values:
+        if not isinstance(value, quantity):
+            raise TypeError(f"Expected {quantity.__name__}, got {type(value)}")
+        yield value.__getstate__()
+
+
+class QuantityView(Sequence):
+    """Decoded values, materialised as scalars only on access."""
+
+    __slots__ = ("quantity", "values")
+
+    quantity: type
+    values: memoryview
+    """Values in canonical units (a view of the encoded buffer if possible)."""
+
+    def __init__(self, quantity: type, values: memoryview):
+        self.quantity = quantity
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "QuantityView": ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return QuantityView(self.quantity, self.values[index])
+        return self.quantity._from_canonical(self.values[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        from_canonical = self.quantity._from_canonical
+        for value in self.values:
+            yield from_canonical(value)
+
+    def __repr__(self) -> str:
+        return f"QuantityView({self.quantity.__name__}, {len(self)} values)"
+
+    def to_array(self) -> "QuantityArray":
+        """Quantity array sharing the buffer (requires numpy)."""
+        import numpy as np
+
+        from py42195.arrays import ARRAY_TYPES
+
+        return ARRAY_TYPES[self.quantity]._from_values(
+            np.frombuffer(self.values, dtype=np.float64)
+        )
+
+
+def from_bytes(data: bytes | bytearray | memoryview, /) -> QuantityView:
+    """Decode values encoded by `to_bytes`.
+
+    The values are not copied (except on big-endian machines),
+    the returned view keeps the buffer alive.
+    """
+    buffer = memoryview(data).cast("B")
+    if len(buffer) < HEADER.size:
+        raise ValueError("Data too short")
+    magic, tag, count = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not encoded quantities")
+    quantity = _quantity(tag)
+    payload = buffer[HEADER.size :]
+    if len(payload) != 8 * count:
+        raise ValueError(f"Expected {count} values, got {len(payload)} bytes")
+    return QuantityView(quantity, float64_view(payload))
+
+
+def float64_view(buffer: memoryview, /) -> memoryview:
+    """View little-endian float64 bytes as floats (copied only on big-endian machines)."""
+    if _NATIVE_LITTLE_ENDIAN:
+        return buffer.cast("B").cast("d")
+    copy = array("d", buffer.tobytes())
+    copy.byteswap()
+    return memoryview(copy)
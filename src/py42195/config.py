@@ -1,13 +1,21 @@
 import os
+from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import ContextManager, Optional
+from typing import ContextManager, Iterator, Optional
 
 METRIC = "metric"
 IMPERIAL = "imperial"
 
+ENV_VARIABLE = "PY42195_UNIT_SYSTEM"
+INSTRUMENT_ENV_VARIABLE = "PY42195_INSTRUMENT"
+"""Enables `py42195.instrumentation` on import if set (to a non-empty value)."""
+
 
 _unit_system: ContextVar[Optional[str]] = ContextVar("unit_system", default=None)
 
+# Resolved once, see `reload_unit_system`
+_env_unit_system: str = os.environ.get(ENV_VARIABLE, METRIC)
+
 _default_units = {
     METRIC: {
         "Distance": "km",
@@ -23,10 +31,23 @@ _default_units = {
     },
 }
 
+# Filled on first use for each (quantity class, unit system)
+_default_units_by_type: dict[tuple[type, str], str] = {}
+
 
 def get_unit_system() -> str:
-    unit_system = _unit_system.get()
-    return unit_system or os.environ.get("PY42195_UNIT_SYSTEM", METRIC)  # type: ignore
+    return _unit_system.get() or _env_unit_system
+
+
+def reload_unit_system() -> str:
+    """Read the default unit system from the environment again.
+
+    The PY42195_UNIT_SYSTEM variable is read only once on import,
+    call this after changing it.
+    """
+    global _env_unit_system
+    _env_unit_system = os.environ.get(ENV_VARIABLE, METRIC)
+    return _env_unit_system
 
 
 def set_unit_system(system: str) -> ContextManager:
@@ -44,6 +65,33 @@ def set_unit_system(system: str) -> ContextManager:
     return _UnitSystem()
 
 
-def get_default_unit(quantity: type) -> str:
-    """Name of the argument that will be used as default unit for the given quantity."""
-    return _default_units[get_unit_system()][quantity.__name__]
+@contextmanager
+def pinned_unit_system() -> Iterator[str]:
+    """Resolve the unit system once and keep it for the whole block.
+
+    Useful for batch operations: all values inside the block are
+    processed with the same unit system, even if the environment default
+    is reloaded in the meantime. Bulk functions (`format_many`, `parse_many`,
+    the command line...) look the system up once per call, `str()` of single
+    values still once per value.
+    """
+    system = get_unit_system()
+    token = _unit_system.set(system)
+    try:
+        yield system
+    finally:
+        _unit_system.reset(token)
+
+
+def get_default_unit(quantity: type, system: Optional[str] = None) -> str:
+    """Name of the argument that will be used as default unit for the given quantity.
+
+    :param system: Unit system, by default the current one
+    """
+    system = system or get_unit_system()
+    try:
+        return _default_units_by_type[quantity, system]
+    except KeyError:
+        unit = _default_units[system][quantity.__name__]
+        _default_units_by_type[quantity, system] = unit
+        return unit
@@ -5,3 +5,35 @@ MILES_IN_KM = 1.609344
 M_IN_KM = 0.001
 YARDS_IN_KM = 0.0009144
 FEET_IN_KM = 0.0003048
+
+# Mean radius of the Earth
+EARTH_RADIUS_IN_KM = 6371.0088
+
+# Conversion factors of distance units into km
+KM_FACTORS = {
+    "km": 1.0,
+    "m": M_IN_KM,
+    "mi": MILES_IN_KM,
+    "yd": YARDS_IN_KM,
+    "ft": FEET_IN_KM,
+}
+
+# Distances of common races (in km), shared as interned instances
+STANDARD_DISTANCES_IN_KM = (
+    0.4,
+    1.0,
+    MILES_IN_KM,
+    3.0,
+    5.0,
+    10.0,
+    15.0,
+    10 * MILES_IN_KM,
+    HALF_MARATHON_IN_KM,
+    30.0,
+    MARATHON_IN_KM,
+    50.0,
+    100.0,
+)
+
+# Largest whole-second pace (per km or per mile) that gets interned
+MAX_INTERNED_PACE_SECONDS = 3600
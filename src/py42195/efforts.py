@@ -0,0 +1,165 @@
+"""Best efforts: the fastest segments of an activity over given distances.
+
+For every target distance, a window of exactly that length slides along
+the cumulative track. As the elapsed time is piecewise linear in the distance,
+the fastest window starts or ends at a sample; both cases are scanned with
+two pointers moving only forwards, interpolating the other end of the window,
+so each target costs O(n) (instead of O(n²) for all pairs of samples):
+
+>>> from py42195.activities import read_activity
+>>> from py42195.efforts import best_efforts
+>>> samples = list(read_activity("long_run.gpx"))
+>>> best_efforts([s.distance for s in samples], [s.elapsed for s in samples])
+{Distance(km=1.0): BestEffort(distance=Distance(km=1.0), duration=duration('3:58.1'), ...),
+ ...}
+
+Targets longer than the activity are left out.
+"""
+
+from concurrent.futures import Executor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Optional, Sequence
+
+from py42195.parallel import imap_ordered
+from py42195.types import Distance, Duration, Pace
+
+if TYPE_CHECKING:
+    from py42195.arrays import DurationArray
+
+TARGETS: tuple[Distance, ...] = (
+    Distance(km=1),
+    Distance(km=5),
+    Distance(km=10),
+    Distance.HALF_MARATHON,
+    Distance.MARATHON,
+)
+"""Default target distances."""
+
+
+class BestEffort(NamedTuple):
+    """The fastest segment of an activity over a distance."""
+
+    distance: Distance
+    duration: Duration
+    start: Distance
+    """Distance from the start of the activity to the start of the segment."""
+
+    @property
+    def pace(self) -> Pace:
+        return Pace._from_seconds_per_km(self.duration.seconds / self.distance.km)
+
+
+def _canonical(values: Any, attr: str) -> list[float]:
+    """Values of quantity arrays or scalars in canonical units, as a list."""
+    if hasattr(values, "_values"):
+        return values._values.ravel().tolist()
+    return [getattr(value, attr) for value in values]
+
+
+def _best_window(
+    km: Sequence[float], seconds: Sequence[float], length: float
+) -> Optional[tuple[float, float]]:
+    """Shortest time to cover the length and the start of that window.
+
+    :return: (seconds, start km), None if the track is shorter
+    """
+    if length <= 0:
+        raise ValueError(f"Target distance must be positive, got {length} km")
+    n = len(km)
+    if n < 2 or km[-1] - km[0] < length:
+        return None
+    best = (float("inf"), 0.0)
+
+    # Windows starting at a sample, the end interpolated: km[j - 1] < end <= km[j]
+    j = 1
+    for i in range(n):
+        end = km[i] + length
+        while j < n and km[j] < end:
+            j += 1
+        if j == n:
+            break
+        k0, t0 = km[j - 1], seconds[j - 1]
+        t = t0 + (end - k0) / (km[j] - k0) * (seconds[j] - t0)
+        if t - seconds[i] < best[0]:
+            best = (t - seconds[i], km[i])
+
+    # Windows ending at a sample, the start interpolated: km[i] <= start < km[i + 1]
+    # (the last sample at the start, so that stops are not counted)
+    i = 0
+    for j in range(n):
+        start = km[j] - length
+        if start < km[0]:
+            continue
+        while km[i + 1] <= start:
+            i += 1
+        k0, t0 = km[i], seconds[i]
+        t = t0 + (start - k0) / (km[i + 1] - k0) * (seconds[i + 1] - t0)
+        if seconds[j] - t < best[0]:
+            best = (seconds[j] - t, start)
+    return best
+
+
+def best_efforts(
+    distances: Iterable[Distance] | Any,
+    elapsed: Iterable[Duration] | Any,
+    /,
+    targets: Iterable[Distance] = TARGETS,
+) -> dict[Distance, BestEffort]:
+    """Fastest segments of an activity over the target distances.
+
+    :param distances: Cumulative distances (scalars or a DistanceArray)
+    :param elapsed: Elapsed times of the same samples (scalars or a DurationArray)
+    :return: Best efforts by target (only those not longer than the activity)
+    """
+    km = _canonical(distances, "km")
+    seconds = _canonical(elapsed, "seconds")
+    if len(km) != len(seconds):
+        raise ValueError(
+            f"Different number of distances and times: {len(km)} != {len(seconds)}"
+        )
+    results = {}
+    for target in targets:
+        window = _best_window(km, seconds, target.km)
+        if window is not None:
+            results[target] = BestEffort(
+                target,
+                Duration._from_seconds(window[0]),
+                Distance._from_km(window[1]),
+            )
+    return results
+
+
+def _best_seconds(
+    targets_km: Sequence[float], activity: tuple[Sequence[float], Sequence[float]]
+) -> list[float]:
+    km, seconds = activity
+    windows = (_best_window(km, seconds, length) for length in targets_km)
+    return [float("nan") if window is None else window[0] for window in windows]
+
+
+def best_efforts_many(
+    activities: Iterable[tuple[Any, Any]],
+    /,
+    targets: Iterable[Distance] = TARGETS,
+    *,
+    executor: Optional[Executor] = None,
+) -> "DurationArray":
+    """Best efforts of many activities at once (requires numpy).
+
+    :param activities: Pairs of cumulative distances and elapsed times
+    :param executor: Executor (e.g. a process pool) to process the activities in
+    :return: Fastest times (activities × targets), NaN where an activity is shorter
+    """
+    import numpy as np
+
+    from py42195.arrays import DurationArray
+
+    targets_km = [target.km for target in targets]
+    pairs = (
+        (_canonical(distances, "km"), _canonical(elapsed, "seconds"))
+        for distances, elapsed in activities
+    )
+    rows = list(imap_ordered(partial(_best_seconds, targets_km), pairs, executor))
+    return DurationArray._from_values(
+        np.array(rows, dtype=np.float64).reshape(len(rows), len(targets_km))
+    )
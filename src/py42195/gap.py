@@ -0,0 +1,247 @@
+"""Grade-adjusted pace (GAP) of tracks with elevations.
+
+The grade-adjusted pace is the pace on flat ground requiring the same effort.
+It is the raw pace divided by the relative energy cost of running at the grade
+(1 on the flat, more uphill, less on gentle downhills), given by a cost model:
+
+>>> from py42195.activities import read_chunks
+>>> from py42195.gap import grade_adjusted_paces, grade_adjusted_splits
+>>> distances, elapsed, elevations = next(read_chunks("hill_repeats.gpx", size=10**6))
+>>> grade_adjusted_paces(distances, elapsed, elevations)      # every sample
+PaceArray(seconds_per_km=[...])
+>>> marks, paces = grade_adjusted_splits(distances, elapsed, elevations)
+
+Grades (and the raw paces of samples) are measured over a window centred
+at each sample, smoothing the noise of GPS elevations. All computations
+are vectorised (requires numpy).
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, ClassVar, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Grade-adjusted pace requires numpy, install it with `pip install py42195[numpy]`."
+    ) from exc
+
+from py42195.arrays import DistanceArray, DurationArray, PaceArray
+from py42195.splits import _marks
+from py42195.tracks import TrackIndex, _canonical_query, _interpolate
+from py42195.types import Distance, Duration, Pace
+
+WINDOW = Distance(m=100)
+"""Default smoothing window."""
+
+
+class CostModel(ABC):
+    """Base class of the models of the energy cost of running uphill and downhill."""
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def cost(self, grade: np.ndarray) -> np.ndarray:
+        """Cost relative to the flat (1.0) for grades (rise / run, e.g. 0.05 for 5 %)."""
+
+
+@dataclass(frozen=True)
+class Minetti(CostModel):
+    """Minetti et al. (2002) polynomial of the energy cost (J/kg/m).
+
+    C(i) = 155.4 i^5 - 30.4 i^4 - 43.3 i^3 + 46.3 i^2 + 19.5 i + 3.6,
+    measured for grades between -45 % and +45 % (steeper ones are clipped).
+    """
+
+    max_grade: float = 0.45
+
+    name: ClassVar[str] = "minetti"
+    COEFFICIENTS: ClassVar[tuple[float, ...]] = (155.4, -30.4, -43.3, 46.3, 19.5, 3.6)
+
+    def cost(self, grade: np.ndarray) -> np.ndarray:
+        grade = np.clip(grade, -self.max_grade, self.max_grade)
+        return np.polyval(self.COEFFICIENTS, grade) / self.COEFFICIENTS[-1]
+
+
+@dataclass(frozen=True)
+class Linear(CostModel):
+    """Constant cost per percent of grade, as in `py42195.splits.Course`.
+
+    Every percent costs `uphill` going up and saves `downhill` going down.
+    """
+
+    uphill: float = 0.033
+    downhill: float = 0.018
+    max_grade: float = 0.3
+
+    name: ClassVar[str] = "linear"
+
+    def cost(self, grade: np.ndarray) -> np.ndarray:
+        percent = 100 * np.clip(grade, -self.max_grade, self.max_grade)
+        return 1 + np.where(percent > 0, self.uphill, self.downhill) * percent
+
+
+MODELS: dict[str, CostModel] = {model.name: model for model in (Minetti(), Linear())}
+
+
+def _get_model(model: str | CostModel) -> CostModel:
+    if isinstance(model, CostModel):
+        return model
+    try:
+        return MODELS[model]
+    except KeyError:
+        raise ValueError(
+            f"Unknown model: {model}, use one of {', '.join(MODELS)}"
+        ) from None
+
+
+def _elevations(km: np.ndarray, elevations: Any) -> np.ndarray:
+    """Validated elevations (missing ones interpolated)."""
+    metres = np.array(elevations, dtype=np.float64).ravel()
+    if len(metres) != len(km):
+        raise ValueError(
+            f"Different number of samples and elevations: {len(km)} != {len(metres)}"
+        )
+    missing = np.isnan(metres)
+    if missing.all():
+        raise ValueError("No elevations")
+    if missing.any():
+        metres[missing] = np.interp(km[missing], km[~missing], metres[~missing])
+    return metres
+
+
+def _prepare(
+    distances: Any, elapsed: Any, elevations: Any
+) -> tuple[TrackIndex, np.ndarray]:
+    index = TrackIndex(distances, elapsed)
+    return index, _elevations(index._km, elevations)
+
+
+def _window(km: np.ndarray, window: Distance) -> tuple[np.ndarray, np.ndarray]:
+    """Ends of the windows centred at the samples (clipped to the track)."""
+    if window.km <= 0:
+        raise ValueError(f"Window must be positive, got {window}")
+    half = window.km / 2
+    return np.maximum(km - half, km[0]), np.minimum(km + half, km[-1])
+
+
+def _grades(
+    km: np.ndarray, metres: np.ndarray, lo: np.ndarray, hi: np.ndarray
+) -> np.ndarray:
+    rise = np.interp(hi, km, metres) - np.interp(lo, km, metres)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return rise / ((hi - lo) * 1000)
+
+
+def grades(
+    distances: DistanceArray | Iterable[Distance],
+    elevations: Any,
+    /,
+    *,
+    window: Distance = WINDOW,
+) -> np.ndarray:
+    """Smoothed grade (rise / run, NaN without any distance) at every sample.
+
+    :param distances: Cumulative distances (non-decreasing)
+    :param elevations: Elevations in metres (NaN where missing)
+    """
+    _, km = _canonical_query(distances, Distance)
+    km = km.ravel()
+    if (np.diff(km) < 0).any():
+        raise ValueError("Distances must be sorted (cumulative)")
+    metres = _elevations(km, elevations)
+    return _grades(km, metres, *_window(km, window))
+
+
+def grade_adjusted_paces(
+    distances: DistanceArray | Iterable[Distance],
+    elapsed: DurationArray | Iterable[Duration],
+    elevations: Any,
+    /,
+    *,
+    window: Distance = WINDOW,
+    model: str | CostModel = "minetti",
+) -> PaceArray:
+    """Grade-adjusted pace at every sample.
+
+    Both the raw pace and the grade are measured over the window centred
+    at the sample.
+
+    :param elevations: Elevations in metres (NaN where missing)
+    :param model: "minetti", "linear" or any `CostModel`
+    """
+    model = _get_model(model)
+    index, metres = _prepare(distances, elapsed, elevations)
+    lo, hi = _window(index._km, window)
+    seconds = _interpolate(np.stack([lo, hi]), index._km, index._seconds)
+    grade = _grades(index._km, metres, lo, hi)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        raw = (seconds[1] - seconds[0]) / (hi - lo)
+    return PaceArray._from_values(raw / model.cost(grade))
+
+
+def _adjusted_seconds(
+    index: TrackIndex, metres: np.ndarray, window: Distance, model: CostModel
+) -> np.ndarray:
+    """Cumulative flat-equivalent time at every sample."""
+    grade = _grades(index._km, metres, *_window(index._km, window))
+    # Cost of a segment between two samples: at its average grade
+    cost = model.cost((grade[1:] + grade[:-1]) / 2)
+    adjusted = np.empty(len(index))
+    adjusted[0] = 0.0
+    np.cumsum(np.diff(index._seconds) / cost, out=adjusted[1:])
+    return adjusted
+
+
+def grade_adjusted_splits(
+    distances: DistanceArray | Iterable[Distance],
+    elapsed: DurationArray | Iterable[Duration],
+    elevations: Any,
+    /,
+    *,
+    every: Optional[Distance] = None,
+    window: Distance = WINDOW,
+    model: str | CostModel = "minetti",
+) -> tuple[DistanceArray, PaceArray]:
+    """Grade-adjusted pace of every split.
+
+    :param every: Distance of the splits, by default 1 km or 1 mile
+        (according to the unit system)
+    :return: Ends of the splits (the last one at the end of the track) and their paces
+
+    See `grade_adjusted_paces` for the other parameters.
+    """
+    model = _get_model(model)
+    index, metres = _prepare(distances, elapsed, elevations)
+    adjusted = _adjusted_seconds(index, metres, window, model)
+    start = index._km[0]
+    marks = start + np.fromiter(_marks(float(index._km[-1] - start), every), np.float64)
+    bounds = np.concatenate([[start], marks])
+    seconds = _interpolate(bounds, index._km, adjusted)
+    return (
+        DistanceArray._from_values(marks),
+        PaceArray._from_values(np.diff(seconds) / np.diff(bounds)),
+    )
+
+
+def grade_adjusted_pace(
+    distances: DistanceArray | Iterable[Distance],
+    elapsed: DurationArray | Iterable[Duration],
+    elevations: Any,
+    /,
+    *,
+    window: Distance = WINDOW,
+    model: str | CostModel = "minetti",
+) -> Pace:
+    """Average grade-adjusted pace of the whole track.
+
+    See `grade_adjusted_paces` for the parameters.
+    """
+    model = _get_model(model)
+    index, metres = _prepare(distances, elapsed, elevations)
+    adjusted = _adjusted_seconds(index, metres, window, model)
+    km = index._km[-1] - index._km[0]
+    if not km:
+        raise ValueError("The track has no distance")
+    return Pace._from_seconds_per_km(float(adjusted[-1]) / km)
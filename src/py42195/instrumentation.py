@@ -0,0 +1,240 @@
+"""Opt-in counters and timings of the hot paths.
+
+When enabled, parsing, construction, formatting, operators and unit-system
+lookups are replaced by wrappers that count the calls, measure the time spent
+and record the patterns of inputs that failed to parse:
+
+>>> from py42195 import instrumentation
+>>> instrumentation.enable()
+>>> ... # process data
+>>> instrumentation.stats()["Pace.parse"]
+Stats(calls=120000, seconds=0.0912, failures=17)
+>>> instrumentation.parse_failures().most_common(1)
+[(('Pace.parse', '9:9 min/km'), 17)]
+
+When disabled (the default), the original functions and methods are in
+place, so the instrumentation costs nothing. It can also be enabled
+by setting the PY42195_INSTRUMENT environment variable (e.g. to "1")
+before importing py42195.
+
+Timings of nested operations are also included in the outer ones
+(e.g. `parse_interval_seconds` in `Duration.parse`).
+"""
+
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, NamedTuple
+
+from py42195 import config, utils
+from py42195.types import Distance, Duration, Pace, Speed
+
+logger = logging.getLogger(__name__)
+
+Hook = Callable[[str, float, bool], None]
+"""Called after every instrumented call with the operation, seconds and failure flag."""
+
+FUNCTIONS: list[tuple[Any, str]] = [
+    (utils, "parse_interval_seconds"),
+    (utils, "parse_interval"),
+    (utils, "format_interval"),
+    (config, "get_unit_system"),
+    (config, "get_default_unit"),
+]
+"""Instrumented module-level functions (module, name)."""
+
+METHODS: list[str] = [
+    "__init__",
+    "parse",
+    "__str__",
+    "__add__",
+    "__sub__",
+    "__mul__",
+    "__rmul__",
+    "__truediv__",
+    "__rtruediv__",
+]
+"""Instrumented methods of Distance, Duration, Pace and Speed (if defined)."""
+
+QUANTITIES = (Distance, Duration, Pace, Speed)
+
+MAX_PATTERN_LENGTH = 32
+
+
+class Stats(NamedTuple):
+    """Statistics of one operation."""
+
+    calls: int
+    seconds: float
+    failures: int
+
+
+class _Counters:
+    __slots__ = ("calls", "nanoseconds", "failures")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.nanoseconds = 0
+        self.failures = 0
+
+
+_counters: dict[str, _Counters] = {}
+_parse_failures: Counter[tuple[str, str]] = Counter()
+_hooks: list[Hook] = []
+
+# (owner, name, original, wrapper) of the applied patches
+_patches: list[tuple[Any, str, Any, Any]] = []
+
+
+def input_pattern(source: str, /) -> str:
+    """Shape of an input: digits collapsed to "9", truncated.
+
+    E.g. "4:07 min/km" -> "9:9 min/km", so that failures can be grouped.
+    """
+    return re.sub(r"\d+", "9", source.strip())[:MAX_PATTERN_LENGTH]
+
+
+def _record(operation: str, counters: _Counters, elapsed: int, failed: bool) -> None:
+    counters.calls += 1
+    counters.nanoseconds += elapsed
+    counters.failures += failed
+    for hook in _hooks:
+        # Hooks must never change the behaviour of the instrumented call
+        try:
+            hook(operation, elapsed / 1e9, failed)
+        except Exception:
+            logger.exception("Instrumentation hook %r failed", hook)
+
+
+def _wrap(operation: str, function: Callable) -> Callable:
+    counters = _counters.setdefault(operation, _Counters())
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as exc:
+            _record(operation, counters, perf_counter_ns() - start, True)
+            if isinstance(exc, ValueError):
+                source = next((arg for arg in args if isinstance(arg, str)), None)
+                if source is not None:
+                    _parse_failures[operation, input_pattern(source)] += 1
+            raise
+        _record(operation, counters, perf_counter_ns() - start, False)
+        return result
+
+    return wrapper
+
+
+def _patch(owner: Any, name: str, original: Any, wrapper: Any) -> None:
+    setattr(owner, name, wrapper)
+    _patches.append((owner, name, original, wrapper))
+
+
+def _package_modules() -> Iterator[Any]:
+    for name, module in list(sys.modules.items()):
+        if module is not None and (name == "py42195" or name.startswith("py42195.")):
+            yield module
+
+
+def _patch_function(module: Any, name: str) -> None:
+    original = getattr(module, name)
+    wrapper = _wrap(name, original)
+    # Also the names imported from the module (e.g. `from py42195.utils import ...`)
+    for other in _package_modules():
+        for attr, value in list(vars(other).items()):
+            if value is original:
+                _patch(other, attr, original, wrapper)
+
+
+def _patch_method(cls: type, name: str) -> None:
+    original = cls.__dict__.get(name)
+    if original is None:
+        return
+    operation = f"{cls.__name__}.{name}"
+    if isinstance(original, classmethod):
+        wrapper: Any = classmethod(_wrap(operation, original.__func__))
+    else:
+        wrapper = _wrap(operation, original)
+    _patch(cls, name, original, wrapper)
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+def enable() -> None:
+    """Replace the hot paths by their instrumented versions."""
+    if _patches:
+        return
+    for module, name in FUNCTIONS:
+        _patch_function(module, name)
+    for cls in QUANTITIES:
+        for name in METHODS:
+            _patch_method(cls, name)
+
+
+def disable() -> None:
+    """Restore the original functions and methods (the statistics are kept)."""
+    # Keyed by id, the values keep the wrappers alive
+    wrappers = {
+        id(wrapper): (wrapper, original) for _, _, original, wrapper in _patches
+    }
+    while _patches:
+        owner, name, original, _ = _patches.pop()
+        setattr(owner, name, original)
+    # Modules imported while enabled hold the wrappers too
+    for module in _package_modules():
+        for attr, value in list(vars(module).items()):
+            if id(value) in wrappers and wrappers[id(value)][0] is value:
+                setattr(module, attr, wrappers[id(value)][1])
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """Enable the instrumentation for a block (if not already enabled)."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def stats() -> dict[str, Stats]:
+    """Statistics of all operations called so far."""
+    return {
+        operation: Stats(c.calls, c.nanoseconds / 1e9, c.failures)
+        for operation, c in _counters.items()
+        if c.calls
+    }
+
+
+def parse_failures() -> Counter[tuple[str, str]]:
+    """Numbers of failures by (operation, input pattern)."""
+    return Counter(_parse_failures)
+
+
+def reset() -> None:
+    """Clear all statistics."""
+    for counters in _counters.values():
+        counters.calls = counters.nanoseconds = counters.failures = 0
+    _parse_failures.clear()
+
+
+def add_hook(hook: Hook, /) -> None:
+    """Call a function after every instrumented call (e.g. to export metrics).
+
+    Exceptions raised by the hook are logged, never propagated.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook, /) -> None:
+    _hooks.remove(hook)
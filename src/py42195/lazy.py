@@ -0,0 +1,216 @@
+"""Lazy evaluation of arithmetic with quantities and quantity arrays.
+
+Wrapping an operand with `lazy()` makes the operators build an expression
+instead of computing intermediate results. The dimensions are checked
+when the expression is built (using the same rules as the arrays):
+
+>>> from py42195.lazy import lazy
+>>> expr = (lazy(pace("4:07")) * distances + rest_durations) / total_distance
+>>> expr
+Expression(Pace, shape=(10000000,))
+>>> expr.evaluate()
+PaceArray(seconds_per_km=[...])
+
+Evaluation is a single pass over blocks of the inputs, so that the
+temporaries of the intermediate operations have the size of a block
+(and stay in the CPU cache) instead of the size of the inputs.
+Only the result is allocated in full, or not at all with `Expression.sum()`.
+
+Requires numpy.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Lazy expressions require numpy, install it with `pip install py42195[numpy]`."
+    ) from exc
+
+from py42195.arrays import (
+    ARRAY_TYPES,
+    MUL_RULES,
+    TRUEDIV_RULES,
+    Quantity,
+    canonical_value,
+)
+from py42195.types import Distance, Duration
+
+BLOCK_SIZE = 65536
+"""Default number of values evaluated at once."""
+
+Select = Callable[[Any], Any]
+
+_ADD_RULES: dict[tuple[Optional[Quantity], Optional[Quantity]], tuple] = {
+    (quantity, quantity): (quantity, np.add) for quantity in (*ARRAY_TYPES, None)
+}
+_SUB_RULES: dict[tuple[Optional[Quantity], Optional[Quantity]], tuple] = {
+    (quantity, quantity): (quantity, np.subtract) for quantity in (*ARRAY_TYPES, None)
+}
+# Plain numbers (e.g. ratios of quantities)
+_MUL_RULES = {**MUL_RULES, (None, None): (None, np.multiply)}
+_TRUEDIV_RULES = {**TRUEDIV_RULES, (None, None): (None, np.true_divide)}
+
+
+class Expression(ABC):
+    """Base class of lazy expressions (see `lazy`)."""
+
+    __slots__ = ("quantity", "shape")
+
+    quantity: Optional[Quantity]
+    """Type of the result (None for plain numbers)."""
+    shape: tuple[int, ...]
+    """Shape of the result (after broadcasting), () for a scalar."""
+
+    @abstractmethod
+    def _compute(self, select: Select) -> Any:
+        """Evaluate a block, `select` taking the block out of the leaf values."""
+
+    def __repr__(self) -> str:
+        name = self.quantity.__name__ if self.quantity else "float"
+        return f"Expression({name}, shape={self.shape})"
+
+    def _binary(self, other: Any, rules: dict, reflected: bool = False) -> Any:
+        try:
+            other = _as_expression(other)
+        except TypeError:
+            return NotImplemented
+        left, right = (other, self) if reflected else (self, other)
+        key = (left.quantity, right.quantity)
+        if key not in rules:
+            return NotImplemented
+        result_type, op = rules[key]
+        return _Operation(op, (left, right), result_type)
+
+    def __add__(self, other: Any) -> Any:
+        return self._binary(other, _ADD_RULES)
+
+    def __radd__(self, other: Any) -> Any:
+        return self._binary(other, _ADD_RULES, reflected=True)
+
+    def __sub__(self, other: Any) -> Any:
+        return self._binary(other, _SUB_RULES)
+
+    def __rsub__(self, other: Any) -> Any:
+        return self._binary(other, _SUB_RULES, reflected=True)
+
+    def __mul__(self, other: Any) -> Any:
+        return self._binary(other, _MUL_RULES)
+
+    def __rmul__(self, other: Any) -> Any:
+        return self._binary(other, _MUL_RULES, reflected=True)
+
+    def __truediv__(self, other: Any) -> Any:
+        return self._binary(other, _TRUEDIV_RULES)
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return self._binary(other, _TRUEDIV_RULES, reflected=True)
+
+    def __neg__(self) -> "Expression":
+        return _Operation(np.negative, (self,), self.quantity)
+
+    def _blocks(self, block_size: int) -> Iterator[tuple[slice, Any]]:
+        """Evaluated blocks of rows (along the first axis) of the result."""
+        ndim = len(self.shape)
+        rows = max(1, block_size // max(1, math.prod(self.shape[1:])))
+
+        def select(start: int, stop: int) -> Select:
+            def _select(values: Any) -> Any:
+                # Leaves with fewer dimensions or a single row are broadcast
+                if np.ndim(values) == ndim and np.shape(values)[0] != 1:
+                    return values[start:stop]
+                return values
+
+            return _select
+
+        for start in range(0, self.shape[0], rows):
+            stop = min(start + rows, self.shape[0])
+            yield slice(start, stop), self._compute(select(start, stop))
+
+    def evaluate(self, *, block_size: int = BLOCK_SIZE) -> Any:
+        """Compute the result: a scalar quantity, a quantity array or plain numbers.
+
+        :param block_size: Approximate number of values computed at once
+        """
+        if not self.shape:
+            return _wrap_scalar(self.quantity, self._compute(_identity))
+        result = np.empty(self.shape, dtype=np.float64)
+        for rows, block in self._blocks(block_size):
+            result[rows] = block
+        if self.quantity is None:
+            return result
+        return ARRAY_TYPES[self.quantity]._from_values(result)
+
+    def sum(self, *, block_size: int = BLOCK_SIZE) -> Any:
+        """Sum of all values, without allocating the full result.
+
+        Only for distances, durations and plain numbers.
+        """
+        if self.quantity not in (Distance, Duration, None):
+            raise TypeError(f"Cannot sum {self.quantity.__name__} values")
+        if not self.shape:
+            return self.evaluate()
+        partial_sums = []
+        for rows, block in self._blocks(block_size):
+            block = np.broadcast_to(block, (rows.stop - rows.start, *self.shape[1:]))
+            partial_sums.append(float(block.sum()))
+        total = math.fsum(partial_sums)
+        return _wrap_scalar(self.quantity, total)
+
+
+class _Leaf(Expression):
+    __slots__ = ("values",)
+
+    def __init__(self, quantity: Optional[Quantity], values: Any):
+        self.quantity = quantity
+        self.values = values
+        self.shape = np.shape(values)
+
+    def _compute(self, select: Select) -> Any:
+        return select(self.values)
+
+
+class _Operation(Expression):
+    __slots__ = ("function", "operands")
+
+    def __init__(
+        self,
+        function: Callable[..., Any],
+        operands: tuple[Expression, ...],
+        quantity: Optional[Quantity],
+    ):
+        self.function = function
+        self.operands = operands
+        self.quantity = quantity
+        self.shape = np.broadcast_shapes(*(operand.shape for operand in operands))
+
+    def _compute(self, select: Select) -> Any:
+        return self.function(*(operand._compute(select) for operand in self.operands))
+
+
+def _identity(values: Any) -> Any:
+    return values
+
+
+def _wrap_scalar(quantity: Optional[Quantity], value: Any) -> Any:
+    if quantity is None:
+        return float(value)
+    return quantity._from_canonical(float(value))
+
+
+def _as_expression(obj: Any) -> Expression:
+    if isinstance(obj, Expression):
+        return obj
+    quantity, values = canonical_value(obj)
+    return _Leaf(quantity, values)
+
+
+def lazy(obj: Any, /) -> Expression:
+    """Start a lazy expression with a quantity, a quantity array or a number.
+
+    :raises TypeError: if the operand is not supported
+    """
+    return _as_expression(obj)
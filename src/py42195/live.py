@@ -0,0 +1,338 @@
+"""Live timing: ingestion of chip-mat reads with incremental leaderboards.
+
+Reads are lines "bib,mat,elapsed" (e.g. "1234,21.0975 km,1:30:12.3"),
+the mat distance and the elapsed race time using the same grammar as
+`distance()` and `duration()`. They can come from a TCP stream, UDP
+datagrams or be fed directly:
+
+>>> timing = LiveTiming(Distance.MARATHON)
+>>> updates = timing.subscribe()
+>>> await timing.ingest_tcp("timing.local", 4000)
+>>> update = await updates.get()
+>>> update.projected
+duration('2:58:12.4')
+
+Each mat keeps a leaderboard ordered by elapsed time. Runners are kept in
+buckets by whole second of their time, with a Fenwick tree of the bucket
+sizes: adding a runner and finding their position are O(log n), whether
+the read arrives in time order or late (as with wave starts).
+
+Subscribers that fall behind never block the ingestion: when the queue
+of a subscriber is full, its oldest update is dropped for the newest one.
+Invalid lines of a feed are logged and skipped.
+
+For testing, `replay_server` serves recorded reads over TCP,
+optionally at their original pace (or faster).
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from py42195.types import Distance, Duration, Pace
+from py42195.utils import parse_interval_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class Read(NamedTuple):
+    """A chip read at a timing mat."""
+
+    bib: str
+    mat: Distance
+    elapsed: Duration
+
+
+class Update(NamedTuple):
+    """State of a runner after a read."""
+
+    bib: str
+    mat: Distance
+    elapsed: Duration
+    pace: Pace
+    """Pace since the previous mat (or the start)."""
+    projected: Duration
+    """Projected finish time (at the current pace)."""
+    rank: int
+    """Position at the mat (1-based, at the time of the read)."""
+
+
+def _split_read(line: str) -> tuple[str, str, float]:
+    try:
+        bib, mat, elapsed = (part.strip() for part in line.split(","))
+    except ValueError:
+        raise ValueError(f"Invalid read (expected 'bib,mat,elapsed'): {line}") from None
+    return bib, mat, parse_interval_seconds(elapsed)
+
+
+def parse_read(line: str, /) -> Read:
+    """Parse a "bib,mat,elapsed" line."""
+    bib, mat, seconds = _split_read(line)
+    return Read(bib, Distance.parse(mat), Duration._from_seconds(seconds))
+
+
+class Leaderboard:
+    """Runners ordered by their elapsed time at one mat."""
+
+    __slots__ = ("_buckets", "_counts", "_times")
+
+    #: Reads later than this (a week) are rejected as invalid
+    MAX_SECONDS = 7 * 24 * 3600.0
+
+    def __init__(self) -> None:
+        # Sorted (seconds, bib) in buckets by whole second (None when empty)
+        self._buckets: list[Optional[list[tuple[float, str]]]] = []
+        # Fenwick tree of the bucket sizes (1-based)
+        self._counts: list[int] = [0]
+        self._times: dict[str, float] = {}
+
+    def add(self, bib: str, seconds: float, /) -> int:
+        """Record a runner (only the first read counts), return their rank.
+
+        Both the insertion and the rank are O(log n), late reads included
+        (plus a bisect among the runners read within the same second).
+        """
+        if bib not in self._times:
+            if not 0 <= seconds <= self.MAX_SECONDS:
+                raise ValueError(f"Invalid elapsed time: {seconds}")
+            index = int(seconds)
+            if index >= len(self._buckets):
+                self._grow(index + 1)
+            bucket = self._buckets[index]
+            if bucket is None:
+                self._buckets[index] = [(seconds, bib)]
+            else:
+                insort(bucket, (seconds, bib))
+            self._times[bib] = seconds
+            i = index + 1
+            while i < len(self._counts):
+                self._counts[i] += 1
+                i += i & -i
+        return self.rank(bib)
+
+    def _grow(self, size: int) -> None:
+        """Extend the buckets (at least doubling) and rebuild the tree, O(size)."""
+        size = max(size, 2 * len(self._buckets))
+        self._buckets.extend([None] * (size - len(self._buckets)))
+        counts = [0] * (size + 1)
+        for i, bucket in enumerate(self._buckets, 1):
+            if bucket:
+                counts[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent <= size:
+                counts[parent] += counts[i]
+        self._counts = counts
+
+    def rank(self, bib: str, /) -> int:
+        """Position of a runner (1-based)."""
+        seconds = self._times[bib]
+        index = int(seconds)
+        # Runners in the previous buckets
+        rank, i = 1, index
+        while i > 0:
+            rank += self._counts[i]
+            i -= i & -i
+        return rank + bisect_left(self._buckets[index], (seconds, bib))  # type: ignore[arg-type]
+
+    def elapsed(self, bib: str, /) -> Duration:
+        return Duration._from_seconds(self._times[bib])
+
+    def top(self, n: int = 10, /) -> list[tuple[str, Duration]]:
+        """The first n runners with their times."""
+        return [
+            (bib, Duration._from_seconds(seconds))
+            for seconds, bib in islice(self._entries(), max(n, 0))
+        ]
+
+    def _entries(self) -> Iterator[tuple[float, str]]:
+        for bucket in self._buckets:
+            if bucket:
+                yield from bucket
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __contains__(self, bib: object) -> bool:
+        return bib in self._times
+
+    def __iter__(self) -> Iterator[str]:
+        return (bib for _, bib in self._entries())
+
+
+def _publish(queue: "asyncio.Queue[Update]", update: Update) -> None:
+    """Put an update into a queue, dropping the oldest one if it is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(update)
+
+
+class _Runner:
+    """Latest state of a runner (in canonical units)."""
+
+    __slots__ = ("km", "seconds", "seconds_per_km", "projected")
+
+    def __init__(self) -> None:
+        self.km = 0.0
+        self.seconds = 0.0
+        self.seconds_per_km = 0.0
+        self.projected = 0.0
+
+
+class LiveTiming:
+    """Per-runner state and per-mat leaderboards updated read by read."""
+
+    def __init__(self, distance: Distance = Distance.MARATHON, /):
+        """
+        :param distance: Race distance used for the projections
+        """
+        self.distance = distance
+        self.leaderboards: dict[Distance, Leaderboard] = {}
+        self._runners: dict[str, _Runner] = {}
+        # Mats repeat, parse them just once
+        self._mats: dict[str, Distance] = {}
+        self._subscribers: list[asyncio.Queue[Update]] = []
+
+    def subscribe(self, maxsize: int = 0) -> "asyncio.Queue[Update]":
+        """Queue receiving all updates from now on.
+
+        :param maxsize: Maximum number of waiting updates (0 for unlimited),
+            the oldest ones are dropped when the queue is full
+        """
+        queue: asyncio.Queue[Update] = asyncio.Queue(maxsize)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: "asyncio.Queue[Update]") -> None:
+        self._subscribers.remove(queue)
+
+    def process(self, read: str | Read, /) -> Update:
+        """Apply a read (a line or a parsed read) and publish the update."""
+        if isinstance(read, Read):
+            bib, mat, seconds = read.bib, read.mat, read.elapsed.seconds
+        else:
+            bib, mat_text, seconds = _split_read(read)
+            mat = self._mats.get(mat_text)
+            if mat is None:
+                mat = self._mats[mat_text] = Distance.parse(mat_text)
+        km = mat.km
+
+        leaderboard = self.leaderboards.get(mat)
+        if leaderboard is None:
+            leaderboard = self.leaderboards[mat] = Leaderboard()
+        rank = leaderboard.add(bib, seconds)
+
+        runner = self._runners.get(bib)
+        if runner is None:
+            runner = self._runners[bib] = _Runner()
+        # Late or repeated reads of earlier mats do not change the state
+        if km > runner.km:
+            runner.seconds_per_km = (seconds - runner.seconds) / (km - runner.km)
+            runner.km = km
+            runner.seconds = seconds
+            runner.projected = seconds + (self.distance.km - km) * runner.seconds_per_km
+
+        update = Update(
+            bib,
+            mat,
+            Duration._from_seconds(seconds),
+            Pace._from_seconds_per_km(runner.seconds_per_km),
+            Duration._from_seconds(runner.projected),
+            rank,
+        )
+        for queue in self._subscribers:
+            _publish(queue, update)
+        return update
+
+    def _process_line(self, line: str) -> bool:
+        """Process a line from a feed, log and skip it if it is invalid."""
+        try:
+            self.process(line)
+        except ValueError as exc:
+            logger.warning("Skipping invalid read: %s", exc)
+            return False
+        return True
+
+    def projected_finish(self, bib: str, /) -> Optional[Duration]:
+        """Latest projection of a runner, None if unknown."""
+        runner = self._runners.get(bib)
+        if runner is None or not runner.km:
+            return None
+        return Duration._from_seconds(runner.projected)
+
+    async def ingest(self, reader: asyncio.StreamReader, /) -> int:
+        """Process lines from a stream until it ends, return the number of valid reads.
+
+        Invalid lines are logged and skipped.
+        """
+        count = 0
+        while line := await reader.readline():
+            text = line.decode(errors="replace").strip()
+            if text and self._process_line(text):
+                count += 1
+        return count
+
+    async def ingest_tcp(self, host: str, port: int, /) -> int:
+        """Connect to a TCP feed and process it until it is closed."""
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            return await self.ingest(reader)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    def datagram_protocol(self) -> asyncio.DatagramProtocol:
+        """Protocol for UDP feeds (one or more lines per datagram).
+
+        >>> await loop.create_datagram_endpoint(timing.datagram_protocol, local_addr=(...))
+        """
+        return _ReadsProtocol(self)
+
+
+class _ReadsProtocol(asyncio.DatagramProtocol):
+    def __init__(self, timing: LiveTiming):
+        self.timing = timing
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        for line in data.decode(errors="replace").splitlines():
+            if line.strip():
+                self.timing._process_line(line)
+
+
+async def replay_server(
+    lines: Iterable[str],
+    /,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    speed: Optional[float] = None,
+) -> asyncio.Server:
+    """Serve recorded reads over TCP, to every client that connects.
+
+    :param speed: Replay speed relative to the elapsed times of the reads
+        (1.0 for real time, 60.0 for a minute per second), None for no delays
+    :param port: Port to listen on (0 to choose any free one, see `server.sockets`)
+    """
+    lines = [line.strip() for line in lines if line.strip()]
+
+    async def replay(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        last = None
+        try:
+            for line in lines:
+                if speed:
+                    try:
+                        seconds = _split_read(line)[2]
+                    except ValueError:
+                        # Replayed as is, without any delay
+                        seconds = last
+                    if last is not None and seconds > last:
+                        await writer.drain()
+                        await asyncio.sleep((seconds - last) / speed)
+                    last = seconds
+                writer.write(line.encode() + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(replay, host, port)
@@ -0,0 +1,468 @@
+"""Extension types for pandas.
+
+Importing this module registers the "distance", "duration", "pace"
+and "speed" dtypes. Their values are stored in contiguous float64 arrays
+in the canonical units, arithmetics and reductions are performed on these
+buffers without creating per-row Python objects.
+
+>>> import pandas as pd
+>>> import py42195.pandas
+>>> paces = pd.Series(["4:07", "4:15/km"], dtype="pace")
+>>> paces * py42195.Distance.HALF_MARATHON
+0    1:26:51.1
+1    1:29:39.9
+dtype: duration
+"""
+
+import operator
+from typing import Any, Callable, ClassVar, Sequence
+
+try:
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        register_series_accessor,
+        take,
+    )
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "pandas extension types require pandas, install it with `pip install py42195[pandas]`."
+    ) from exc
+
+from py42195.arrays import ARRAY_TYPES, Quantity, QuantityArray
+from py42195.types import Distance, Duration, Pace, Speed
+from py42195.utils import ErrorPolicy
+
+# Reductions that keep the type of the quantity
+_SAME_TYPE_REDUCTIONS = {
+    "sum": np.nansum,
+    "mean": np.nanmean,
+    "median": np.nanmedian,
+    "min": np.nanmin,
+    "max": np.nanmax,
+    "std": np.nanstd,
+}
+_SAME_TYPE_GROUPBY_OPS = {
+    "sum",
+    "mean",
+    "median",
+    "min",
+    "max",
+    "std",
+    "first",
+    "last",
+    "cumsum",
+    "cummin",
+    "cummax",
+    "rank",
+}
+# Groupby operations with a `min_count` parameter
+_MIN_COUNT_GROUPBY_OPS = {"sum", "min", "max", "first", "last"}
+
+
+class QuantityDtype(ExtensionDtype):
+    """Base class of the quantity dtypes."""
+
+    quantity: ClassVar[Quantity]
+    na_value = np.nan
+
+    @classmethod
+    def construct_array_type(cls) -> type["QuantityExtensionArray"]:
+        return EXTENSION_ARRAY_TYPES[cls.quantity]
+
+    def __from_arrow__(self, array: Any) -> "QuantityExtensionArray":
+        from py42195.arrow import from_arrow
+
+        return self.construct_array_type()._from_values(from_arrow(array)._values)
+
+
+@register_extension_dtype
+class DistanceDtype(QuantityDtype):
+    name = "distance"
+    quantity = Distance
+    type = Distance
+
+
+@register_extension_dtype
+class DurationDtype(QuantityDtype):
+    name = "duration"
+    quantity = Duration
+    type = Duration
+
+
+@register_extension_dtype
+class PaceDtype(QuantityDtype):
+    name = "pace"
+    quantity = Pace
+    type = Pace
+
+
+@register_extension_dtype
+class SpeedDtype(QuantityDtype):
+    name = "speed"
+    quantity = Speed
+    type = Speed
+
+
+class QuantityExtensionArray(ExtensionArray):
+    """Base class of the pandas arrays, wrapping float64 buffers in canonical units."""
+
+    _dtype: ClassVar[QuantityDtype]
+    _data: np.ndarray
+
+    def __init__(self, values: Any, copy: bool = False):
+        if isinstance(values, QuantityArray):
+            if values.quantity is not self._dtype.quantity:
+                raise TypeError(
+                    f"Cannot create {type(self).__name__} from {type(values).__name__}"
+                )
+            values = values._values
+        self._data = np.array(values, dtype=np.float64, copy=copy or None)
+
+    @classmethod
+    def _from_values(cls, values: np.ndarray) -> "QuantityExtensionArray":
+        obj = cls.__new__(cls)
+        obj._data = values
+        return obj
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Any, *, dtype: Any = None, copy: bool = False
+    ) -> "QuantityExtensionArray":
+        return cls._from_values(cls._to_values(scalars, copy=copy))
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls, strings: Any, *, dtype: Any = None, copy: bool = False
+    ) -> "QuantityExtensionArray":
+        return cls.parse(strings)
+
+    @classmethod
+    def parse(
+        cls, strings: Sequence[str], *, errors: ErrorPolicy = "raise"
+    ) -> "QuantityExtensionArray":
+        """Parse strings (with missing values as NaN)."""
+        strings = [
+            np.nan if (not isinstance(s, str) and pd.isna(s)) else s for s in strings
+        ]
+        mask = [not isinstance(s, str) for s in strings]
+        values = cls._dtype.quantity.parse_values(
+            ["0" if missing else s for s, missing in zip(strings, mask)],
+            errors=errors,
+        )
+        data = np.frombuffer(values, dtype=np.float64).copy()
+        data[mask] = np.nan
+        return cls._from_values(data)
+
+    @classmethod
+    def _from_factorized(
+        cls, values: np.ndarray, original: "QuantityExtensionArray"
+    ) -> "QuantityExtensionArray":
+        return cls._from_values(np.asarray(values, dtype=np.float64))
+
+    @classmethod
+    def _to_values(cls, scalars: Any, copy: bool = False) -> np.ndarray:
+        """Convert anything array-like into canonical float values."""
+        quantity = cls._dtype.quantity
+        if isinstance(scalars, QuantityExtensionArray):
+            scalars = scalars._to_quantity_array()
+        if isinstance(scalars, QuantityArray):
+            if scalars.quantity is not quantity:
+                raise TypeError(
+                    f"Cannot convert {scalars.quantity.__name__} to {quantity.__name__}"
+                )
+            return np.array(scalars._values, dtype=np.float64, copy=copy or None)
+        if isinstance(scalars, quantity):
+            scalars = [scalars]
+        elif isinstance(scalars, np.ndarray) and scalars.dtype.kind == "f":
+            return np.array(scalars, dtype=np.float64, copy=copy or None)
+        items = list(scalars)
+        if any(isinstance(item, str) for item in items):
+            return cls.parse(items)._data
+        unit = ARRAY_TYPES[quantity].unit
+        return np.fromiter(
+            (
+                getattr(item, unit) if isinstance(item, quantity) else np.nan
+                for item in items
+            ),
+            dtype=np.float64,
+            count=len(items),
+        )
+
+    def _to_quantity_array(self) -> QuantityArray:
+        return ARRAY_TYPES[self._dtype.quantity]._from_values(self._data)
+
+    def to_quantity_array(self) -> QuantityArray:
+        """View of the data as a quantity array (without copying)."""
+        return self._to_quantity_array()
+
+    @property
+    def dtype(self) -> QuantityDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, tuple) and len(item) == 1:
+            item = item[0]
+        if pd.api.types.is_list_like(item):
+            item = pd.api.indexers.check_array_indexer(self, item)
+        result = self._data[item]
+        if np.ndim(result) == 0:
+            if np.isnan(result):
+                return self._dtype.na_value
+            return self._to_quantity_array()._scalar(result)
+        return self._from_values(result)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if pd.api.types.is_list_like(key):
+            key = pd.api.indexers.check_array_indexer(self, key)
+        if value is None or (np.isscalar(value) and pd.isna(value)):
+            self._data[key] = np.nan
+        elif isinstance(value, self._dtype.quantity):
+            self._data[key] = self._to_values([value])[0]
+        else:
+            self._data[key] = self._to_values(value)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        if dtype is not None and np.dtype(dtype).kind == "f":
+            return np.array(self._data, dtype=dtype, copy=copy)
+        return np.array(list(self), dtype=object)
+
+    def __arrow_array__(self, type: Any = None) -> Any:
+        from py42195.arrow import to_arrow
+
+        return to_arrow(self._to_quantity_array())
+
+    def isna(self) -> np.ndarray:
+        return np.isnan(self._data)
+
+    def take(
+        self, indices: Any, *, allow_fill: bool = False, fill_value: Any = None
+    ) -> "QuantityExtensionArray":
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = self._to_values([fill_value])[0]
+        else:
+            fill_value = np.nan
+        result = take(self._data, indices, allow_fill=allow_fill, fill_value=fill_value)
+        return self._from_values(result)
+
+    def copy(self) -> "QuantityExtensionArray":
+        return self._from_values(self._data.copy())
+
+    @classmethod
+    def _concat_same_type(
+        cls, to_concat: Sequence["QuantityExtensionArray"]
+    ) -> "QuantityExtensionArray":
+        return cls._from_values(np.concatenate([array._data for array in to_concat]))
+
+    def _values_for_factorize(self) -> tuple[np.ndarray, float]:
+        return self._data, np.nan
+
+    def _values_for_argsort(self) -> np.ndarray:
+        return self._data
+
+    def astype(self, dtype: Any, copy: bool = True) -> Any:
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if dtype == self._dtype:
+            return self.copy() if copy else self
+        if isinstance(dtype, pd.StringDtype):
+            return dtype.construct_array_type()._from_sequence(
+                self._format(), dtype=dtype
+            )
+        if dtype.kind == "f":
+            return self._data.astype(dtype, copy=copy)
+        if dtype.kind == "U":
+            return np.array(self._format(), dtype=dtype)
+        return super().astype(dtype, copy=copy)
+
+    def _format(self) -> list[Any]:
+        strings = self._dtype.quantity.format_many(self._data)
+        return [np.nan if missing else s for s, missing in zip(strings, self.isna())]
+
+    def _formatter(self, boxed: bool = False) -> Callable[[Any], str]:
+        return str
+
+    def _reduce(
+        self, name: str, *, skipna: bool = True, keepdims: bool = False, **kwargs
+    ) -> Any:
+        if name not in _SAME_TYPE_REDUCTIONS:
+            raise TypeError(f"'{self._dtype.name}' does not support reduction '{name}'")
+        function = _SAME_TYPE_REDUCTIONS[name]
+        if not skipna:
+            function = getattr(np, name)
+        if name == "std":
+            result = function(self._data, ddof=kwargs.get("ddof", 1))
+        else:
+            result = function(self._data)
+        min_count = kwargs.get("min_count", 0)
+        if min_count > 0 and np.count_nonzero(~np.isnan(self._data)) < min_count:
+            result = np.nan
+        if keepdims:
+            return self._from_values(np.array([result]))
+        if np.isnan(result):
+            return self._dtype.na_value
+        return self._to_quantity_array()._scalar(result)
+
+    def _groupby_op(
+        self,
+        *,
+        how: str,
+        has_dropped_na: bool,
+        min_count: int,
+        ngroups: int,
+        ids: np.ndarray,
+        **kwargs,
+    ) -> Any:
+        if how not in _SAME_TYPE_GROUPBY_OPS:
+            raise TypeError(f"'{self._dtype.name}' does not support groupby '{how}'")
+        # Through the public groupby of the float values, keyed by the group codes
+        # (-1 for the dropped rows is missing in the categorical, so it is dropped too)
+        keys = pd.Categorical.from_codes(ids, categories=range(ngroups))
+        grouped = pd.Series(self._data, copy=False).groupby(keys, observed=False)
+        if how == "rank":
+            kwargs["method"] = kwargs.pop("ties_method")
+        elif how in _MIN_COUNT_GROUPBY_OPS:
+            kwargs["min_count"] = min_count
+        result = getattr(grouped, how)(**kwargs).to_numpy(dtype=np.float64)
+        if how == "rank":
+            return result
+        return self._from_values(result)
+
+    def _binary(self, other: Any, op: Callable[[Any, Any], Any]) -> Any:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        if isinstance(other, QuantityExtensionArray):
+            other = other._to_quantity_array()
+        result = op(self._to_quantity_array(), other)
+        if isinstance(result, QuantityArray):
+            return EXTENSION_ARRAY_TYPES[result.quantity]._from_values(result._values)
+        return result
+
+    def _compare(self, other: Any, op: Callable[[Any, Any], Any]) -> Any:
+        result = self._binary(other, op)
+        if result is NotImplemented or isinstance(result, np.ndarray):
+            return result
+        # Incompatible types
+        return np.full(len(self), result)
+
+    def __add__(self, other: Any) -> Any:
+        return self._binary(other, operator.add)
+
+    def __radd__(self, other: Any) -> Any:
+        return self._binary(other, lambda a, b: b + a)
+
+    def __sub__(self, other: Any) -> Any:
+        return self._binary(other, operator.sub)
+
+    def __rsub__(self, other: Any) -> Any:
+        return self._binary(other, lambda a, b: b - a)
+
+    def __mul__(self, other: Any) -> Any:
+        return self._binary(other, operator.mul)
+
+    def __rmul__(self, other: Any) -> Any:
+        return self._binary(other, lambda a, b: b * a)
+
+    def __truediv__(self, other: Any) -> Any:
+        return self._binary(other, operator.truediv)
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return self._binary(other, lambda a, b: b / a)
+
+    def __neg__(self) -> "QuantityExtensionArray":
+        return self._from_values(-self._data)
+
+    def __eq__(self, other: Any) -> Any:  # type: ignore[override]
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: Any) -> Any:  # type: ignore[override]
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: Any) -> Any:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: Any) -> Any:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: Any) -> Any:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: Any) -> Any:
+        return self._compare(other, operator.ge)
+
+
+class DistanceExtensionArray(QuantityExtensionArray):
+    _dtype = DistanceDtype()
+
+
+class DurationExtensionArray(QuantityExtensionArray):
+    _dtype = DurationDtype()
+
+
+class PaceExtensionArray(QuantityExtensionArray):
+    _dtype = PaceDtype()
+
+
+class SpeedExtensionArray(QuantityExtensionArray):
+    _dtype = SpeedDtype()
+
+
+EXTENSION_ARRAY_TYPES: dict[Quantity, type[QuantityExtensionArray]] = {
+    Distance: DistanceExtensionArray,
+    Duration: DurationExtensionArray,
+    Pace: PaceExtensionArray,
+    Speed: SpeedExtensionArray,
+}
+
+
+@register_series_accessor("py42195")
+class QuantityAccessor:
+    """Conversion of string or numeric columns into quantities.
+
+    >>> pd.Series(["4:07", "bad"]).py42195.to_pace(errors="nan")
+    0    4:07.0/km
+    1          NaN
+    dtype: pace
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    def _convert(self, quantity: Quantity, errors: ErrorPolicy) -> pd.Series:
+        array_type = EXTENSION_ARRAY_TYPES[quantity]
+        values = self._series.array
+        if isinstance(values, array_type):
+            data = values.copy()
+        elif pd.api.types.is_numeric_dtype(self._series.dtype):
+            from py42195.types import _many
+
+            numbers = self._series.to_numpy(dtype=np.float64, na_value=np.nan)
+            data = array_type._from_values(_many(quantity, numbers, errors)._values)
+        else:
+            data = array_type.parse(self._series.tolist(), errors=errors)
+        return pd.Series(data, index=self._series.index, name=self._series.name)
+
+    def to_distance(self, *, errors: ErrorPolicy = "raise") -> pd.Series:
+        return self._convert(Distance, errors)
+
+    def to_duration(self, *, errors: ErrorPolicy = "raise") -> pd.Series:
+        return self._convert(Duration, errors)
+
+    def to_pace(self, *, errors: ErrorPolicy = "raise") -> pd.Series:
+        return self._convert(Pace, errors)
+
+    def to_speed(self, *, errors: ErrorPolicy = "raise") -> pd.Series:
+        return self._convert(Speed, errors)
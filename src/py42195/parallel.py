@@ -0,0 +1,220 @@
+"""Parallel parse → compute → format pipelines over process pools.
+
+The input is split into chunks processed in worker processes. Between
+the stages, values are kept as flat float buffers (`array("d")`) in canonical
+units, which are cheap to pickle, instead of lists of objects:
+
+>>> from py42195 import Distance, Duration, Pace
+>>> from py42195.parallel import convert_parallel, multiply
+>>> finish_times = convert_parallel(
+...     paces, parse=Pace, compute=multiply(Distance.MARATHON.km), format=Duration, jobs=8
+... )
+
+The unit system active in the caller (a context variable, which does not
+propagate to other processes on its own) is applied in every worker.
+Results are always returned in the input order.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional, Sequence
+
+from py42195.config import get_unit_system, set_unit_system
+
+Compute = Callable[[array], Iterable[float]]
+"""Function of a buffer of canonical values (must be picklable)."""
+
+
+def imap_ordered(
+    function: Callable[[Any], Any],
+    chunks: Iterable[Any],
+    executor: Optional[Executor] = None,
+    *,
+    prefetch: int = 2,
+) -> Iterator[Any]:
+    """Apply the function to all chunks, yielding the results in order.
+
+    With an executor, at most `prefetch` chunks are in flight,
+    so that the input is streamed (unlike `Executor.map`).
+    """
+    if executor is None:
+        yield from map(function, chunks)
+        return
+    pending: deque[Future] = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(function, chunk))
+        if len(pending) >= prefetch:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _multiply(factor: float, values: array) -> array:
+    return array("d", [value * factor for value in values])
+
+
+def multiply(factor: float) -> Compute:
+    """Picklable computation multiplying all values by a factor.
+
+    E.g. `multiply(Distance.MARATHON.km)` turns paces into finish times.
+    """
+    return partial(_multiply, factor)
+
+
+class _Pipeline:
+    """Picklable stages applied to a chunk in a worker."""
+
+    def __init__(
+        self,
+        *,
+        parse: Any = None,
+        compute: Optional[Compute] = None,
+        format: Any = None,
+        errors: Literal["raise", "nan"] = "raise",
+        format_kwargs: Optional[dict[str, Any]] = None,
+    ):
+        self.parse = parse
+        self.compute = compute
+        self.format = format
+        self.errors = errors
+        self.format_kwargs = format_kwargs or {}
+        self.unit_system = get_unit_system()
+
+    def __call__(self, chunk: Sequence[Any]) -> array | list[str]:
+        with set_unit_system(self.unit_system):
+            if self.parse is None:
+                values = array("d", chunk)
+            else:
+                values = self.parse.parse_values(chunk, errors=self.errors)
+            if self.compute is not None:
+                values = array("d", self.compute(values))
+            if self.format is None:
+                return values
+            return self.format.format_many(values, **self.format_kwargs)
+
+
+def _chunks(values: Iterable[Any], size: int) -> Iterator[Sequence[Any]]:
+    if isinstance(values, (array, list, tuple)):
+        for start in range(0, len(values), size):
+            yield values[start : start + size]
+        return
+    iterator = iter(values)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _run(
+    pipeline: _Pipeline,
+    values: Iterable[Any],
+    *,
+    jobs: Optional[int],
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> Iterator[Any]:
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+    # Flat canonical values of quantity arrays
+    values = getattr(values, "_values", values)
+    if hasattr(values, "ravel"):
+        values = array("d", values.ravel())
+    chunks = _chunks(values, chunk_size)
+    if executor is not None:
+        yield from imap_ordered(pipeline, chunks, executor, prefetch=2 * (jobs or 1))
+        return
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        yield from imap_ordered(pipeline, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from imap_ordered(pipeline, chunks, pool, prefetch=2 * jobs)
+
+
+def convert_parallel(
+    sources: Iterable[str],
+    /,
+    *,
+    parse: Any,
+    format: Any = None,
+    compute: Optional[Compute] = None,
+    jobs: Optional[int] = None,
+    chunk_size: int = 65536,
+    errors: Literal["raise", "nan"] = "raise",
+    executor: Optional[Executor] = None,
+    **format_kwargs,
+) -> Iterator[str]:
+    """Parse strings, compute and format the results in worker processes.
+
+    :param parse: Quantity of the input (Distance, Duration, Pace or Speed)
+    :param format: Quantity of the output, by default the same as `parse`
+    :param compute: Function of the canonical values of a chunk
+        (e.g. `multiply(...)`), it must be picklable
+    :param jobs: Number of processes, by default the number of CPUs
+    :param chunk_size: Number of values sent to a worker at once
+    :param errors: "raise" or "nan" for invalid strings
+    :param executor: Existing executor to use instead of a new process pool
+    :param format_kwargs: Options of `format_many` of the output quantity
+    :return: Formatted values, in the input order (streamed)
+    """
+    pipeline = _Pipeline(
+        parse=parse,
+        compute=compute,
+        format=format or parse,
+        errors=errors,
+        format_kwargs=format_kwargs,
+    )
+    for chunk in _run(
+        pipeline, sources, jobs=jobs, chunk_size=chunk_size, executor=executor
+    ):
+        yield from chunk
+
+
+def parse_parallel(
+    quantity: Any,
+    sources: Iterable[str],
+    /,
+    *,
+    compute: Optional[Compute] = None,
+    jobs: Optional[int] = None,
+    chunk_size: int = 65536,
+    errors: Literal["raise", "nan"] = "raise",
+    executor: Optional[Executor] = None,
+) -> array:
+    """Parse strings into a flat buffer of canonical values in worker processes.
+
+    See `convert_parallel` for the parameters.
+    """
+    pipeline = _Pipeline(parse=quantity, compute=compute, errors=errors)
+    result = array("d")
+    for chunk in _run(
+        pipeline, sources, jobs=jobs, chunk_size=chunk_size, executor=executor
+    ):
+        result.extend(chunk)
+    return result
+
+
+def format_parallel(
+    quantity: Any,
+    values: Iterable[float] | Any,
+    /,
+    *,
+    compute: Optional[Compute] = None,
+    jobs: Optional[int] = None,
+    chunk_size: int = 65536,
+    executor: Optional[Executor] = None,
+    **format_kwargs,
+) -> list[str]:
+    """Format canonical values (or a quantity array) in worker processes.
+
+    See `convert_parallel` for the parameters.
+    """
+    pipeline = _Pipeline(compute=compute, format=quantity, format_kwargs=format_kwargs)
+    result: list[str] = []
+    for chunk in _run(
+        pipeline, values, jobs=jobs, chunk_size=chunk_size, executor=executor
+    ):
+        result.extend(chunk)
+    return result
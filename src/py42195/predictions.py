@@ -0,0 +1,259 @@
+"""Race-time predictions for many athletes and distances at once.
+
+Known performances are given as a matrix (athletes × performances, NaN
+or None where missing) together with their distances, targets as a vector
+of distances. All predictions are computed in a single vectorised call:
+
+>>> from py42195 import Distance, distance, duration
+>>> from py42195.predictions import predict
+>>> predict(
+...     [distance("5 km"), distance("10 km")],
+...     [[duration("20:00"), duration("41:30")], [duration("25:00"), None]],
+...     [Distance.HALF_MARATHON, Distance.MARATHON],
+... )
+DurationArray(seconds=[[ 5507.07574122, 11481.87580515],
+ [ 6900.29899988, 14386.65089389]])
+
+The fitted parameters of each athlete can be kept using `fit`
+(and `Fit.predict`), or memoised in a mapping passed to `predict`,
+so that they are not computed again when only the targets change.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, ClassVar, Iterable, MutableMapping, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Predictions require numpy, install it with `pip install py42195[numpy]`."
+    ) from exc
+
+from py42195.arrays import DurationArray, QuantityArray
+from py42195.constants import MILES_IN_KM
+from py42195.types import Distance, Duration
+
+RACE_DISTANCES: tuple[Distance, ...] = (
+    Distance(km=5),
+    Distance(km=10),
+    Distance.HALF_MARATHON,
+    Distance.MARATHON,
+)
+"""Default target distances."""
+
+
+class Model(ABC):
+    """Base class of the prediction models.
+
+    A model fits parameters (one row per athlete) from known performances
+    and predicts times for any distances from them.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def fit(self, km: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        """Parameters of each athlete (rows) from their performances (NaN if missing)."""
+
+    @abstractmethod
+    def predict(self, params: np.ndarray, km: np.ndarray) -> np.ndarray:
+        """Predicted seconds for athletes (rows) and target distances (columns)."""
+
+
+def _row_mean(values: np.ndarray) -> np.ndarray:
+    """Mean of each row ignoring NaN (NaN for rows without any values)."""
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=1)
+    total = np.where(valid, values, 0.0).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan)
+
+
+@dataclass(frozen=True)
+class Riegel(Model):
+    """Riegel's formula: T2 = T1 * (D2 / D1) ** exponent.
+
+    With more performances, their (log-)average is used.
+    """
+
+    exponent: float = 1.06
+
+    name: ClassVar[str] = "riegel"
+
+    def fit(self, km: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        log_scale = np.log(seconds) - self.exponent * np.log(km)
+        return _row_mean(log_scale)[:, np.newaxis]
+
+    def predict(self, params: np.ndarray, km: np.ndarray) -> np.ndarray:
+        return np.exp(params[:, :1]) * km[np.newaxis, :] ** self.exponent
+
+
+@dataclass(frozen=True)
+class Cameron(Model):
+    """Dave Cameron's model based on world records (distances in miles).
+
+    T2 = T1 * (D2 / D1) * f(D1) / f(D2),
+    with f(d) = 13.49681 - 0.048865 * d + 2.438936 / d ** 0.7905
+    """
+
+    name: ClassVar[str] = "cameron"
+
+    @staticmethod
+    def _factor(km: np.ndarray) -> np.ndarray:
+        miles = km / MILES_IN_KM
+        return (13.49681 - 0.048865 * miles + 2.438936 / miles**0.7905) / miles
+
+    def fit(self, km: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        return _row_mean(np.log(seconds * self._factor(km)))[:, np.newaxis]
+
+    def predict(self, params: np.ndarray, km: np.ndarray) -> np.ndarray:
+        return np.exp(params[:, :1]) / self._factor(km)[np.newaxis, :]
+
+
+@dataclass(frozen=True)
+class VDOT(Model):
+    """Daniels & Gilbert's VDOT (oxygen-cost based) model.
+
+    The VDOT of each athlete is the average over their performances,
+    times for the targets are found by bisection.
+    """
+
+    iterations: int = 60
+
+    name: ClassVar[str] = "vdot"
+
+    @staticmethod
+    def vdot(km: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        """VDOT of performances."""
+        minutes = seconds / 60
+        velocity = km * 1000 / minutes  # m/min
+        vo2 = -4.60 + 0.182258 * velocity + 0.000104 * velocity**2
+        fraction = (
+            0.8
+            + 0.1894393 * np.exp(-0.012778 * minutes)
+            + 0.2989558 * np.exp(-0.1932605 * minutes)
+        )
+        return vo2 / fraction
+
+    def fit(self, km: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+        return _row_mean(self.vdot(km, seconds))[:, np.newaxis]
+
+    def predict(self, params: np.ndarray, km: np.ndarray) -> np.ndarray:
+        target = np.broadcast_to(params[:, :1], (params.shape[0], km.shape[0]))
+        km = np.broadcast_to(km[np.newaxis, :], target.shape)
+        # Bracket between 1:30/km and 20:00/km, VDOT decreases with time
+        low = np.log(km * 90)
+        high = np.log(km * 1200)
+        for _ in range(self.iterations):
+            middle = (low + high) / 2
+            too_fast = self.vdot(km, np.exp(middle)) > target
+            low = np.where(too_fast, middle, low)
+            high = np.where(too_fast, high, middle)
+        seconds = np.exp((low + high) / 2)
+        # Outside of the bracket (or no performances at all)
+        outside = (self.vdot(km, km * 90) < target) | (
+            self.vdot(km, km * 1200) > target
+        )
+        return np.where(outside | np.isnan(target), np.nan, seconds)
+
+
+MODELS: dict[str, Model] = {
+    model.name: model for model in (Riegel(), Cameron(), VDOT())
+}
+
+
+def _canonical(values: Any, quantity: type, attr: str) -> np.ndarray:
+    """Canonical values of a quantity array or (nested) sequences of scalars."""
+    if isinstance(values, QuantityArray):
+        if values.quantity is not quantity:
+            raise TypeError(f"Expected {quantity.__name__} values, got {values}")
+        return values._values
+    objects = np.array(values, dtype=object)
+    return np.asarray(
+        np.frompyfunc(partial(_to_float, attr), 1, 1)(objects), np.float64
+    )
+
+
+def _to_float(attr: str, value: Any) -> float:
+    """Canonical value of a scalar, NaN if missing (None or NaN)."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return np.nan
+    return getattr(value, attr)
+
+
+def _get_model(model: str | Model) -> Model:
+    if isinstance(model, Model):
+        return model
+    try:
+        return MODELS[model]
+    except KeyError:
+        raise ValueError(
+            f"Unknown model: {model}, use one of {', '.join(MODELS)}"
+        ) from None
+
+
+class Fit(NamedTuple):
+    """Parameters of a model fitted for many athletes."""
+
+    model: Model
+    params: np.ndarray
+
+    def predict(
+        self, targets: Iterable[Distance] | QuantityArray = RACE_DISTANCES
+    ) -> DurationArray:
+        """Predicted times for all athletes (rows) and targets (columns)."""
+        km = np.atleast_1d(_canonical(targets, Distance, "km"))
+        return DurationArray._from_values(self.model.predict(self.params, km))
+
+
+def fit(
+    distances: Iterable[Distance] | QuantityArray,
+    durations: Iterable[Any] | QuantityArray,
+    /,
+    *,
+    model: str | Model = "riegel",
+    memo: Optional[MutableMapping] = None,
+) -> Fit:
+    """Fit a model for many athletes.
+
+    :param distances: Distances of the performances, either one row shared
+        by all athletes or a matrix of the same shape as `durations`
+    :param durations: Performances (athletes × performances), None or NaN if missing
+    :param model: "riegel", "cameron", "vdot" or a Model instance
+    :param memo: Mapping to memoise the parameters of each athlete in,
+        keyed by the model and the athlete's performances
+    """
+    model = _get_model(model)
+    seconds = np.atleast_2d(_canonical(durations, Duration, "seconds"))
+    km = np.broadcast_to(_canonical(distances, Distance, "km"), seconds.shape)
+    if memo is None:
+        return Fit(model, model.fit(km, seconds))
+
+    keys = [
+        (model, km_row.tobytes(), seconds_row.tobytes())
+        for km_row, seconds_row in zip(km, seconds)
+    ]
+    missing = [i for i, key in enumerate(keys) if key not in memo]
+    if missing:
+        for i, row in zip(missing, model.fit(km[missing], seconds[missing])):
+            memo[keys[i]] = row
+    return Fit(model, np.array([memo[key] for key in keys]))
+
+
+def predict(
+    distances: Iterable[Distance] | QuantityArray,
+    durations: Iterable[Any] | QuantityArray,
+    targets: Iterable[Distance] | QuantityArray = RACE_DISTANCES,
+    /,
+    *,
+    model: str | Model = "riegel",
+    memo: Optional[MutableMapping] = None,
+) -> DurationArray:
+    """Predict times of many athletes (rows) for many target distances (columns).
+
+    See `fit` for the parameters.
+    """
+    return fit(distances, durations, model=model, memo=memo).predict(targets)
@@ -0,0 +1,207 @@
+"""Split plans and pace bands.
+
+A split strategy maps the fraction of the distance covered to the fraction
+of the goal time elapsed (both between 0 and 1). `split_plan` lazily
+yields the cumulative times at every km (or mile in the imperial unit system):
+
+>>> from py42195 import Distance, duration
+>>> from py42195.splits import negative_split, split_plan
+>>> for split in split_plan(duration("3:30:00"), Distance.MARATHON, strategy=negative_split(0.02)):
+...     print(split.distance, split.elapsed)
+1.00 km 5:10.3
+2.00 km 10:20.0
+...
+
+`split_grid` computes plans for many goal times at once (requires numpy).
+"""
+
+import math
+from bisect import bisect_right
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+)
+
+from py42195.config import IMPERIAL, get_unit_system
+from py42195.constants import MILES_IN_KM
+from py42195.types import Distance, Duration
+
+if TYPE_CHECKING:
+    from py42195.arrays import DistanceArray, DurationArray
+
+Strategy = Callable[[Any], Any]
+"""Fraction of distance -> fraction of time (for floats and numpy arrays)."""
+
+
+class Split(NamedTuple):
+    """Cumulative time at a mark."""
+
+    distance: Distance
+    elapsed: Duration
+
+
+def even(fraction: Any) -> Any:
+    """Constant pace."""
+    return fraction
+
+
+def negative_split(difference: float = 0.02) -> Strategy:
+    """Steadily accelerating pace.
+
+    :param difference: How much faster is the second half than the first one
+        (as a fraction of the goal time)
+    """
+    if abs(difference) >= 0.5:
+        raise ValueError(f"Difference must be between -0.5 and 0.5, got {difference}")
+
+    def strategy(fraction: Any) -> Any:
+        # Pace changes linearly from (1 + 2 * difference) to (1 - 2 * difference)
+        return fraction + 2 * difference * (fraction - fraction * fraction)
+
+    return strategy
+
+
+class Course:
+    """Pace adjusted to the course profile.
+
+    Every percent of grade costs `uphill` (relative pace) going up
+    and saves `downhill` going down; the goal time stays the same.
+    """
+
+    def __init__(
+        self,
+        distances: Iterable[Distance],
+        elevations: Iterable[float],
+        *,
+        uphill: float = 0.033,
+        downhill: float = 0.018,
+    ):
+        """
+        :param distances: Distances of the profile points (from the start)
+        :param elevations: Elevations of the profile points in metres
+        """
+        km = [d.km for d in distances]
+        metres = list(elevations)
+        if len(km) != len(metres) or len(km) < 2:
+            raise ValueError("At least two profile points with elevations needed")
+        efforts = [0.0]
+        for i in range(1, len(km)):
+            step = km[i] - km[i - 1]
+            if step <= 0:
+                raise ValueError("Profile distances must be increasing")
+            grade = (metres[i] - metres[i - 1]) / step / 10  # in %
+            cost = uphill if grade > 0 else downhill
+            efforts.append(efforts[-1] + step * max(1 + cost * grade, 0.0))
+        self._x = [(value - km[0]) / (km[-1] - km[0]) for value in km]
+        self._y = [effort / efforts[-1] for effort in efforts]
+
+    def __call__(self, fraction: Any) -> Any:
+        if isinstance(fraction, (int, float)):
+            i = min(max(bisect_right(self._x, fraction), 1), len(self._x) - 1)
+            x0, x1 = self._x[i - 1], self._x[i]
+            y0, y1 = self._y[i - 1], self._y[i]
+            return y0 + (y1 - y0) * (fraction - x0) / (x1 - x0)
+        import numpy as np
+
+        return np.interp(fraction, self._x, self._y)
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "even": even,
+    "negative": negative_split(),
+}
+
+
+def _get_strategy(strategy: str | Strategy) -> Strategy:
+    if callable(strategy):
+        return strategy
+    try:
+        return STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy: {strategy}, use one of {', '.join(STRATEGIES)}"
+        ) from None
+
+
+def _marks(total_km: float, every: Optional[Distance]) -> Iterator[float]:
+    """Marks (in km) up to the finish, by default every km or mile."""
+    if every is None:
+        step = MILES_IN_KM if get_unit_system() == IMPERIAL else 1.0
+    else:
+        step = every.km
+    if step <= 0:
+        raise ValueError(f"Splits must be positive, got {every}")
+    count = math.ceil(total_km / step - 1e-9)
+    for i in range(1, count):
+        yield i * step
+    yield total_km
+
+
+def split_plan(
+    goal: Duration,
+    distance: Distance,
+    /,
+    *,
+    strategy: str | Strategy = even,
+    every: Optional[Distance] = None,
+) -> Iterator[Split]:
+    """Lazily yield the cumulative times at every mark and at the finish.
+
+    :param strategy: "even", "negative" or any `Strategy` (e.g. `negative_split(0.03)`)
+    :param every: Distance between marks, by default 1 km or 1 mile
+        (according to the unit system)
+    """
+    strategy = _get_strategy(strategy)
+    total_km = distance.km
+    seconds = goal.seconds
+    for km in _marks(total_km, every):
+        yield Split(
+            Distance._from_km(km),
+            Duration._from_seconds(seconds * strategy(km / total_km)),
+        )
+
+
+def goal_range(start: Duration, stop: Duration, step: Duration, /) -> "DurationArray":
+    """Goal times from start to stop (inclusive) for `split_grid` (requires numpy)."""
+    import numpy as np
+
+    from py42195.arrays import DurationArray
+
+    count = math.floor((stop.seconds - start.seconds) / step.seconds + 1e-9) + 1
+    return DurationArray._from_values(start.seconds + step.seconds * np.arange(count))
+
+
+def split_grid(
+    goals: Iterable[Duration] | "DurationArray",
+    distance: Distance,
+    /,
+    *,
+    strategy: str | Strategy = even,
+    every: Optional[Distance] = None,
+) -> tuple["DistanceArray", "DurationArray"]:
+    """Split plans for many goal times at once (requires numpy).
+
+    :return: Marks and the cumulative times (goals × marks)
+
+    See `split_plan` for the other parameters.
+    """
+    import numpy as np
+
+    from py42195.arrays import DistanceArray, DurationArray
+
+    strategy = _get_strategy(strategy)
+    if isinstance(goals, DurationArray):
+        seconds = goals.seconds.ravel()
+    else:
+        seconds = np.fromiter((goal.seconds for goal in goals), np.float64)
+    km = np.fromiter(_marks(distance.km, every), np.float64)
+    fractions = np.asarray(strategy(km / distance.km), dtype=np.float64)
+    return (
+        DistanceArray._from_values(km),
+        DurationArray._from_values(seconds[:, np.newaxis] * fractions[np.newaxis, :]),
+    )
@@ -0,0 +1,202 @@
+"""Memory-mapped on-disk storage of quantity columns.
+
+The file starts with a fixed prefix (magic and header length), followed by
+a JSON header describing the columns (name, quantity and its canonical unit)
+and the number of rows. The columns follow as contiguous little-endian
+float64 values, each starting at an offset aligned to 8 bytes:
+
+>>> from py42195.store import open_store, write_store
+>>> write_store("splits.q42", {"10k": split_10k, "half": split_half})
+>>> with open_store("splits.q42") as store:
+...     store["half"][1234]          # only the touched page is read
+duration('1:32:11.0')
+
+Opening a store takes constant time: the file is memory-mapped and
+the columns are views of the mapping (`QuantityView`, or quantity arrays
+using `SplitStore.array`), so nothing is copied and processes opening the
+same file share the pages in the OS cache.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from os import PathLike, fspath
+from typing import Any, Iterable, Iterator, Mapping
+
+from py42195.codec import QuantityView, float64_view
+from py42195.types import Distance, Duration, Pace, Speed
+
+MAGIC = b"PY42195S"
+VERSION = 1
+
+PREFIX = struct.Struct("<8sI4x")
+"""Magic, length of the JSON header (padded to 8 bytes) and padding."""
+
+QUANTITIES: dict[str, type] = {
+    quantity.__name__.lower(): quantity
+    for quantity in (Distance, Duration, Pace, Speed)
+}
+
+
+def _canonical_bytes(values: Any) -> tuple[type, int, Any]:
+    """Quantity, length and little-endian float64 buffer of a column."""
+    if isinstance(values, QuantityView):
+        return values.quantity, len(values), _little_endian(array("d", values.values))
+    if hasattr(values, "_values"):
+        import numpy as np
+
+        buffer = np.ascontiguousarray(values._values.ravel(), dtype="<f8")
+        return values.quantity, len(buffer), memoryview(buffer).cast("B")
+    values = list(values)
+    if not values:
+        raise ValueError("Cannot store an empty column of unknown quantity")
+    quantity = type(values[0])
+    buffer = array("d")
+    for value in values:
+        if not isinstance(value, quantity):
+            raise TypeError(f"Expected {quantity.__name__}, got {type(value)}")
+        buffer.append(value.__getstate__())
+    return quantity, len(buffer), _little_endian(buffer)
+
+
+def _little_endian(buffer: array) -> array:
+    if sys.byteorder != "little":
+        buffer.byteswap()
+    return buffer
+
+
+def _quantity_name(quantity: type) -> str:
+    for cls in quantity.__mro__:
+        if cls in QUANTITIES.values():
+            return cls.__name__.lower()
+    raise TypeError(f"Cannot store {quantity}")
+
+
+def write_store(path: str | PathLike, columns: Mapping[str, Iterable[Any]], /) -> None:
+    """Write columns of quantities (scalars, quantity arrays or views) into a file.
+
+    All columns must have the same length.
+    """
+    prepared = {name: _canonical_bytes(values) for name, values in columns.items()}
+    rows = {length for _, length, _ in prepared.values()}
+    if len(rows) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(rows)}")
+    header = {
+        "version": VERSION,
+        "rows": rows.pop() if rows else 0,
+        "columns": [
+            {
+                "name": name,
+                "quantity": _quantity_name(quantity),
+                "unit": quantity._canonical_unit,
+            }
+            for name, (quantity, _, _) in prepared.items()
+        ],
+    }
+    header_bytes = json.dumps(header).encode()
+    header_bytes += b" " * (-len(header_bytes) % 8)
+    with open(path, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, len(header_bytes)))
+        f.write(header_bytes)
+        for _, _, buffer in prepared.values():
+            f.write(buffer)
+
+
+def _parse_column(column: Any) -> tuple[str, type]:
+    """Name and quantity of a column described in the header."""
+    quantity = QUANTITIES[column["quantity"]]
+    if column["unit"] != quantity._canonical_unit:
+        raise ValueError(f"Unexpected unit of {column['name']}: {column['unit']}")
+    return column["name"], quantity
+
+
+class SplitStore(Mapping[str, QuantityView]):
+    """Read-only memory-mapped columns (see `open_store`)."""
+
+    def __init__(self, path: str | PathLike):
+        self.path = fspath(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        try:
+            magic, header_length = PREFIX.unpack_from(buffer)
+            if magic != MAGIC:
+                raise ValueError(f"Not a py42195 store: {self.path}")
+            start = PREFIX.size + header_length
+            if header_length % 8 or start > len(buffer):
+                raise ValueError(f"Invalid header length {header_length}: {self.path}")
+            header = json.loads(bytes(buffer[PREFIX.size : start]))
+            if not isinstance(header, dict) or not isinstance(
+                header.get("columns"), list
+            ):
+                raise ValueError(f"Invalid header: {self.path}")
+            if header["version"] != VERSION:
+                raise ValueError(f"Unsupported version: {header['version']}")
+            self.rows: int = header["rows"]
+            if type(self.rows) is not int or self.rows < 0:
+                raise ValueError(f"Invalid number of rows: {self.rows}")
+            columns = [_parse_column(column) for column in header["columns"]]
+            size = start + 8 * self.rows * len(columns)
+            if len(buffer) < size:
+                raise ValueError(
+                    f"Truncated store (expected {size} bytes, got {len(buffer)}): {self.path}"
+                )
+        except (struct.error, KeyError, TypeError, ValueError) as exc:
+            buffer.release()
+            self._mmap.close()
+            if not isinstance(exc, ValueError):
+                raise ValueError(f"Invalid header ({exc!r}): {self.path}") from exc
+            raise
+        self._columns: dict[str, QuantityView] = {}
+        for i, (name, quantity) in enumerate(columns):
+            offset = start + 8 * self.rows * i
+            data = buffer[offset : offset + 8 * self.rows]
+            self._columns[name] = QuantityView(quantity, float64_view(data))
+
+    def __getitem__(self, name: str) -> QuantityView:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        columns = ", ".join(
+            f"{name}: {view.quantity.__name__}" for name, view in self._columns.items()
+        )
+        return f"SplitStore('{self.path}', rows={self.rows}, {{{columns}}})"
+
+    def array(self, name: str) -> Any:
+        """Column as a read-only quantity array sharing the mapping (requires numpy)."""
+        return self[name].to_array()
+
+    def close(self) -> None:
+        """Close the mapping.
+
+        If views of the columns are still in use, the mapping is closed
+        only after they are garbage-collected.
+        """
+        self._columns = {}
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self) -> "SplitStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __reduce__(self) -> tuple:
+        # Other processes map the file themselves
+        return (type(self), (self.path,))
+
+
+def open_store(path: str | PathLike, /) -> SplitStore:
+    """Memory-map a file written by `write_store`."""
+    return SplitStore(path)
@@ -0,0 +1,267 @@
+"""Index of cumulative tracks answering time-at-distance queries.
+
+A `TrackIndex` keeps the cumulative distances and elapsed times of a track
+as two sorted arrays. Queries find the surrounding samples by binary search,
+O(log n), and interpolate linearly between them:
+
+>>> from py42195.tracks import TrackIndex
+>>> index = TrackIndex.from_activity("morning_run.gpx")
+>>> index.elapsed_at(Distance.HALF_MARATHON)
+duration('1:31:04.2')
+>>> index.distance_at(duration("1:30:00"))
+distance('20.85 km')
+
+All queries also accept arrays (or sequences of scalars), searched at once:
+
+>>> marks, elapsed = index.splits()      # virtual split at every km
+
+Requires numpy.
+"""
+
+from typing import Any, Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Track indexes require numpy, install it with `pip install py42195[numpy]`."
+    ) from exc
+
+from py42195.activities import Sample, Source, read_chunks
+from py42195.arrays import (
+    DistanceArray,
+    DurationArray,
+    PaceArray,
+    QuantityArray,
+    canonical_value,
+)
+from py42195.splits import _marks
+from py42195.types import Distance, Duration, Pace
+
+
+def _canonical_query(obj: Any, quantity: type) -> tuple[bool, np.ndarray]:
+    """Whether the query is a single value, and its values in canonical units.
+
+    :raises TypeError: if the values are not of the quantity
+    """
+    try:
+        obj_quantity, values = canonical_value(obj)
+    except TypeError:
+        if not isinstance(obj, Iterable):
+            raise
+        obj_quantity = quantity
+        values = np.fromiter(
+            (_canonical_scalar(item, quantity) for item in obj), np.float64
+        )
+    if obj_quantity is not quantity:
+        raise TypeError(f"Expected {quantity.__name__}, got {type(obj)}")
+    return not isinstance(obj, (QuantityArray, Iterable)), np.asarray(
+        values, dtype=np.float64
+    )
+
+
+def _canonical_scalar(obj: Any, quantity: type) -> float:
+    obj_quantity, value = canonical_value(obj)
+    if obj_quantity is not quantity:
+        raise TypeError(f"Expected {quantity.__name__}, got {type(obj)}")
+    return value
+
+
+def _interpolate(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """Linear interpolation over non-decreasing xp, NaN outside of its range.
+
+    Unlike `np.interp`, repeated values of xp (e.g. a runner standing still)
+    are allowed: the first sample reaching x is used.
+    """
+    # xp[i - 1] < x <= xp[i]
+    i = np.clip(np.searchsorted(xp, x, side="left"), 1, len(xp) - 1)
+    x0 = xp[i - 1]
+    x1 = xp[i]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fraction = (x - x0) / (x1 - x0)
+    result = fp[i - 1] + fraction * (fp[i] - fp[i - 1])
+    result = np.where(x == xp[0], fp[0], result)
+    return np.where((x < xp[0]) | (x > xp[-1]), np.nan, result)
+
+
+def _interpolate_one(x: float, xp: np.ndarray, fp: np.ndarray) -> float:
+    """`_interpolate` of a single value (without the overhead of arrays)."""
+    i = int(xp.searchsorted(x))
+    if i == 0:
+        return float(fp[0]) if x == xp[0] else np.nan
+    if i == len(xp):
+        return np.nan
+    x0, x1 = float(xp[i - 1]), float(xp[i])
+    f0, f1 = float(fp[i - 1]), float(fp[i])
+    return f0 + (x - x0) / (x1 - x0) * (f1 - f0)
+
+
+class TrackIndex:
+    """Cumulative distances and elapsed times of a track, indexed for queries.
+
+    Queries of single values outside of the track raise ValueError,
+    queries of arrays return NaN there.
+    """
+
+    __slots__ = ("_km", "_seconds")
+
+    def __init__(
+        self,
+        distances: DistanceArray | Iterable[Distance],
+        elapsed: DurationArray | Iterable[Duration],
+        /,
+    ):
+        """
+        :param distances: Cumulative distances (non-decreasing)
+        :param elapsed: Elapsed times of the same samples (non-decreasing)
+        :raises ValueError: if the samples are not sorted or there are fewer than two
+        """
+        _, km = _canonical_query(distances, Distance)
+        _, seconds = _canonical_query(elapsed, Duration)
+        km = km.ravel()
+        seconds = seconds.ravel()
+        if len(km) != len(seconds):
+            raise ValueError(
+                f"Different number of distances and times: {len(km)} != {len(seconds)}"
+            )
+        if len(km) < 2:
+            raise ValueError("A track needs at least two samples")
+        if not (np.isfinite(km).all() and np.isfinite(seconds).all()):
+            raise ValueError("Track samples must be finite")
+        if (np.diff(km) < 0).any() or (np.diff(seconds) < 0).any():
+            raise ValueError("Track samples must be sorted (cumulative)")
+        self._km = km
+        self._seconds = seconds
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[Sample], /) -> "TrackIndex":
+        """Index samples of an activity (see `py42195.activities`)."""
+        km: list[float] = []
+        seconds: list[float] = []
+        for sample in samples:
+            km.append(sample.distance.km)
+            seconds.append(sample.elapsed.seconds)
+        return cls(DistanceArray._from_values(km), DurationArray._from_values(seconds))
+
+    @classmethod
+    def from_activity(
+        cls, source: Source, /, *, format: Optional[str] = None
+    ) -> "TrackIndex":
+        """Read and index an activity file (GPX, TCX or CSV)."""
+        chunks = list(read_chunks(source, format=format))
+        return cls(
+            DistanceArray._from_values(np.concatenate([c[0].km for c in chunks])),
+            DurationArray._from_values(np.concatenate([c[1].seconds for c in chunks])),
+        )
+
+    def __len__(self) -> int:
+        return len(self._km)
+
+    def __repr__(self) -> str:
+        return f"TrackIndex({len(self)} samples, {self.distance}, {self.duration})"
+
+    @property
+    def distance(self) -> Distance:
+        """Total distance."""
+        return Distance._from_km(float(self._km[-1]))
+
+    @property
+    def duration(self) -> Duration:
+        """Total elapsed time."""
+        return Duration._from_seconds(float(self._seconds[-1]))
+
+    @property
+    def distances(self) -> DistanceArray:
+        return DistanceArray._from_values(self._km)
+
+    @property
+    def elapsed(self) -> DurationArray:
+        return DurationArray._from_values(self._seconds)
+
+    def elapsed_at(
+        self, distance: Distance | DistanceArray | Iterable[Distance], /
+    ) -> Any:
+        """Elapsed time when the distance was first reached.
+
+        :return: Duration, or DurationArray for many distances
+        """
+        scalar, km = _canonical_query(distance, Distance)
+        if scalar:
+            seconds = _interpolate_one(float(km), self._km, self._seconds)
+            return Duration._from_seconds(self._scalar(seconds, distance))
+        return DurationArray._from_values(_interpolate(km, self._km, self._seconds))
+
+    def distance_at(
+        self, elapsed: Duration | DurationArray | Iterable[Duration], /
+    ) -> Any:
+        """Distance covered at the elapsed time.
+
+        :return: Distance, or DistanceArray for many times
+        """
+        scalar, seconds = _canonical_query(elapsed, Duration)
+        if scalar:
+            km = _interpolate_one(float(seconds), self._seconds, self._km)
+            return Distance._from_km(self._scalar(km, elapsed))
+        return DistanceArray._from_values(
+            _interpolate(seconds, self._seconds, self._km)
+        )
+
+    def pace_between(self, start: Any, end: Any, /) -> Any:
+        """Average pace between two distances (or arrays of them).
+
+        :return: Pace, or PaceArray for many distances
+        """
+        scalar_start, start_km = _canonical_query(start, Distance)
+        scalar_end, end_km = _canonical_query(end, Distance)
+        seconds = _interpolate(
+            np.stack(np.broadcast_arrays(start_km, end_km)), self._km, self._seconds
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            seconds_per_km = (seconds[1] - seconds[0]) / (end_km - start_km)
+        if scalar_start and scalar_end:
+            if end_km <= start_km:
+                raise ValueError(f"Empty interval: {start} - {end}")
+            value = self._scalar(seconds_per_km, f"{start} - {end}")
+            return Pace._from_seconds_per_km(value)
+        return PaceArray._from_values(seconds_per_km)
+
+    def splits(
+        self, *, every: Optional[Distance] = None
+    ) -> tuple[DistanceArray, DurationArray]:
+        """Virtual splits: elapsed times at every mark and at the end of the track.
+
+        :param every: Distance between marks, by default 1 km or 1 mile
+            (according to the unit system)
+        :return: Marks and the cumulative times
+        """
+        km = np.fromiter(_marks(float(self._km[-1]), every), np.float64)
+        return (
+            DistanceArray._from_values(km),
+            DurationArray._from_values(_interpolate(km, self._km, self._seconds)),
+        )
+
+    @staticmethod
+    def _scalar(value: float, query: Any) -> float:
+        value = float(value)
+        if np.isnan(value):
+            raise ValueError(f"Outside of the track: {query}")
+        return value
+
+
+def elapsed_at_many(
+    indexes: Iterable[TrackIndex],
+    distances: DistanceArray | Iterable[Distance],
+    /,
+) -> DurationArray:
+    """Elapsed times of many tracks at the same distances.
+
+    E.g. the times at every km mark of thousands of activities.
+
+    :return: Times (tracks × distances), NaN beyond the end of a track
+    """
+    _, km = _canonical_query(distances, Distance)
+    km = km.ravel()
+    rows = [_interpolate(km, index._km, index._seconds) for index in indexes]
+    return DurationArray._from_values(
+        np.stack(rows) if rows else np.empty((0, len(km)))
+    )
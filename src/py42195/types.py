@@ -1,27 +1,161 @@
+import math
 import re
+from array import array
 from datetime import timedelta
-from functools import total_ordering
-from typing import Any, ClassVar, Optional, Self
+from functools import lru_cache, partial, total_ordering
+from itertools import chain, repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Optional,
+    Self,
+    TextIO,
+)
 
+from py42195 import cache
 from py42195.config import get_default_unit, get_unit_system
 from py42195.constants import (
-    FEET_IN_KM,
     HALF_MARATHON_IN_KM,
-    M_IN_KM,
+    KM_FACTORS,
     MARATHON_IN_KM,
+    MAX_INTERNED_PACE_SECONDS,
     MILES_IN_KM,
-    YARDS_IN_KM,
+    STANDARD_DISTANCES_IN_KM,
+)
+from py42195.utils import (
+    INTERVAL_PATTERN,
+    ErrorPolicy,
+    format_interval,
+    format_intervals,
+    format_many,
+    parse_interval_seconds,
+    parse_many,
 )
-from py42195.utils import INTERVAL_PATTERN, format_interval, parse_interval
+
+if TYPE_CHECKING:
+    from py42195.arrays import DistanceArray, DurationArray, PaceArray, SpeedArray
+
+
+class _Quantity:
+    """Common behaviour of the immutable value classes."""
+
+    __slots__ = ()
+
+    # Name of the attribute holding the value in canonical units
+    _canonical_unit: ClassVar[str]
+
+    # Fast constructor from the value in canonical units
+    _from_canonical: ClassVar[Callable[[float], Any]]
+
+    def _format(self, unit_system: str, /) -> str:
+        """`str()` in a unit system resolved by the caller (once for many values)."""
+        return str(self)
+
+    @classmethod
+    def _parser(cls, unit_system: str, /) -> Callable[[str], Any]:
+        """`parse` in a unit system resolved by the caller (once for many values)."""
+        return cls.parse
+
+    def __getstate__(self) -> float:
+        """Value in canonical units."""
+        return getattr(self, self._canonical_unit)
+
+    def __reduce__(self) -> tuple:
+        return (_unpickle, (type(self), self.__getstate__()))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
+def _unpickle(cls: type, value: float) -> Any:
+    obj = object.__new__(cls)
+    object.__setattr__(obj, cls._canonical_unit, value)
+    return obj
+
+
+def _canonical_values(values: Any, quantity: type, attr: str) -> Iterable[float]:
+    """Values in canonical units of quantities or of a quantity array."""
+    if getattr(values, "quantity", None) is quantity:
+        return values._values.flat
+    return (getattr(value, attr) for value in values)
+
+
+def _weights(weights: Any) -> tuple[Optional[type], Optional[Iterable[float]]]:
+    """Split weights (distances or durations) into their type and canonical values."""
+    if weights is None:
+        return None, None
+    quantity = getattr(weights, "quantity", None)
+    if quantity is None:
+        weights = iter(weights)
+        first = next(weights, None)
+        if first is None:
+            return None, ()
+        quantity = type(first)
+        weights = chain([first], weights)
+    if issubclass(quantity, Distance):
+        return Distance, _canonical_values(weights, Distance, "km")
+    if issubclass(quantity, Duration):
+        return Duration, _canonical_values(weights, Duration, "seconds")
+    raise TypeError(f"Weights should be distances or durations, got {quantity}")
+
+
+def _mean(
+    values: Iterable[float],
+    weights: Optional[Iterable[float]] = None,
+    *,
+    harmonic: bool = False,
+) -> float:
+    """Weighted arithmetic (or harmonic) mean in a single pass.
+
+    Both the weighted total and the total weight use compensated
+    (Neumaier) summation.
+    """
+    if weights is None:
+        pairs = zip(values, repeat(1.0))
+    else:
+        pairs = zip(values, weights, strict=True)
+    total = total_c = weight = weight_c = 0.0
+    for value, w in pairs:
+        x = w / value if harmonic else w * value
+        t = total + x
+        if abs(total) >= abs(x):
+            total_c += (total - t) + x
+        else:
+            total_c += (x - t) + total
+        total = t
+        t = weight + w
+        if abs(weight) >= abs(w):
+            weight_c += (weight - t) + w
+        else:
+            weight_c += (w - t) + weight
+        weight = t
+    total += total_c
+    weight += weight_c
+    if not weight:
+        raise ValueError("Cannot average an empty sequence (or zero weights)")
+    return weight / total if harmonic else total / weight
 
 
 @total_ordering
-class Distance:
+class Distance(_Quantity):
+    __slots__ = ("km",)
+
     km: float
 
+    _canonical_unit = "km"
+
     MARATHON: ClassVar["Distance"]
     HALF_MARATHON: ClassVar["Distance"]
 
+    # Shared instances of standard race distances
+    _interned: ClassVar[dict[float, "Distance"]]
+
     ALLOWED_UNITS = ["km", "mi", "m", "yd", "ft"]
     PARSE_PATTERN: re.Pattern = re.compile(
         r"^(?P<value>\d+(\.\d+)?)\s*(?P<unit>" + "|".join(ALLOWED_UNITS) + ")?$"
@@ -36,30 +170,46 @@ class Distance:
         yd: Optional[float] = None,
         ft: Optional[float] = None,
     ):
-        args_given = [
-            unit
-            for unit, val in locals().items()
-            if unit in self.ALLOWED_UNITS and val is not None
-        ]
-        if len(args_given) != 1:
-            raise ValueError(
-                f"Exactly one of the following arguments should be provided: {', '.join(self.ALLOWED_UNITS)}, "
-                f"got {len(args_given)}: {', '.join(args_given)}"
-            )
+        if m is mi is yd is ft is None and km is not None:
+            value = km
+        else:
+            args_given = {
+                unit: val
+                for unit, val in (
+                    ("km", km),
+                    ("m", m),
+                    ("mi", mi),
+                    ("yd", yd),
+                    ("ft", ft),
+                )
+                if val is not None
+            }
+            if len(args_given) != 1:
+                raise ValueError(
+                    f"Exactly one of the following arguments should be provided: {', '.join(self.ALLOWED_UNITS)}, "
+                    f"got {len(args_given)}: {', '.join(args_given)}"
+                )
+            ((unit, value),) = args_given.items()
+            if unit != "km":
+                value = value * KM_FACTORS[unit]
+
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Expected a number, got {type(value)}")
+        _set_km(self, value)
 
-        if km is not None:
-            self.km = km
-        elif m is not None:
-            self.km = m * M_IN_KM
-        elif yd is not None:
-            self.km = yd * YARDS_IN_KM
-        elif mi is not None:
-            self.km = mi * MILES_IN_KM
-        elif ft is not None:
-            self.km = ft * FEET_IN_KM
+    @classmethod
+    def _from_km(cls, km: float, /) -> Self:
+        """Create a new instance without any validation."""
+        obj = object.__new__(cls)
+        _set_km(obj, km)
+        return obj
 
-        if not isinstance(self.km, (int, float)):
-            raise TypeError(f"Expected a number, got {type(self.km)}")
+    _from_canonical = _from_km
+
+    @classmethod
+    def sum(cls, values: Iterable["Distance"] | "DistanceArray", /) -> Self:
+        """Total of many distances (using compensated summation)."""
+        return cls._from_km(math.fsum(_canonical_values(values, Distance, "km")))
 
     @property
     def mi(self) -> float:
@@ -67,19 +217,69 @@ class Distance:
 
     @classmethod
     def parse(cls, s: str) -> Self:
+        if cache.cached_parse is not None:
+            return cache.cached_parse(cls, s, None)
+        return cls._parse(s)
+
+    @classmethod
+    def _parse(cls, s: str, default_unit: Optional[str] = None) -> Self:
+        km = cls._parse_km(s)
+        return cls._interned.get(km) or cls._from_km(km)
+
+    @classmethod
+    def intern(cls, value: Self, /) -> Self:
+        """Shared instance for standard race distances, the value itself otherwise."""
+        return cls._interned.get(value.km, value)
+
+    @classmethod
+    def _parse_km(cls, s: str) -> float:
         # split into unit and value
         match = cls.PARSE_PATTERN.match(s)
         if match is None:
             raise ValueError(f"Cannot parse as distance: {s}")
         value = float(match.group("value"))
-        unit = match.group("unit") or "km"
-        return cls(**{unit: value})
+        return value * KM_FACTORS[match.group("unit") or "km"]
+
+    @classmethod
+    def parse_values(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> array:
+        """Parse many strings into a flat buffer of km."""
+        return parse_many(cls._parse_km, sources, errors=errors)
+
+    @classmethod
+    def parse_many(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> "DistanceArray":
+        """Parse many strings into a distance array (requires numpy)."""
+        from py42195.arrays import DistanceArray
+
+        return DistanceArray._from_values(cls.parse_values(sources, errors=errors))
 
     def __str__(self) -> str:
-        if get_unit_system() == "imperial":
+        return self._format(get_unit_system())
+
+    def _format(self, unit_system: str, /) -> str:
+        if unit_system == "imperial":
             return f"{self.mi:.2f} mi"
         return f"{self.km:.2f} km"
 
+    @classmethod
+    def format_many(
+        cls, values: Iterable[float], /, *, file: Optional[TextIO] = None
+    ) -> Optional[list[str]]:
+        """Format many distances the same way as `str()`.
+
+        :param values: Distances in km or a DistanceArray
+        :param file: If given, write the values into it line by line.
+        """
+        values = getattr(values, "km", values)
+        if get_unit_system() == "imperial":
+            return format_many(
+                lambda km: f"{km / MILES_IN_KM:.2f} mi", values, file=file
+            )
+        return format_many(lambda km: f"{km:.2f} km", values, file=file)
+
     def __repr__(self) -> str:
         if get_unit_system() == "imperial":
             return f"Distance(mi={self.mi})"
@@ -87,25 +287,25 @@ class Distance:
 
     def __add__(self, other: "Distance") -> "Distance":
         if isinstance(other, Distance):
-            return Distance(km=self.km + other.km)
+            return Distance._from_km(self.km + other.km)
         return NotImplemented
 
     def __radd__(self, other: Any) -> "Distance":
         if other == 0:
             # Support sum
             return self
-        return other + self
+        return NotImplemented
 
     def __sub__(self, other: "Distance") -> "Distance":
         if isinstance(other, Distance):
-            return Distance(km=self.km - other.km)
+            return Distance._from_km(self.km - other.km)
         return NotImplemented
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Distance(km=self.km * other)
+            return Distance._from_km(self.km * other)
         if isinstance(other, Pace):
-            return Duration(self.km * other.seconds_per_km)
+            return Duration._from_seconds(self.km * other.seconds_per_km)
         else:
             return NotImplemented
 
@@ -114,13 +314,13 @@ class Distance:
 
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
-            return Distance(km=self.km / other)
+            return Distance._from_km(self.km / other)
         if isinstance(other, Distance):
             return self.km / other.km
         if isinstance(other, Duration):
-            return Speed(km_h=self.km / (other.seconds * 3600))
+            return Speed._from_km_h(self.km / other.seconds * 3600)
         if isinstance(other, Speed):
-            return Duration(self.km / other.km_h * 3600)
+            return Duration._from_seconds(self.km / other.km_h * 3600)
         return NotImplemented
 
     def __rtruediv__(self, other):
@@ -133,68 +333,148 @@ class Distance:
             return self.km == other.km
         return NotImplemented
 
+    def __hash__(self) -> int:
+        return hash(self.km)
+
     def __lt__(self, other: object, /) -> bool:
         if isinstance(other, Distance):
             return self.km < other.km
         return NotImplemented
 
 
-Distance.MARATHON = Distance(km=MARATHON_IN_KM)
-Distance.HALF_MARATHON = Distance(km=HALF_MARATHON_IN_KM)
+@lru_cache(maxsize=4096)
+def _timedelta_hash(seconds: float, /) -> int:
+    """Hash of the timedelta equal to a duration, created once per distinct value."""
+    try:
+        return hash(timedelta(seconds=seconds))
+    except (OverflowError, ValueError):
+        return hash(seconds)
+
+
+_set_km = Distance.km.__set__  # type: ignore[attr-defined]
+
+Distance._interned = {km: Distance(km=km) for km in STANDARD_DISTANCES_IN_KM}
+Distance.MARATHON = Distance._interned[MARATHON_IN_KM]
+Distance.HALF_MARATHON = Distance._interned[HALF_MARATHON_IN_KM]
 
 
 @total_ordering
-class Duration:
+class Duration(_Quantity):
+    __slots__ = ("seconds",)
+
     seconds: float
 
+    _canonical_unit = "seconds"
+
     def __init__(self, seconds: float | timedelta, /):
         if isinstance(seconds, timedelta):
-            self.seconds = seconds.total_seconds()
-        else:
-            self.seconds = seconds
+            seconds = seconds.total_seconds()
+        _set_seconds(self, seconds)
+
+    @classmethod
+    def _from_seconds(cls, seconds: float, /) -> Self:
+        """Create a new instance without any validation."""
+        obj = object.__new__(cls)
+        _set_seconds(obj, seconds)
+        return obj
+
+    _from_canonical = _from_seconds
+
+    @classmethod
+    def sum(cls, values: Iterable["Duration"] | "DurationArray", /) -> Self:
+        """Total of many durations (using compensated summation)."""
+        return cls._from_seconds(
+            math.fsum(_canonical_values(values, Duration, "seconds"))
+        )
 
     @classmethod
     def parse(cls, s: str, /) -> Self:
-        if (delta := parse_interval(s)) is None:
-            raise ValueError(f"Cannot parse as time: {s}")
-        return cls(delta.total_seconds())
+        if cache.cached_parse is not None:
+            return cache.cached_parse(cls, s, None)
+        return cls._parse(s)
+
+    @classmethod
+    def _parse(cls, s: str, default_unit: Optional[str] = None) -> Self:
+        return cls._from_seconds(parse_interval_seconds(s))
+
+    @classmethod
+    def parse_values(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> array:
+        """Parse many strings into a flat buffer of seconds."""
+        return parse_many(parse_interval_seconds, sources, errors=errors)
+
+    @classmethod
+    def parse_many(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> "DurationArray":
+        """Parse many strings into a duration array (requires numpy)."""
+        from py42195.arrays import DurationArray
+
+        return DurationArray._from_values(cls.parse_values(sources, errors=errors))
 
     def __str__(self) -> str:
         return format_interval(self.seconds)
 
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[float],
+        /,
+        *,
+        int_seconds: bool = False,
+        precision: int = 1,
+        pad_hours: bool = False,
+        file: Optional[TextIO] = None,
+    ) -> Optional[list[str]]:
+        """Format many durations the same way as `str()`.
+
+        :param values: Durations in seconds or a DurationArray
+        :param file: If given, write the values into it line by line.
+
+        See `format_interval` for the other options.
+        """
+        return format_intervals(
+            getattr(values, "seconds", values),
+            int_seconds=int_seconds,
+            precision=precision,
+            pad_hours=pad_hours,
+            file=file,
+        )
+
     def __repr__(self) -> str:
         return f"duration('{self!s}')"
 
     def __add__(self, other: "Duration") -> "Duration":
         if isinstance(other, Duration):
-            return Duration(self.seconds + other.seconds)
+            return Duration._from_seconds(self.seconds + other.seconds)
         return NotImplemented
 
     def __radd__(self, other: Any) -> "Duration":
         if other == 0:
             # Support sum
             return self
-        return other + self
+        return NotImplemented
 
     def __sub__(self, other: "Duration") -> "Duration":
         if isinstance(other, Duration):
-            return Duration(self.seconds - other.seconds)
+            return Duration._from_seconds(self.seconds - other.seconds)
         return NotImplemented
 
     def __mul__(self, other: Any) -> Any:
         if isinstance(other, (int, float)):
-            return Duration(self.seconds * other)
+            return Duration._from_seconds(self.seconds * other)
         if isinstance(other, Speed):
-            return Distance(km=self.seconds * other.km_h / 3600)
+            return Distance._from_km(self.seconds * other.km_h / 3600)
         return NotImplemented
 
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
-            return Duration(self.seconds / other)
+            return Duration._from_seconds(self.seconds / other)
         if isinstance(other, Distance):
-            return Pace(seconds_per_km=self.seconds / other.km)
+            return Pace._from_seconds_per_km(self.seconds / other.km)
         if isinstance(other, Pace):
-            return Distance(km=self.seconds / other.seconds_per_km)
+            return Distance._from_km(self.seconds / other.seconds_per_km)
         if isinstance(other, Duration):
             return self.seconds / other.seconds
         if isinstance(other, timedelta):
@@ -208,6 +488,10 @@ class Duration:
             return self.seconds == other.total_seconds()
         return NotImplemented
 
+    def __hash__(self) -> int:
+        # Must agree with the hash of equal timedeltas
+        return _timedelta_hash(self.seconds)
+
     def __lt__(self, other: object, /) -> bool:
         if isinstance(other, Duration):
             return self.seconds < other.seconds
@@ -216,10 +500,20 @@ class Duration:
         return NotImplemented
 
 
+_set_seconds = Duration.seconds.__set__  # type: ignore[attr-defined]
+
+
 @total_ordering
-class Pace:
+class Pace(_Quantity):
+    __slots__ = ("seconds_per_km",)
+
     seconds_per_km: float
 
+    _canonical_unit = "seconds_per_km"
+
+    # Shared instances of whole-second paces
+    _interned: ClassVar[dict[float, "Pace"]] = {}
+
     ALLOWED_UNITS = {
         "/km": "seconds_per_km",
         "/mi": "seconds_per_mile",
@@ -241,23 +535,94 @@ class Pace:
                 "Either seconds_per_mile or seconds_per_km should be provided"
             )
         elif seconds_per_km is not None:
-            self.seconds_per_km = seconds_per_km
+            _set_seconds_per_km(self, seconds_per_km)
         elif seconds_per_mile is not None:
-            self.seconds_per_km = seconds_per_mile / MILES_IN_KM
+            _set_seconds_per_km(self, seconds_per_mile / MILES_IN_KM)
         else:
             raise ValueError(
                 "Either seconds_per_mile or seconds_per_km should be provided"
             )
 
+    @classmethod
+    def _from_seconds_per_km(cls, seconds_per_km: float, /) -> Self:
+        """Create a new instance without any validation."""
+        obj = object.__new__(cls)
+        _set_seconds_per_km(obj, seconds_per_km)
+        return obj
+
+    _from_canonical = _from_seconds_per_km
+
+    @classmethod
+    def mean(
+        cls,
+        values: Iterable["Pace"] | "PaceArray",
+        /,
+        *,
+        weights: Optional[Iterable[Any]] = None,
+    ) -> Self:
+        """Average pace.
+
+        Paces over different distances cannot be averaged arithmetically.
+        With distances as weights, this is the distance-weighted mean,
+        with durations as weights, the time-weighted harmonic mean
+        (both being the total time over the total distance).
+        Without weights, equal distances are assumed.
+        """
+        kind, weight_values = _weights(weights)
+        return cls._from_seconds_per_km(
+            _mean(
+                _canonical_values(values, Pace, "seconds_per_km"),
+                weight_values,
+                harmonic=kind is Duration,
+            )
+        )
+
     @property
     def seconds_per_mile(self) -> float:
         return self.seconds_per_km * MILES_IN_KM
 
     def __str__(self) -> str:
-        if get_unit_system() == "imperial":
+        return self._format(get_unit_system())
+
+    def _format(self, unit_system: str, /) -> str:
+        if unit_system == "imperial":
             return format_interval(self.seconds_per_mile) + "/mi"
         return format_interval(self.seconds_per_km) + "/km"
 
+    @classmethod
+    def format_many(
+        cls,
+        values: Iterable[float],
+        /,
+        *,
+        int_seconds: bool = False,
+        precision: int = 1,
+        pad_hours: bool = False,
+        file: Optional[TextIO] = None,
+    ) -> Optional[list[str]]:
+        """Format many paces the same way as `str()`.
+
+        :param values: Paces in seconds per km or a PaceArray
+        :param file: If given, write the values into it line by line.
+
+        See `format_interval` for the other options.
+        """
+        values = getattr(values, "seconds_per_km", values)
+        suffix = "/km"
+        if get_unit_system() == "imperial":
+            if hasattr(values, "tolist"):
+                values = values.tolist()
+            values = [value * MILES_IN_KM for value in values]
+            suffix = "/mi"
+        return format_intervals(
+            values,
+            int_seconds=int_seconds,
+            precision=precision,
+            pad_hours=pad_hours,
+            suffix=suffix,
+            file=file,
+        )
+
     def __repr__(self) -> str:
         if get_unit_system() == "imperial":
             return f"Pace(seconds_per_mile={self.seconds_per_mile})"
@@ -265,25 +630,25 @@ class Pace:
 
     def __add__(self, other):
         if isinstance(other, Pace):
-            return Pace(seconds_per_km=self.seconds_per_km + other.seconds_per_km)
+            return Pace._from_seconds_per_km(self.seconds_per_km + other.seconds_per_km)
         return NotImplemented
 
     def __radd__(self, other: Any) -> "Pace":
         if other == 0:
             # Support sum
             return self
-        return other + self
+        return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, Pace):
-            return Pace(seconds_per_km=self.seconds_per_km - other.seconds_per_km)
+            return Pace._from_seconds_per_km(self.seconds_per_km - other.seconds_per_km)
         return NotImplemented
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Pace(seconds_per_km=self.seconds_per_km * other)
+            return Pace._from_seconds_per_km(self.seconds_per_km * other)
         if isinstance(other, Distance):
-            return Duration(self.seconds_per_km * other.km)
+            return Duration._from_seconds(self.seconds_per_km * other.km)
         else:
             return NotImplemented
 
@@ -292,7 +657,7 @@ class Pace:
 
     def __truediv__(self, other):
         if isinstance(other, (int, float)):
-            return Pace(seconds_per_km=self.seconds_per_km / other)
+            return Pace._from_seconds_per_km(self.seconds_per_km / other)
         if isinstance(other, Pace):
             return self.seconds_per_km / other.seconds_per_km
         return NotImplemented
@@ -307,6 +672,9 @@ class Pace:
             return self.seconds_per_km == other.seconds_per_km
         return NotImplemented
 
+    def __hash__(self) -> int:
+        return hash(self.seconds_per_km)
+
     def __lt__(self, other: object, /) -> bool:
         if isinstance(other, Pace):
             return self.seconds_per_km < other.seconds_per_km
@@ -314,21 +682,88 @@ class Pace:
 
     @classmethod
     def parse(cls, s: str, /) -> Self:
-        match = re.match(cls.PARSE_PATTERN, s)
+        default_unit = get_default_unit(cls)
+        if cache.cached_parse is not None:
+            return cache.cached_parse(cls, s, default_unit)
+        return cls._parse(s, default_unit)
+
+    @classmethod
+    def _parser(cls, unit_system: str, /) -> Callable[[str], Self]:
+        default_unit = get_default_unit(cls, unit_system)
+        cached_parse = cache.cached_parse
+        if cached_parse is not None:
+            return lambda s: cached_parse(cls, s, default_unit)
+        return partial(cls._parse, default_unit=default_unit)
+
+    @classmethod
+    def _parse(cls, s: str, default_unit: str) -> Self:
+        seconds_per_km = cls._parse_seconds_per_km(s, default_unit)
+        return cls._interned.get(seconds_per_km) or cls.intern(
+            cls._from_seconds_per_km(seconds_per_km)
+        )
+
+    @classmethod
+    def intern(cls, value: Self, /) -> Self:
+        """Shared instance for whole-second paces, the value itself otherwise.
+
+        Paces of whole seconds per km or per mile (up to an hour)
+        are registered on first use.
+        """
+        seconds_per_km = value.seconds_per_km
+        if (interned := cls._interned.get(seconds_per_km)) is not None:
+            return interned
+        seconds_per_mile = seconds_per_km * MILES_IN_KM
+        if 0 < seconds_per_km <= MAX_INTERNED_PACE_SECONDS and (
+            seconds_per_km % 1 == 0
+            # Conversion from miles is not always exact
+            or abs(seconds_per_mile - round(seconds_per_mile)) < 1e-9
+        ):
+            return cls._interned.setdefault(seconds_per_km, value)
+        return value
+
+    @classmethod
+    def _parse_seconds_per_km(cls, s: str, default_unit: str) -> float:
+        match = cls.PARSE_PATTERN.match(s)
         if not match:
             raise ValueError(f"Cannot parse as pace: {s}")
-        unit = cls.ALLOWED_UNITS.get(match.group("unit")) or get_default_unit(cls)
-        value = parse_interval(match.group("interval")).total_seconds()
-        return cls(**{unit: value})
+        unit = cls.ALLOWED_UNITS.get(match.group("unit")) or default_unit
+        value = parse_interval_seconds(match.group("interval"))
+        if unit == "seconds_per_mile":
+            return value / MILES_IN_KM
+        return value
+
+    @classmethod
+    def parse_values(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> array:
+        """Parse many strings into a flat buffer of seconds per km."""
+        parse = partial(cls._parse_seconds_per_km, default_unit=get_default_unit(cls))
+        return parse_many(parse, sources, errors=errors)
+
+    @classmethod
+    def parse_many(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> "PaceArray":
+        """Parse many strings into a pace array (requires numpy)."""
+        from py42195.arrays import PaceArray
+
+        return PaceArray._from_values(cls.parse_values(sources, errors=errors))
 
     def to_speed(self) -> "Speed":
-        return Speed(km_h=3600 / self.seconds_per_km)
+        return Speed._from_km_h(3600 / self.seconds_per_km)
+
+
+_set_seconds_per_km = Pace.seconds_per_km.__set__  # type: ignore[attr-defined]
 
 
 @total_ordering
-class Speed:
+class Speed(_Quantity):
+    __slots__ = ("km_h",)
+
     km_h: float
 
+    _canonical_unit = "km_h"
+
     ALLOWED_UNITS = {
         "kmh": "km_h",
         "km/h": "km_h",
@@ -347,26 +782,60 @@ class Speed:
         mph: Optional[float] = None,
         m_s: Optional[float] = None,
     ) -> None:
-        args_given = [
-            unit
-            for unit, val in locals().items()
-            if unit in self.ALLOWED_UNITS.values() and val is not None
-        ]
-        if len(args_given) != 1:
-            raise ValueError(
-                f"Exactly one of the following arguments should be provided: {', '.join(self.ALLOWED_UNITS)}, "
-                f"got {len(args_given)}: {', '.join(args_given)}"
-            )
+        if mph is m_s is None and km_h is not None:
+            value = km_h
+        else:
+            args_given = [
+                unit
+                for unit, val in (("km_h", km_h), ("mph", mph), ("m_s", m_s))
+                if val is not None
+            ]
+            if len(args_given) != 1:
+                raise ValueError(
+                    f"Exactly one of the following arguments should be provided: {', '.join(self.ALLOWED_UNITS)}, "
+                    f"got {len(args_given)}: {', '.join(args_given)}"
+                )
+            if mph is not None:
+                value = mph * MILES_IN_KM
+            else:
+                value = m_s * 3600 / 1000
+
+        if not isinstance(value, (int, float)):
+            raise ValueError("Speed should be a number.")
+        _set_km_h(self, value)
 
-        if km_h is not None:
-            self.km_h = km_h
-        elif mph is not None:
-            self.km_h = mph * MILES_IN_KM
-        elif m_s is not None:
-            self.km_h = m_s * 3600 / 1000
+    @classmethod
+    def _from_km_h(cls, km_h: float, /) -> Self:
+        """Create a new instance without any validation."""
+        obj = object.__new__(cls)
+        _set_km_h(obj, km_h)
+        return obj
 
-        if not isinstance(self.km_h, (int, float)):
-            raise ValueError("Speed should be a number.")
+    _from_canonical = _from_km_h
+
+    @classmethod
+    def mean(
+        cls,
+        values: Iterable["Speed"] | "SpeedArray",
+        /,
+        *,
+        weights: Optional[Iterable[Any]] = None,
+    ) -> Self:
+        """Average speed.
+
+        With durations as weights, this is the time-weighted mean,
+        with distances as weights, the distance-weighted harmonic mean
+        (both being the total distance over the total time).
+        Without weights, equal durations are assumed.
+        """
+        kind, weight_values = _weights(weights)
+        return cls._from_km_h(
+            _mean(
+                _canonical_values(values, Speed, "km_h"),
+                weight_values,
+                harmonic=kind is Distance,
+            )
+        )
 
     def __lt__(self, other: object, /) -> bool:
         if isinstance(other, Speed):
@@ -378,15 +847,48 @@ class Speed:
             return self.km_h == other.km_h
         return NotImplemented
 
+    def __hash__(self) -> int:
+        return hash(self.km_h)
+
     @classmethod
     def parse(cls, s: str) -> Self:
+        if cache.cached_parse is not None:
+            return cache.cached_parse(cls, s, None)
+        return cls._parse(s)
+
+    @classmethod
+    def _parse(cls, s: str, default_unit: Optional[str] = None) -> Self:
+        return cls._from_km_h(cls._parse_km_h(s))
+
+    @classmethod
+    def _parse_km_h(cls, s: str) -> float:
         # split into unit and value
         match = cls.PARSE_PATTERN.match(s)
         if match is None:
             raise ValueError(f"Cannot parse as speed: {s}")
         value = float(match.group("value"))
         unit = cls.ALLOWED_UNITS.get(match.group("unit")) or "km_h"
-        return cls(**{unit: value})
+        if unit == "mph":
+            return value * MILES_IN_KM
+        if unit == "m_s":
+            return value * 3600 / 1000
+        return value
+
+    @classmethod
+    def parse_values(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> array:
+        """Parse many strings into a flat buffer of km/h."""
+        return parse_many(cls._parse_km_h, sources, errors=errors)
+
+    @classmethod
+    def parse_many(
+        cls, sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+    ) -> "SpeedArray":
+        """Parse many strings into a speed array (requires numpy)."""
+        from py42195.arrays import SpeedArray
+
+        return SpeedArray._from_values(cls.parse_values(sources, errors=errors))
 
     @property
     def m_s(self) -> float:
@@ -397,13 +899,13 @@ class Speed:
         return self.km_h / MILES_IN_KM
 
     def to_pace(self) -> Pace:
-        return Pace(seconds_per_km=3600 / self.km_h)
+        return Pace._from_seconds_per_km(3600 / self.km_h)
 
     def __mul__(self, other):
         if isinstance(other, (int, float)):
-            return Speed(km_h=self.km_h * other)
+            return Speed._from_km_h(self.km_h * other)
         if isinstance(other, Duration):
-            return Distance(km=self.km_h * other.seconds / 3600)
+            return Distance._from_km(self.km_h * other.seconds / 3600)
         else:
             return NotImplemented
 
@@ -412,23 +914,23 @@ class Speed:
 
     def __add__(self, other, /):
         if isinstance(other, Speed):
-            return Speed(km_h=self.km_h + other.km_h)
+            return Speed._from_km_h(self.km_h + other.km_h)
         return NotImplemented
 
     def __radd__(self, other: Any) -> "Speed":
         if other == 0:
             # Support sum
             return self
-        return other + self
+        return NotImplemented
 
     def __sub__(self, other, /):
         if isinstance(other, Speed):
-            return Speed(km_h=self.km_h - other.km_h)
+            return Speed._from_km_h(self.km_h - other.km_h)
         return NotImplemented
 
     def __truediv__(self, other, /):
         if isinstance(other, (int, float)):
-            return Speed(km_h=self.km_h / other)
+            return Speed._from_km_h(self.km_h / other)
         if isinstance(other, Speed):
             return self.km_h / other.km_h
         return NotImplemented
@@ -436,10 +938,25 @@ class Speed:
     def __str__(self):
         return f"{self.km_h:.2f} km/h"
 
+    @classmethod
+    def format_many(
+        cls, values: Iterable[float], /, *, file: Optional[TextIO] = None
+    ) -> Optional[list[str]]:
+        """Format many speeds the same way as `str()`.
+
+        :param values: Speeds in km/h or a SpeedArray
+        :param file: If given, write the values into it line by line.
+        """
+        values = getattr(values, "km_h", values)
+        return format_many(lambda km_h: f"{km_h:.2f} km/h", values, file=file)
+
     def __repr__(self) -> str:
         return f"speed('{self!s}')"
 
 
+_set_km_h = Speed.km_h.__set__  # type: ignore[attr-defined]
+
+
 def pace(value: Any, **kwargs) -> Pace:
     if isinstance(value, str):
         if kwargs:
@@ -447,7 +964,7 @@ def pace(value: Any, **kwargs) -> Pace:
         return Pace.parse(value)
     else:
         default_unit = get_default_unit(Pace)
-        return Pace(**(kwargs | {default_unit: value}))
+        return Pace.intern(Pace(**(kwargs | {default_unit: value})))
 
 
 def duration(value: Any) -> Duration:
@@ -467,7 +984,7 @@ def distance(value: Any, **kwargs) -> Distance:
         return value
     else:
         default_unit = get_default_unit(Distance)
-        return Distance(**(kwargs | {default_unit: value}))
+        return Distance.intern(Distance(**(kwargs | {default_unit: value})))
 
 
 def speed(value: Any, **kwargs) -> Speed:
@@ -478,3 +995,48 @@ def speed(value: Any, **kwargs) -> Speed:
     else:
         default_unit = get_default_unit(Speed)
         return Speed(**(kwargs | {default_unit: value}))
+
+
+def _many(quantity: Any, values: Any, errors: ErrorPolicy) -> Any:
+    import numpy as np
+
+    from py42195.arrays import ARRAY_TYPES, QuantityArray
+
+    array_type = ARRAY_TYPES[quantity]
+    if isinstance(values, array_type):
+        return values
+    if isinstance(values, QuantityArray):
+        raise TypeError(
+            f"Cannot convert {type(values).__name__} to {array_type.__name__}"
+        )
+    items = values if isinstance(values, np.ndarray) else list(values)
+    if len(items) and isinstance(items[0], str):
+        return quantity.parse_many(items, errors=errors)
+    default_unit = get_default_unit(quantity)
+    if quantity is Duration:
+        return array_type(items)
+    return array_type(**{default_unit: items})
+
+
+def paces(values: Iterable[Any], *, errors: ErrorPolicy = "raise") -> "PaceArray":
+    """Construct a PaceArray from strings or numbers (in the default unit)."""
+    return _many(Pace, values, errors)
+
+
+def durations(
+    values: Iterable[Any], *, errors: ErrorPolicy = "raise"
+) -> "DurationArray":
+    """Construct a DurationArray from strings or numbers of seconds."""
+    return _many(Duration, values, errors)
+
+
+def distances(
+    values: Iterable[Any], *, errors: ErrorPolicy = "raise"
+) -> "DistanceArray":
+    """Construct a DistanceArray from strings or numbers (in the default unit)."""
+    return _many(Distance, values, errors)
+
+
+def speeds(values: Iterable[Any], *, errors: ErrorPolicy = "raise") -> "SpeedArray":
+    """Construct a SpeedArray from strings or numbers (in the default unit)."""
+    return _many(Speed, values, errors)
@@ -1,29 +1,88 @@
 import math
 import re
+from array import array
 from datetime import timedelta
+from functools import cache
+from typing import Callable, Iterable, Literal, Optional, TextIO
 
 INTERVAL_PATTERN = r"((?P<hour>\d+:)?(?P<minute>\d?\d:))?(?P<second>\d?\d(\.\d+)?)"
 
+# Same grammar as INTERVAL_PATTERN, with only the numbers captured
+# ("$" also accepts a final newline, as `re.match(f"^{INTERVAL_PATTERN}$", ...)`)
+_INTERVAL_SCANNER = re.compile(r"(?:(?:(\d+):)?(\d?\d):)?(\d?\d(?:\.\d+)?)$")
 
-def parse_interval(source: str, /) -> timedelta:
-    """Parse various intervals that can represent duration.
+ErrorPolicy = Literal["raise", "nan"] | list[int]
+"""What to do with invalid items in bulk parsing.
 
-    :param s: Interval in the "[hh]:[mm]:ss[.sss]" format
-    """
+- "raise": raise ValueError on the first invalid item
+- "nan": store NaN instead of the value
+- a list: store NaN and append the index of the item to the list
+"""
+
+
+def parse_interval_seconds(source: str, /) -> float:
+    """Parse an interval in the "[hh]:[mm]:ss[.sss]" format into seconds."""
     if not isinstance(source, str):
         raise TypeError(f"Expected string, got {type(source)}")
-    if not (match := re.match(f"^{INTERVAL_PATTERN}$", source)):
+    if not (match := _INTERVAL_SCANNER.match(source)):
         raise ValueError(f"Cannot parse as time: {source}")
 
-    h, m = (int(match[i][:-1]) if match[i] else 0 for i in ("hour", "minute"))
-    s = float(match["second"])
-
+    h_text, m_text, s_text = match.groups()
+    s = float(s_text)
+    if m_text is None:
+        return s
+    # Fields are only range-checked below a nonzero one (e.g. "0:75" is 1:15)
+    h = int(h_text) if h_text is not None else 0
+    m = int(m_text)
     if (h or m) and s >= 60:
         raise ValueError(f"Cannot parse as time: {source}")
     if h and m >= 60:
         raise ValueError(f"Cannot parse as time: {source}")
+    return h * 3600 + m * 60 + s
+
+
+def parse_interval(source: str, /) -> timedelta:
+    """Parse various intervals that can represent duration.
+
+    :param s: Interval in the "[hh]:[mm]:ss[.sss]" format
+    """
+    return timedelta(seconds=parse_interval_seconds(source))
+
+
+def parse_many(
+    parse: Callable[[str], float],
+    sources: Iterable[str],
+    /,
+    *,
+    errors: ErrorPolicy = "raise",
+) -> array:
+    """Apply a scalar parser to all sources, collecting the results in a float buffer.
+
+    :param parse: Function converting one string into a float
+    :param errors: See `ErrorPolicy`
+    """
+    collect = isinstance(errors, list)
+    if not collect and errors not in ("raise", "nan"):
+        raise ValueError(f"Invalid error policy: {errors}")
+    result = array("d")
+    append = result.append
+    for i, source in enumerate(sources):
+        try:
+            append(parse(source))
+        except (ValueError, TypeError):
+            if errors == "raise":
+                raise
+            if collect:
+                errors.append(i)  # type: ignore[union-attr]
+            append(math.nan)
+    return result
+
 
-    return timedelta(hours=h, minutes=m, seconds=s)
+def parse_intervals(
+    sources: Iterable[str], /, *, errors: ErrorPolicy = "raise"
+) -> array:
+    """Parse many intervals into a flat buffer of seconds."""
+    return parse_many(parse_interval_seconds, sources, errors=errors)
 
 
 def format_interval(
@@ -32,16 +91,92 @@ def format_interval(
     *,
     # TODO: Change into format?
     int_seconds: bool = False,
+    precision: int = 1,
+    pad_hours: bool = False,
 ) -> str:
+    """Format an interval as "[h:]mm:ss.s".
+
+    :param int_seconds: Truncate the seconds to whole numbers
+    :param precision: Number of decimal places of the seconds
+    :param pad_hours: Always show the hours, padded to two digits
+    """
     if isinstance(interval, timedelta):
         # TODO: Some other delta type?
         interval = interval.total_seconds()
-    if not math.isfinite(interval):
-        return "-"
-    m, s = divmod(interval, 60)
-    sec_text = str(int(s)) if int_seconds else f"{s:.1f}"
-    if m >= 60:
-        h, m = divmod(m, 60)
-        return f"{int(h)}:{'0' if m < 10 else ''}{int(m)}:{'0' if s < 10 else ''}{sec_text}"
-    else:
-        return f"{int(m)}:{'0' if s < 10 else ''}{sec_text}"
+    return _interval_formatter(int_seconds, precision, pad_hours)(interval)
+
+
+def format_intervals(
+    intervals: Iterable[float],
+    /,
+    *,
+    int_seconds: bool = False,
+    precision: int = 1,
+    pad_hours: bool = False,
+    suffix: str = "",
+    file: Optional[TextIO] = None,
+) -> Optional[list[str]]:
+    """Format many intervals (in seconds) at once.
+
+    The output is identical to calling `format_interval` on each of them.
+
+    :param suffix: Text appended to each of the values (e.g. "/km")
+    :param file: If given, the values are written into it, one per line,
+        instead of being returned as a list.
+    """
+    formatter = _interval_formatter(int_seconds, precision, pad_hours)
+    if suffix:
+        return format_many(
+            lambda value: formatter(value) + suffix, intervals, file=file
+        )
+    return format_many(formatter, intervals, file=file)
+
+
+def format_many(
+    format: Callable[[float], str],
+    values: Iterable[float],
+    /,
+    *,
+    file: Optional[TextIO] = None,
+) -> Optional[list[str]]:
+    """Apply a scalar formatter to all values.
+
+    :param file: If given, the values are written into it, one per line,
+        instead of being returned as a list.
+    """
+    if hasattr(values, "tolist"):
+        # Iterating over numpy arrays is much slower than over lists
+        values = values.tolist()
+    if file is None:
+        return [format(value) for value in values]
+    file.writelines(format(value) + "\n" for value in values)
+    return None
+
+
+@cache
+def _interval_formatter(
+    int_seconds: bool, precision: int, pad_hours: bool
+) -> Callable[[float], str]:
+    """Create a function formatting seconds with the given options."""
+    isfinite = math.isfinite
+    spec = f".{precision}f"
+    # Width of the seconds part with a leading zero
+    width = 2 if int_seconds or precision == 0 else precision + 3
+
+    def _format(interval: float, /) -> str:
+        if not isfinite(interval):
+            return "-"
+        if not int_seconds:
+            # Avoid seconds rounded up to "60"
+            interval = round(interval, precision)
+        m, s = divmod(interval, 60)
+        sec_text = (str(int(s)) if int_seconds else format(s, spec)).zfill(width)
+        if pad_hours:
+            h, m = divmod(m, 60)
+            return f"{int(h):02d}:{int(m):02d}:{sec_text}"
+        if m >= 60:
+            h, m = divmod(m, 60)
+            return f"{int(h)}:{int(m):02d}:{sec_text}"
+        return f"{int(m)}:{sec_text}"
+
+    return _format
@@ -0,0 +1,261 @@
+"""Training zones: classification of pace (or speed) streams and time in zone.
+
+Zones are contiguous ranges of pace or speed, from the easiest to the hardest,
+given by their boundaries, parsed from ranges using the usual grammar,
+or relative to a threshold pace:
+
+>>> from py42195.zones import Zones
+>>> zones = Zones.parse({"easy": "5:30-4:50/km", "steady": "4:50-4:25/km", "tempo": "4:25-4:10/km"})
+>>> zones = Zones.relative(pace("4:15"), [1.29, 1.14, 1.06, 1.0, 0.97])
+>>> zones.totals(distances, elapsed)
+{'Z1': ZoneTotal(duration=duration('42:10.0'), distance=distance('7.85 km')), ...}
+
+Samples are binned by binary search over the sorted boundaries,
+all at once (requires numpy).
+"""
+
+import re
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "Training zones require numpy, install it with `pip install py42195[numpy]`."
+    ) from exc
+
+from py42195.arrays import DistanceArray, DurationArray, PaceArray, SpeedArray
+from py42195.tracks import _canonical_query
+from py42195.types import Distance, Duration, Pace, Speed
+
+RANGE_PATTERN = re.compile(
+    r"^\s*(?P<low>[\d:.]+)\s*[-–]\s*(?P<high>[\d:.]+)(?P<unit>.*)$"
+)
+"""Range of paces or speeds, e.g. "4:10-4:25/km" or "12–14 km/h"."""
+
+
+class ZoneTotal(NamedTuple):
+    """Time and distance spent in a zone."""
+
+    duration: Duration
+    distance: Distance
+
+
+def _parse_value(s: str) -> Pace | Speed:
+    """Pace if it has minutes and seconds, speed otherwise."""
+    return Pace.parse(s) if ":" in s else Speed.parse(s)
+
+
+def parse_range(s: str, /) -> tuple[Pace | Speed, Pace | Speed]:
+    """Parse a range of paces or speeds, the unit written once at the end."""
+    match = RANGE_PATTERN.match(s)
+    if not match:
+        raise ValueError(f"Invalid range: {s}")
+    unit = match["unit"]
+    low = _parse_value(match["low"] + unit)
+    high = _parse_value(match["high"] + unit)
+    return low, high
+
+
+def _km_h(value: Any) -> float:
+    if isinstance(value, Pace):
+        return 3600 / value.seconds_per_km
+    if isinstance(value, Speed):
+        return value.km_h
+    raise TypeError(f"Expected Pace or Speed, got {type(value)}")
+
+
+class Zones:
+    """Contiguous training zones, from the slowest to the fastest."""
+
+    __slots__ = ("names", "quantity", "_edges")
+
+    names: list[str]
+    quantity: type
+    """Pace or Speed, the type of the boundaries."""
+
+    def __init__(
+        self,
+        boundaries: Iterable[Pace] | Iterable[Speed],
+        /,
+        names: Optional[Sequence[str]] = None,
+    ):
+        """
+        :param boundaries: Boundaries of the zones (one more than the zones), in any order
+        :param names: Names from the slowest zone, by default "Z1", "Z2", ...
+        """
+        boundaries = list(boundaries)
+        if len(boundaries) < 2:
+            raise ValueError("At least two boundaries needed")
+        self.quantity = Pace if isinstance(boundaries[0], Pace) else Speed
+        # Speeds (km/h) are binned, stopped samples have a speed of 0
+        edges = np.sort([_km_h(boundary) for boundary in boundaries])
+        if (np.diff(edges) <= 0).any():
+            raise ValueError("Zone boundaries must be distinct")
+        if names is None:
+            names = [f"Z{i}" for i in range(1, len(edges))]
+        if len(names) != len(edges) - 1:
+            raise ValueError(
+                f"Expected {len(edges) - 1} names for {len(edges)} boundaries, got {len(names)}"
+            )
+        self.names = list(names)
+        self._edges = edges
+
+    @classmethod
+    def parse(cls, ranges: Mapping[str, str] | Iterable[str], /) -> "Zones":
+        """Zones from ranges, e.g. {"tempo": "4:25-4:10/km", ...} or ["12-14 km/h", ...].
+
+        The ranges can be given in any order, but they must be contiguous.
+        """
+        if isinstance(ranges, Mapping):
+            names: Optional[list[str]] = list(ranges)
+            sources = list(ranges.values())
+        else:
+            names = None
+            sources = list(ranges)
+        if not sources:
+            raise ValueError("No zones")
+        parsed = [sorted(map(_km_h, parse_range(source))) for source in sources]
+        order = sorted(range(len(parsed)), key=lambda i: parsed[i][0])
+        for previous, current in zip(order, order[1:]):
+            if not np.isclose(parsed[previous][1], parsed[current][0]):
+                raise ValueError(
+                    f"Zones must be contiguous: {sources[previous]}, {sources[current]}"
+                )
+        quantity = type(parse_range(sources[0])[0])
+        edges = [parsed[order[0]][0]] + [parsed[i][1] for i in order]
+        boundaries = [
+            Pace._from_seconds_per_km(3600 / edge)
+            if quantity is Pace
+            else Speed._from_km_h(edge)
+            for edge in edges
+        ]
+        return cls(boundaries, [names[i] for i in order] if names else None)
+
+    @classmethod
+    def relative(
+        cls,
+        threshold: Pace | Speed,
+        fractions: Iterable[float],
+        /,
+        names: Optional[Sequence[str]] = None,
+    ) -> "Zones":
+        """Zones with boundaries relative to a threshold.
+
+        :param fractions: Multiples of the threshold pace (or speed),
+            e.g. 1.06 for 6 % slower than the threshold pace
+        """
+        return cls([threshold * fraction for fraction in fractions], names)
+
+    @property
+    def boundaries(self) -> list[Pace] | list[Speed]:
+        """Boundaries from the slowest."""
+        if self.quantity is Pace:
+            return [Pace._from_seconds_per_km(3600 / edge) for edge in self._edges]
+        return [Speed._from_km_h(edge) for edge in self._edges]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[tuple[str, Any, Any]]:
+        """Names and bounds (from the slower one) of the zones."""
+        boundaries = self.boundaries
+        return iter(zip(self.names, boundaries, boundaries[1:]))
+
+    def __repr__(self) -> str:
+        zones = ", ".join(f"{name}: {low}-{high}" for name, low, high in self)
+        return f"Zones({zones})"
+
+    def _bins(self, km_h: np.ndarray) -> np.ndarray:
+        # edges[i] <= speed < edges[i + 1] -> i, -1 outside of all zones
+        bins = np.searchsorted(self._edges, km_h, side="right") - 1
+        return np.where((bins >= 0) & (bins < len(self)), bins, -1)
+
+    def classify(self, values: PaceArray | SpeedArray | Iterable[Any], /) -> np.ndarray:
+        """Index of the zone of every value (-1 if outside of all zones)."""
+        if isinstance(values, SpeedArray):
+            km_h = values.km_h
+        elif isinstance(values, PaceArray):
+            with np.errstate(divide="ignore"):
+                km_h = 3600 / values.seconds_per_km
+        else:
+            km_h = np.fromiter((_km_h(value) for value in values), np.float64)
+        return self._bins(km_h)
+
+    def zone(self, value: Pace | Speed, /) -> Optional[str]:
+        """Name of the zone of a single value (None if outside of all zones)."""
+        i = int(self._bins(np.float64(_km_h(value))))
+        return None if i < 0 else self.names[i]
+
+    def _segments(
+        self, distances: Any, elapsed: Any
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Zones, distances and durations of the segments between samples."""
+        _, km = _canonical_query(distances, Distance)
+        _, seconds = _canonical_query(elapsed, Duration)
+        if km.shape != seconds.shape:
+            raise ValueError(
+                f"Different number of distances and times: {len(km)} != {len(seconds)}"
+            )
+        dkm = np.diff(km.ravel())
+        dseconds = np.diff(seconds.ravel())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            km_h = np.nan_to_num(dkm / dseconds * 3600, nan=0.0)
+        return self._bins(km_h), dkm, dseconds
+
+    def totals(
+        self,
+        distances: DistanceArray | Iterable[Distance],
+        elapsed: DurationArray | Iterable[Duration],
+        /,
+    ) -> dict[str, ZoneTotal]:
+        """Time and distance in every zone.
+
+        Each segment between two samples is classified by its average speed.
+        """
+        bins, dkm, dseconds = self._segments(distances, elapsed)
+        inside = bins >= 0
+        seconds = np.bincount(bins[inside], dseconds[inside], minlength=len(self))
+        km = np.bincount(bins[inside], dkm[inside], minlength=len(self))
+        return {
+            name: ZoneTotal(
+                Duration._from_seconds(float(seconds[i])),
+                Distance._from_km(float(km[i])),
+            )
+            for i, name in enumerate(self.names)
+        }
+
+    def totals_many(
+        self, activities: Iterable[tuple[Any, Any]], /
+    ) -> tuple[DurationArray, DistanceArray]:
+        """Time and distance in every zone for many activities at once.
+
+        :param activities: Pairs of cumulative distances and elapsed times
+        :return: Durations and distances (activities × zones)
+        """
+        segments = [
+            self._segments(distances, elapsed) for distances, elapsed in activities
+        ]
+        zones = len(self)
+        if not segments:
+            return (
+                DurationArray._from_values(np.zeros((0, zones))),
+                DistanceArray._from_values(np.zeros((0, zones))),
+            )
+        # Single binning of all segments, by (activity, zone)
+        bins = np.concatenate(
+            [
+                np.where(bins >= 0, bins + i * zones, -1)
+                for i, (bins, _, _) in enumerate(segments)
+            ]
+        )
+        dkm = np.concatenate([dkm for _, dkm, _ in segments])
+        dseconds = np.concatenate([dseconds for _, _, dseconds in segments])
+        inside = bins >= 0
+        size = len(segments) * zones
+        seconds = np.bincount(bins[inside], dseconds[inside], minlength=size)
+        km = np.bincount(bins[inside], dkm[inside], minlength=size)
+        return (
+            DurationArray._from_values(seconds.reshape(-1, zones)),
+            DistanceArray._from_values(km.reshape(-1, zones)),
+        )
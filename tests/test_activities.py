@@ -0,0 +1,117 @@
+import io
+
+import pytest
+
+from py42195.activities import (
+    haversine,
+    read_activity,
+    read_chunks,
+    read_csv,
+    read_gpx,
+    read_tcx,
+)
+from py42195.types import Distance, Duration
+
+GPX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="test" xmlns="http://www.topografix.com/GPX/1/1">
+  <metadata><time>2024-05-01T07:00:00Z</time></metadata>
+  <trk>
+    <name>Morning run</name>
+    <trkseg>
+      <trkpt lat="50.0" lon="14.0"><ele>200.0</ele><time>2024-05-01T08:00:00Z</time></trkpt>
+      <trkpt lat="50.001" lon="14.0"><ele>201.5</ele><time>2024-05-01T08:00:30Z</time></trkpt>
+      <trkpt lat="50.002" lon="14.0"><time>2024-05-01T08:01:00Z</time></trkpt>
+    </trkseg>
+  </trk>
+</gpx>
+"""
+
+TCX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/TrainingCenterDatabase/v2">
+  <Activities><Activity Sport="Running"><Lap StartTime="2024-05-01T08:00:00Z">
+    <DistanceMeters>1000</DistanceMeters>
+    <Track>
+      <Trackpoint>
+        <Time>2024-05-01T08:00:00Z</Time>
+        <Position><LatitudeDegrees>50.0</LatitudeDegrees><LongitudeDegrees>14.0</LongitudeDegrees></Position>
+        <AltitudeMeters>200</AltitudeMeters>
+        <DistanceMeters>0</DistanceMeters>
+      </Trackpoint>
+      <Trackpoint>
+        <Time>2024-05-01T08:04:00Z</Time>
+        <Position><LatitudeDegrees>50.01</LatitudeDegrees><LongitudeDegrees>14.0</LongitudeDegrees></Position>
+        <DistanceMeters>1000</DistanceMeters>
+      </Trackpoint>
+    </Track>
+  </Lap></Activity></Activities>
+</TrainingCenterDatabase>
+"""
+
+
+def test_haversine():
+    # One degree of latitude
+    assert haversine(50, 14, 51, 14) == pytest.approx(111.2, abs=0.1)
+    assert haversine(50, 14, 50, 14) == 0
+
+
+class TestGpx:
+    def test_samples(self):
+        samples = list(read_gpx(io.BytesIO(GPX)))
+        assert len(samples) == 3
+        assert samples[0].distance == Distance(km=0)
+        assert samples[1].elapsed == Duration(30)
+        assert samples[2].distance.km == pytest.approx(0.2224, abs=0.0001)
+        assert samples[1].elevation == 201.5
+        assert samples[2].elevation is None
+
+    def test_format_from_file_name(self, tmp_path):
+        path = tmp_path / "run.gpx"
+        path.write_bytes(GPX)
+        assert len(list(read_activity(path))) == 3
+
+    def test_is_lazy(self):
+        samples = read_gpx(io.BytesIO(GPX))
+        assert next(samples).elapsed == Duration(0)
+
+
+class TestTcx:
+    def test_uses_device_distance(self):
+        samples = list(read_tcx(io.BytesIO(TCX)))
+        assert [s.distance for s in samples] == [Distance(km=0), Distance(km=1)]
+        assert samples[1].elapsed == Duration(240)
+        assert samples[0].elevation == 200
+
+
+class TestCsv:
+    def test_distance_and_intervals(self):
+        source = io.StringIO("time,distance,ele\n0,0,100\n4:07,1 km,105\n8:30,2\n")
+        samples = list(read_csv(source))
+        assert [s.elapsed for s in samples] == [
+            Duration(0),
+            Duration(247),
+            Duration(510),
+        ]
+        assert samples[2].distance == Distance(km=2)
+        assert samples[1].elevation == 105
+
+    def test_coordinates_and_timestamps(self):
+        source = io.StringIO(
+            "time,lat,lon\n2024-05-01T08:00:00+00:00,50,14\n2024-05-01T08:10:00+00:00,50.01,14\n"
+        )
+        samples = list(read_csv(source))
+        assert samples[1].elapsed == Duration(600)
+        assert samples[1].distance.km == pytest.approx(1.112, abs=0.001)
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        list(read_activity(io.BytesIO(GPX), format="fit"))
+
+
+def test_chunks():
+    pytest.importorskip("numpy")
+    chunks = list(read_chunks(io.BytesIO(GPX), format="gpx", size=2))
+    assert [len(distances) for distances, _, _ in chunks] == [2, 1]
+    distances, durations, elevations = chunks[0]
+    assert durations.seconds.tolist() == [0, 30]
+    assert elevations.tolist() == [200, 201.5]
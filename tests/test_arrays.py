@@ -0,0 +1,205 @@
+from datetime import timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py42195.arrays import DistanceArray, DurationArray, PaceArray, SpeedArray
+from py42195.config import IMPERIAL, set_unit_system
+from py42195.types import (
+    Distance,
+    Duration,
+    Pace,
+    Speed,
+    distances,
+    duration,
+    durations,
+    pace,
+    paces,
+    speeds,
+)
+
+
+class TestConstruction:
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"km": [1, 2]}, [1, 2]),
+            ({"m": [500, 1500]}, [0.5, 1.5]),
+            ({"mi": [1]}, [1.609344]),
+            ({"yd": [1760]}, [1.609344]),
+            ({"ft": [1000]}, [0.3048]),
+        ],
+    )
+    def test_distance_units(self, kwargs, expected):
+        assert DistanceArray(**kwargs).km == pytest.approx(expected)
+
+    @pytest.mark.parametrize("kwargs", [{}, {"km": [1], "m": [2]}])
+    def test_distance_invalid_args(self, kwargs):
+        with pytest.raises(ValueError):
+            DistanceArray(**kwargs)
+
+    def test_duration_from_timedelta64(self):
+        values = np.array([90, 120], dtype="timedelta64[s]")
+        assert DurationArray(values).seconds.tolist() == [90.0, 120.0]
+
+    def test_pace_per_mile(self):
+        paces = PaceArray(seconds_per_mile=[1609.344])
+        assert paces.seconds_per_km == pytest.approx([1000])
+
+    def test_speed_units(self):
+        assert SpeedArray(m_s=[5]).km_h == pytest.approx([18])
+        assert SpeedArray(mph=[10]).km_h == pytest.approx([16.09344])
+
+    def test_from_scalars(self):
+        paces = PaceArray.from_scalars([pace("4:00"), pace("5:00")])
+        assert paces.seconds_per_km.tolist() == [240, 300]
+
+
+class TestAccess:
+    def test_getitem_returns_scalar(self):
+        distances = DistanceArray(km=[1, 2, 3])
+        assert distances[1] == Distance(km=2)
+        assert isinstance(distances[1:], DistanceArray)
+        assert len(distances[1:]) == 2
+
+    def test_iter(self):
+        assert list(DurationArray([1, 2])) == [Duration(1), Duration(2)]
+
+    def test_iter_2d(self):
+        matrix = DurationArray._from_values(np.array([[1.0, 2.0], [3.0, 4.0]]))
+        rows = list(matrix)
+        assert len(rows) == len(matrix) == 2
+        assert isinstance(rows[1], DurationArray)
+        assert rows[1].seconds.tolist() == [3.0, 4.0]
+        assert [list(row) for row in matrix] == [
+            [Duration(1), Duration(2)],
+            [Duration(3), Duration(4)],
+        ]
+
+    def test_repr_imperial(self):
+        with set_unit_system(IMPERIAL):
+            assert repr(DistanceArray(mi=[1])).startswith("DistanceArray(mi=")
+
+
+class TestArithmetics:
+    def test_pace_times_distance(self):
+        distances = DistanceArray(km=[1, 10, 42.195])
+        result = pace("4:00") * distances
+        assert isinstance(result, DurationArray)
+        assert result.seconds == pytest.approx([240, 2400, 240 * 42.195])
+        assert (distances * pace("4:00")).seconds == pytest.approx(result.seconds)
+
+    def test_duration_by_distance(self):
+        durations = DurationArray([240, 600])
+        result = durations / Distance(km=2)
+        assert isinstance(result, PaceArray)
+        assert result.seconds_per_km.tolist() == [120, 300]
+
+    def test_scalar_duration_by_distances(self):
+        result = duration("1:00:00") / DistanceArray(km=[10, 12])
+        assert result.seconds_per_km.tolist() == [360, 300]
+
+    def test_speed_times_duration(self):
+        result = SpeedArray(km_h=[10, 12]) * Duration(1800)
+        assert isinstance(result, DistanceArray)
+        assert result.km.tolist() == [5, 6]
+
+    def test_distance_by_duration(self):
+        result = DistanceArray(km=[10]) / DurationArray([3600])
+        assert isinstance(result, SpeedArray)
+        assert result.km_h.tolist() == [10]
+
+    def test_distance_by_speed(self):
+        result = DistanceArray(km=[10]) / Speed(km_h=20)
+        assert result.seconds.tolist() == [1800]
+
+    def test_same_type_ratio(self):
+        result = DistanceArray(km=[2, 4]) / Distance(km=2)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [1, 2]
+
+    def test_add_with_timedelta(self):
+        result = DurationArray([1, 2]) + timedelta(seconds=1)
+        assert result.seconds.tolist() == [2, 3]
+
+    def test_numbers(self):
+        distances = DistanceArray(km=[1, 2])
+        assert (2 * distances).km.tolist() == [2, 4]
+        assert (distances / 2).km.tolist() == [0.5, 1]
+        assert (np.array([1, 2]) * distances).km.tolist() == [1, 4]
+
+    def test_sum(self):
+        result = sum([DistanceArray(km=[1, 2]), DistanceArray(km=[3, 4])])
+        assert result.km.tolist() == [4, 6]
+
+    def test_incompatible(self):
+        with pytest.raises(TypeError):
+            DistanceArray(km=[1]) + Duration(1)
+        with pytest.raises(TypeError):
+            DistanceArray(km=[1]) * Distance(km=1)
+
+    def test_comparison(self):
+        paces = PaceArray(seconds_per_km=[230, 240, 250])
+        assert (paces < pace("4:00")).tolist() == [True, False, False]
+        assert (paces == pace("4:00")).tolist() == [False, True, False]
+
+    def test_to_speed_and_back(self):
+        paces = PaceArray(seconds_per_km=[240, 360])
+        speeds = paces.to_speed()
+        assert speeds.km_h == pytest.approx([15, 10])
+        assert speeds.to_pace().seconds_per_km == pytest.approx([240, 360])
+
+    def test_matches_scalars(self):
+        paces = PaceArray(seconds_per_km=[240.5, 301])
+        distances = DistanceArray(km=[5, 21.0975])
+        expected = [p * d for p, d in zip(paces, distances)]
+        assert list(paces * distances) == expected
+
+
+class TestParseMany:
+    def test_duration(self):
+        result = Duration.parse_many(["1:26:51", "4:07"])
+        assert isinstance(result, DurationArray)
+        assert result.seconds.tolist() == [5211, 247]
+
+    def test_pace_errors(self):
+        bad_rows = []
+        result = Pace.parse_many(["4:07/km", "fast", "4:00/mi"], errors=bad_rows)
+        assert isinstance(result, PaceArray)
+        assert bad_rows == [1]
+        assert np.isnan(result.seconds_per_km[1])
+
+    def test_distance_and_speed(self):
+        assert Distance.parse_many(["10 km", "1 mi"]).km == pytest.approx(
+            [10, 1.609344]
+        )
+        assert Speed.parse_many(["10", "5 m/s"]).km_h == pytest.approx([10, 18])
+
+
+class TestHelpers:
+    def test_from_strings(self):
+        assert paces(["4:00", "5:00"]).seconds_per_km.tolist() == [240, 300]
+        assert durations(np.array(["1:00", "2:00"])).seconds.tolist() == [60, 120]
+
+    def test_from_numbers_uses_default_unit(self):
+        with set_unit_system(IMPERIAL):
+            assert distances([1]).km == pytest.approx([1.609344])
+        assert speeds([10]).km_h.tolist() == [10]
+
+    def test_passthrough(self):
+        values = DurationArray([1])
+        assert durations(values) is values
+        with pytest.raises(TypeError):
+            durations(DistanceArray(km=[1]))
+
+
+class TestToStrings:
+    def test_pace(self):
+        paces = PaceArray(seconds_per_km=[240, 247.5])
+        assert paces.to_strings() == [str(p) for p in paces]
+
+    def test_imperial_distance(self):
+        distances = DistanceArray(km=[1, 42.195])
+        with set_unit_system(IMPERIAL):
+            assert distances.to_strings() == [str(d) for d in distances]
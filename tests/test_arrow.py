@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pa = pytest.importorskip("pyarrow")
+
+from py42195.arrays import DistanceArray, DurationArray, PaceArray, SpeedArray
+from py42195.arrow import (
+    DurationType,
+    PaceType,
+    from_arrow,
+    read_feather,
+    read_parquet,
+    to_arrow,
+    write_feather,
+    write_parquet,
+)
+from py42195.types import Distance, Pace
+
+
+class TestConversion:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            DistanceArray(km=[1, 2.5]),
+            DurationArray([60, 7200]),
+            PaceArray(seconds_per_km=[240, 250]),
+            SpeedArray(km_h=[10, 12]),
+        ],
+    )
+    def test_round_trip_without_copy(self, values):
+        array = to_arrow(values)
+        result = from_arrow(array)
+        assert type(result) is type(values)
+        assert np.shares_memory(result._values, values._values)
+
+    def test_type_and_metadata(self):
+        array = to_arrow(PaceArray(seconds_per_km=[240]))
+        assert array.type == PaceType()
+        assert array.type.extension_name == "py42195.pace"
+        assert json.loads(array.type.__arrow_ext_serialize__()) == {
+            "unit": "seconds_per_km"
+        }
+
+    def test_scalar(self):
+        assert to_arrow(DistanceArray(km=[5]))[0].as_py() == Distance(km=5)
+
+    def test_nulls_become_nan(self):
+        storage = pa.array([240.0, None])
+        array = pa.ExtensionArray.from_storage(PaceType(), storage)
+        assert np.isnan(from_arrow(array).seconds_per_km[1])
+
+    def test_wrong_type(self):
+        with pytest.raises(TypeError):
+            from_arrow(pa.array([1.0]))
+
+    def test_unit_mismatch(self):
+        with pytest.raises(ValueError):
+            DurationType.__arrow_ext_deserialize__(pa.float64(), b'{"unit": "ms"}')
+
+
+class TestFiles:
+    def test_parquet(self, tmp_path):
+        path = tmp_path / "splits.parquet"
+        write_parquet(
+            {"pace": PaceArray(seconds_per_km=[240, 250]), "bib": [1, 2]}, path
+        )
+        columns = read_parquet(path)
+        assert isinstance(columns["pace"], PaceArray)
+        assert columns["pace"][1] == Pace(seconds_per_km=250)
+        assert columns["bib"].to_pylist() == [1, 2]
+
+    def test_feather_is_memory_mapped(self, tmp_path):
+        path = tmp_path / "splits.arrow"
+        write_feather({"time": DurationArray([60.0, 120.0])}, path)
+        columns = read_feather(path)
+        assert columns["time"].seconds.tolist() == [60, 120]
+        assert not columns["time"].seconds.flags.owndata
+
+
+class TestPandas:
+    def test_parquet_round_trip(self, tmp_path):
+        pd = pytest.importorskip("pandas")
+        import py42195.pandas  # noqa: F401
+
+        path = tmp_path / "results.parquet"
+        df = pd.DataFrame({"pace": pd.Series(["4:07", "5:00"], dtype="pace")})
+        df.to_parquet(path)
+        result = pd.read_parquet(path)
+        assert result["pace"].dtype == "pace"
+        assert result["pace"].equals(df["pace"])
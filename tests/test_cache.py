@@ -0,0 +1,66 @@
+import pytest
+
+from py42195.cache import (
+    clear_parse_cache,
+    disable_parse_cache,
+    enable_parse_cache,
+    parse_cache_info,
+)
+from py42195.config import IMPERIAL, set_unit_system
+from py42195.types import Distance, Duration, Pace, Speed, duration, pace
+
+
+@pytest.fixture(autouse=True)
+def parse_cache():
+    enable_parse_cache(maxsize=2)
+    yield
+    disable_parse_cache()
+
+
+def test_disabled():
+    disable_parse_cache()
+    assert parse_cache_info() is None
+    assert Pace.parse("4:00") == pace("4:00")
+
+
+def test_hits_and_misses():
+    first = duration("1:26:51.1")
+    second = Duration.parse("1:26:51.1")
+    assert first is second
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 2, 1)
+
+
+def test_lru_eviction():
+    Distance.parse("10 km")
+    Speed.parse("12")
+    Distance.parse("10 km")
+    Pace.parse("4:00")  # evicts the speed
+    Speed.parse("12")
+    assert parse_cache_info().misses == 4
+
+
+def test_unit_system_is_part_of_key():
+    metric = Pace.parse("4:00.5")
+    with set_unit_system(IMPERIAL):
+        imperial = Pace.parse("4:00.5")
+    assert metric.seconds_per_km == pytest.approx(240.5)
+    assert imperial.seconds_per_mile == pytest.approx(240.5)
+
+
+def test_errors_are_not_cached():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            Pace.parse("fast")
+    assert parse_cache_info().currsize == 0
+
+
+def test_clear():
+    Pace.parse("4:00")
+    clear_parse_cache()
+    assert parse_cache_info().currsize == 0
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        enable_parse_cache(maxsize=0)
@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from py42195.cli import convert, main, parse_operand
+from py42195.types import Distance, Duration, Pace, Speed
+
+
+@pytest.fixture
+def run_cli(monkeypatch, capsys):
+    def _run(stdin: str, *args: str) -> tuple[int, str, str]:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+        code = main(list(args))
+        captured = capsys.readouterr()
+        return code, captured.out, captured.err
+
+    return _run
+
+
+class TestParseOperand:
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("2", 2.0),
+            ("10 mi", Distance(mi=10)),
+            ("13.1 mph", Speed(mph=13.1)),
+            ("4:07/km", Pace(seconds_per_km=247)),
+            ("1:30:00", Duration(5400)),
+        ],
+    )
+    def test_valid(self, source, expected):
+        assert parse_operand(source) == expected
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_operand("fast")
+
+
+class TestConvert:
+    def test_steps(self):
+        assert convert(["4:00", "5:00"], "pace", ["* 10 km", "/ 2"]) == [
+            "20:00.0",
+            "25:00.0",
+        ]
+
+    def test_unit_system(self):
+        assert convert(["12 km/h"], "speed", ["to-pace"], unit_system="imperial") == [
+            "8:02.8/mi"
+        ]
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="^1: "):
+            convert(["4:00", "abc"], "pace", [])
+        assert convert(["4:00", "abc"], "pace", [], errors="empty") == ["4:00.0/km", ""]
+
+
+class TestMain:
+    def test_lines(self, run_cli):
+        code, out, _ = run_cli("4:07\n5:00/mi\n\n", "pace", "* 42.195 km")
+        assert code == 0
+        assert out == "2:53:42.2\n2:11:05.6\n\n"
+
+    def test_ratio(self, run_cli):
+        _, out, _ = run_cli("10 km\n", "distance", "/ 5 km")
+        assert out == "2.0\n"
+
+    def test_csv(self, run_cli):
+        code, out, _ = run_cli(
+            "name,pace\nA,4:07\nB,5:30\n",
+            "--csv",
+            "--column",
+            "pace",
+            "pace",
+            "* 10 mi",
+        )
+        assert code == 0
+        assert out == "name,pace,result\nA,4:07,1:06:15.1\nB,5:30,1:28:30.8\n"
+
+    def test_chunks_and_jobs(self, run_cli):
+        stdin = "".join(f"{3 + i % 3}:{i % 60:02d}\n" for i in range(100))
+        _, expected, _ = run_cli(stdin, "pace", "to-speed")
+        _, out, _ = run_cli(
+            stdin, "--chunk-size", "7", "--jobs", "2", "pace", "to-speed"
+        )
+        assert out == expected
+        assert len(out.splitlines()) == 100
+
+    def test_invalid_value(self, run_cli):
+        code, _, err = run_cli("4:00\n" * 10 + "abc\n", "--chunk-size", "3", "pace")
+        assert code == 1
+        assert "value 11" in err
+
+    def test_incompatible_step(self, run_cli):
+        code, _, err = run_cli("4:00\n", "pace", "+ 10 km")
+        assert code == 1
+        assert "error" in err
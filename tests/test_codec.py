@@ -0,0 +1,97 @@
+import math
+import pickle
+
+import pytest
+
+from py42195 import Distance, Duration, Pace, Speed, duration, pace
+from py42195.codec import (
+    HEADER,
+    SCALAR,
+    QuantityView,
+    decode,
+    encode,
+    from_bytes,
+    to_bytes,
+)
+
+VALUES = [
+    Distance(km=42.195),
+    Duration(1 / 3),
+    Pace(seconds_per_mile=487.123456789),
+    Speed(m_s=5.5),
+    Duration(math.inf),
+]
+
+
+class TestScalar:
+    @pytest.mark.parametrize("value", VALUES)
+    def test_roundtrip(self, value):
+        data = encode(value)
+        assert len(data) == SCALAR.size == 9
+        decoded = decode(data)
+        assert type(decoded) is type(value)
+        assert decoded.__getstate__() == value.__getstate__()
+
+    def test_unknown_tag(self):
+        with pytest.raises(ValueError):
+            decode(b"\x09" + bytes(8))
+
+    def test_not_a_quantity(self):
+        with pytest.raises(TypeError):
+            encode(3.0)
+
+
+class TestBulk:
+    def test_roundtrip(self):
+        values = [Pace(seconds_per_km=200 + i / 7) for i in range(100)]
+        data = to_bytes(values)
+        assert len(data) == HEADER.size + 8 * 100
+        view = from_bytes(data)
+        assert isinstance(view, QuantityView)
+        assert view.quantity is Pace
+        assert list(view) == values
+
+    def test_zero_copy(self):
+        data = bytearray(to_bytes([duration("1:00"), duration("2:00")]))
+        view = from_bytes(data)
+        data[HEADER.size : HEADER.size + 8] = bytes(8)
+        assert view[0] == Duration(0)
+
+    def test_slice(self):
+        view = from_bytes(to_bytes([Duration(i) for i in range(10)]))
+        assert list(view[2:4]) == [Duration(2), Duration(3)]
+        assert view[-1] == Duration(9)
+
+    def test_empty(self):
+        with pytest.raises(TypeError):
+            to_bytes([])
+        assert len(from_bytes(to_bytes([], quantity=Pace))) == 0
+
+    def test_mixed_types(self):
+        with pytest.raises(TypeError):
+            to_bytes([pace("4:00"), duration("4:00")])
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"XX\x01\x00\x00\x00\x00\x00", to_bytes([Duration(1)])[:-1]]
+    )
+    def test_invalid(self, data):
+        with pytest.raises(ValueError):
+            from_bytes(data)
+
+    def test_arrays(self):
+        np = pytest.importorskip("numpy")
+        from py42195.arrays import DistanceArray
+
+        array = DistanceArray(km=[1.5, 2.5, 3.5])
+        view = from_bytes(to_bytes(array))
+        result = view.to_array()
+        assert isinstance(result, DistanceArray)
+        np.testing.assert_array_equal(result.km, array.km)
+
+
+class TestPickle:
+    @pytest.mark.parametrize("value", VALUES)
+    def test_compact_roundtrip(self, value):
+        data = pickle.dumps(value)
+        assert pickle.loads(data) == value
+        assert b"getattr" not in data
@@ -1,12 +1,24 @@
 import pytest
 
-from py42195.config import IMPERIAL, METRIC, get_unit_system, set_unit_system
+from py42195.config import (
+    IMPERIAL,
+    METRIC,
+    get_default_unit,
+    get_unit_system,
+    pinned_unit_system,
+    reload_unit_system,
+    set_unit_system,
+)
+from py42195.types import Distance, Pace
 
 
 @pytest.fixture(autouse=True)
 def clean_env(monkeypatch):
     monkeypatch.delenv("PY42195_UNIT_SYSTEM", raising=False)
+    reload_unit_system()
     yield
+    monkeypatch.undo()
+    reload_unit_system()
 
 
 def test_default_is_metric():
@@ -15,11 +27,61 @@ def test_default_is_metric():
 
 def test_os_env_overrides_default(monkeypatch):
     monkeypatch.setenv("PY42195_UNIT_SYSTEM", IMPERIAL)
+    assert reload_unit_system() == IMPERIAL
     assert get_unit_system() == IMPERIAL
 
 
+def test_os_env_is_read_once(monkeypatch):
+    monkeypatch.setenv("PY42195_UNIT_SYSTEM", IMPERIAL)
+    assert get_unit_system() == METRIC
+
+
 def test_context_manager():
     assert get_unit_system() == METRIC
     with set_unit_system(IMPERIAL):
         assert get_unit_system() == IMPERIAL
     assert get_unit_system() == METRIC
+
+
+def test_pinned_unit_system(monkeypatch):
+    with pinned_unit_system() as system:
+        assert system == METRIC
+        monkeypatch.setenv("PY42195_UNIT_SYSTEM", IMPERIAL)
+        reload_unit_system()
+        assert get_unit_system() == METRIC
+    assert get_unit_system() == IMPERIAL
+
+
+def test_set_inside_pinned():
+    with pinned_unit_system():
+        with set_unit_system(IMPERIAL):
+            assert get_unit_system() == IMPERIAL
+        assert get_unit_system() == METRIC
+
+
+@pytest.mark.parametrize(
+    ("quantity", "system", "expected"),
+    [
+        (Distance, METRIC, "km"),
+        (Distance, IMPERIAL, "mi"),
+        (Pace, IMPERIAL, "seconds_per_mile"),
+    ],
+)
+def test_default_unit(quantity, system, expected):
+    with set_unit_system(system):
+        assert get_default_unit(quantity) == expected
+
+
+def test_default_unit_of_given_system():
+    assert get_default_unit(Pace, IMPERIAL) == "seconds_per_mile"
+    assert get_default_unit(Pace) == "seconds_per_km"
+
+
+@pytest.mark.parametrize("system", [METRIC, IMPERIAL])
+def test_resolved_once(system):
+    # Bulk paths resolve the unit system once and pass it along
+    value = Pace(seconds_per_km=300)
+    with set_unit_system(system):
+        assert value._format(system) == str(value)
+        assert Distance(km=5)._format(system) == str(Distance(km=5))
+        assert Pace._parser(system)("8:00") == Pace.parse("8:00")
@@ -0,0 +1,136 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py42195 import Distance, Duration, pace
+from py42195.efforts import TARGETS, _best_window, best_efforts, best_efforts_many
+
+
+def track(paces_per_km, step=0.25):
+    """Cumulative distances and times sampled every `step` km."""
+    km, seconds = [0.0], [0.0]
+    for seconds_per_km in paces_per_km:
+        for _ in range(round(1 / step)):
+            km.append(km[-1] + step)
+            seconds.append(seconds[-1] + step * seconds_per_km)
+    return km, seconds
+
+
+def brute_force(km, seconds, length):
+    """O(n²) reference: every sample as a start or an end of the window."""
+
+    def time_at(x, last):
+        for i in range(len(km) - 1):
+            if km[i] <= x <= km[i + 1] and (not last or x < km[i + 1]):
+                if km[i + 1] == km[i]:
+                    continue
+                return seconds[i] + (x - km[i]) / (km[i + 1] - km[i]) * (
+                    seconds[i + 1] - seconds[i]
+                )
+        if last and x == km[-1]:
+            return seconds[-1]
+        return None
+
+    candidates = []
+    for i in range(len(km)):
+        end = time_at(km[i] + length, last=False)
+        if end is not None:
+            candidates.append(end - seconds[i])
+        start = time_at(km[i] - length, last=True)
+        if start is not None:
+            candidates.append(seconds[i] - start)
+    return min(candidates)
+
+
+class TestBestEfforts:
+    def test_fast_segment(self):
+        # 5:00/km except for a 4:00/km km in the middle
+        km, seconds = track([300, 300, 300, 240, 300, 300])
+        efforts = best_efforts(
+            [Distance(km=x) for x in km], [Duration(s) for s in seconds]
+        )
+        assert list(efforts) == [Distance(km=1), Distance(km=5)]
+        one = efforts[Distance(km=1)]
+        assert one.duration.seconds == pytest.approx(240)
+        assert one.start.km == pytest.approx(3)
+        assert one.pace == pace("4:00")
+        assert efforts[Distance(km=5)].duration.seconds == pytest.approx(1440)
+
+    def test_window_across_samples(self):
+        # The fastest km starts between samples
+        km = [0.0, 0.5, 1.5, 2.0]
+        seconds = [0.0, 150.0, 390.0, 540.0]
+        assert _best_window(km, seconds, 1.0) == pytest.approx((240.0, 0.5))
+
+    def test_stop_is_not_counted(self):
+        # Standing still at 1 km for 60 s
+        km = [0.0, 1.0, 1.0, 2.0]
+        seconds = [0.0, 300.0, 360.0, 600.0]
+        assert _best_window(km, seconds, 1.0)[0] == pytest.approx(240)
+        assert _best_window(km, seconds, 2.0)[0] == pytest.approx(600)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_brute_force(self, seed):
+        rng = random.Random(seed)
+        km, seconds = [0.0], [0.0]
+        for _ in range(60):
+            km.append(km[-1] + rng.choice([0.0, rng.uniform(0.01, 0.3)]))
+            seconds.append(seconds[-1] + rng.uniform(1, 90))
+        for length in (0.5, 1.0, km[-1] / 2, km[-1]):
+            assert _best_window(km, seconds, length)[0] == pytest.approx(
+                brute_force(km, seconds, length)
+            )
+
+    def test_whole_track(self):
+        km, seconds = track([300] * 5)
+        effort = best_efforts(
+            [Distance(km=x) for x in km],
+            [Duration(s) for s in seconds],
+            [Distance(km=5)],
+        )[Distance(km=5)]
+        assert effort.duration.seconds == pytest.approx(1500)
+
+    def test_short_track(self):
+        assert best_efforts([Distance(km=0)], [Duration(0)]) == {}
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            best_efforts([Distance(km=0), Distance(km=1)], [Duration(0)])
+        with pytest.raises(ValueError):
+            best_efforts(
+                [Distance(km=0), Distance(km=1)],
+                [Duration(0), Duration(300)],
+                [Distance(km=0)],
+            )
+
+
+class TestBestEffortsMany:
+    @pytest.fixture
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    def test_many(self, numpy):
+        from py42195.arrays import DistanceArray, DurationArray
+
+        activities = []
+        for paces in ([300] * 6, [240] * 3):
+            km, seconds = track(paces)
+            activities.append((DistanceArray(km=km), DurationArray(seconds)))
+        result = best_efforts_many(activities, [Distance(km=1), Distance(km=5)])
+        numpy.testing.assert_allclose(result.seconds, [[300, 1500], [240, numpy.nan]])
+
+    def test_executor(self, numpy):
+        activities = []
+        for paces in ([300] * 6, [240] * 3):
+            km, seconds = track(paces)
+            activities.append(
+                ([Distance(km=x) for x in km], [Duration(s) for s in seconds])
+            )
+        with ThreadPoolExecutor(2) as executor:
+            result = best_efforts_many(activities, executor=executor)
+        assert result.shape == (2, len(TARGETS))
+        numpy.testing.assert_allclose(result.seconds[:, 0], [300, 240])
+
+    def test_empty(self, numpy):
+        assert best_efforts_many([]).shape == (0, len(TARGETS))
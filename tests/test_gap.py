@@ -0,0 +1,111 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py42195 import IMPERIAL, Distance, Pace, set_unit_system
+from py42195.arrays import DistanceArray, DurationArray, PaceArray
+from py42195.gap import (
+    CostModel,
+    Linear,
+    Minetti,
+    grade_adjusted_pace,
+    grade_adjusted_paces,
+    grade_adjusted_splits,
+    grades,
+)
+
+# 4 km at 5:00/km: flat, 5 % up, 5 % down, flat (samples every 10 m)
+KM = np.linspace(0, 4, 401)
+SECONDS = KM * 300
+ELEVATIONS = np.interp(KM, [0, 1, 2, 3, 4], [0, 0, 50, 0, 0])
+
+
+@pytest.fixture
+def track():
+    return DistanceArray(km=KM), DurationArray(SECONDS), ELEVATIONS
+
+
+class TestModels:
+    @pytest.mark.parametrize("model", [Minetti(), Linear()])
+    def test_flat(self, model):
+        assert model.cost(np.array([0.0]))[0] == pytest.approx(1)
+
+    def test_minetti(self):
+        cost = Minetti().cost(np.array([-0.1, 0.1, 0.45, 1.0]))
+        # Cheaper on gentle downhills, much more expensive uphill
+        assert cost[0] < 1 < cost[1]
+        assert cost[1] == pytest.approx(5.968 / 3.6, rel=0.001)
+        assert cost[3] == cost[2]
+
+    def test_linear(self):
+        cost = Linear().cost(np.array([-0.05, 0.05]))
+        np.testing.assert_allclose(cost, [1 - 0.09, 1 + 0.165])
+
+    def test_cost_is_abstract(self):
+        class Flat(CostModel):
+            name = "flat"
+
+        with pytest.raises(TypeError):
+            Flat()
+
+
+class TestGrades:
+    def test_grades(self):
+        result = grades(DistanceArray(km=KM), ELEVATIONS)
+        assert result[0] == pytest.approx(0)
+        assert result[150] == pytest.approx(0.05)
+        assert result[250] == pytest.approx(-0.05)
+
+    def test_missing_elevations(self):
+        elevations = ELEVATIONS.copy()
+        elevations[140:160] = np.nan
+        result = grades(DistanceArray(km=KM), elevations)
+        assert result[150] == pytest.approx(0.05)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            grades(DistanceArray(km=KM), ELEVATIONS[:-1])
+        with pytest.raises(ValueError):
+            grades(DistanceArray(km=KM), np.full(len(KM), np.nan))
+        with pytest.raises(ValueError):
+            grades(DistanceArray(km=KM), ELEVATIONS, window=Distance(km=0))
+
+
+class TestGradeAdjustedPace:
+    def test_paces(self, track):
+        paces = grade_adjusted_paces(*track)
+        assert isinstance(paces, PaceArray)
+        assert len(paces) == len(KM)
+        cost = Minetti().cost(np.array([0.05, -0.05]))
+        assert paces.seconds_per_km[50] == pytest.approx(300)
+        assert paces.seconds_per_km[150] == pytest.approx(300 / cost[0])
+        assert paces.seconds_per_km[250] == pytest.approx(300 / cost[1])
+
+    def test_splits(self, track):
+        marks, paces = grade_adjusted_splits(*track, model="linear")
+        np.testing.assert_allclose(marks.km, [1, 2, 3, 4])
+        # Grades change within the window around the 1 km and 2 km marks
+        np.testing.assert_allclose(
+            paces.seconds_per_km, [300, 300 / 1.165, 300 / 0.91, 300], rtol=0.01
+        )
+
+    def test_splits_imperial(self, track):
+        with set_unit_system(IMPERIAL):
+            marks, paces = grade_adjusted_splits(*track)
+            assert str(paces[0]).endswith("/mi")
+        assert len(marks) == 3
+
+    def test_flat_track_is_unchanged(self):
+        pace = grade_adjusted_pace(
+            DistanceArray(km=KM), DurationArray(SECONDS), np.zeros(len(KM))
+        )
+        assert pace == Pace(seconds_per_km=300)
+
+    def test_whole_track(self, track):
+        pace = grade_adjusted_pace(*track, model="linear")
+        expected = 300 * (2 + 1 / 1.165 + 1 / 0.91) / 4
+        assert pace.seconds_per_km == pytest.approx(expected, rel=0.01)
+
+    def test_unknown_model(self, track):
+        with pytest.raises(ValueError):
+            grade_adjusted_paces(*track, model="magic")
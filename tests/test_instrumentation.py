@@ -0,0 +1,141 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from py42195 import Distance, Duration, Pace, distance, duration, pace, types, utils
+from py42195 import instrumentation
+from py42195.config import INSTRUMENT_ENV_VARIABLE
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        original = Distance.__dict__["__init__"]
+        Distance(km=1)
+        assert instrumentation.stats() == {}
+        assert not instrumentation.is_enabled()
+        assert Distance.__dict__["__init__"] is original
+
+    def test_counts(self):
+        with instrumentation.instrumented():
+            assert instrumentation.is_enabled()
+            Distance(km=1)
+            str(duration("1:00:00"))
+            pace("4:07") * Distance(km=10)
+        stats = instrumentation.stats()
+        assert stats["Distance.__init__"].calls == 2
+        assert stats["Duration.parse"].calls == 1
+        assert stats["parse_interval_seconds"].calls >= 1
+        assert stats["Duration.__str__"].calls == 1
+        assert stats["format_interval"].calls >= 1
+        assert stats["Pace.__mul__"].calls == 1
+        assert stats["Pace.__mul__"].seconds > 0
+
+    def test_restores_originals(self):
+        originals = (
+            types.parse_interval_seconds,
+            utils.format_interval,
+            Pace.__dict__["parse"],
+        )
+        with instrumentation.instrumented():
+            assert types.parse_interval_seconds is not originals[0]
+            assert types.parse_interval_seconds is utils.parse_interval_seconds
+        assert (
+            types.parse_interval_seconds,
+            utils.format_interval,
+            Pace.__dict__["parse"],
+        ) == originals
+
+    def test_results_unchanged(self):
+        with instrumentation.instrumented():
+            assert distance("10 km") == Distance(km=10)
+            assert Duration.parse("1:00").seconds == 60
+            assert str(pace("4:07")) == "4:07.0/km"
+
+    def test_parse_failures(self):
+        with instrumentation.instrumented():
+            for source in ("4:07 min/km", "5:12 min/km", "fast"):
+                with pytest.raises(ValueError):
+                    Pace.parse(source)
+        assert instrumentation.stats()["Pace.parse"].failures == 3
+        failures = instrumentation.parse_failures()
+        assert failures["Pace.parse", "9:9 min/km"] == 2
+        assert failures["Pace.parse", "fast"] == 1
+
+    def test_hook(self):
+        events = []
+
+        def hook(operation, seconds, failed):
+            events.append((operation, seconds, failed))
+
+        instrumentation.add_hook(hook)
+        try:
+            with instrumentation.instrumented():
+                Duration.parse("1:00")
+        finally:
+            instrumentation.remove_hook(hook)
+        operations = [operation for operation, _, _ in events]
+        assert "Duration.parse" in operations
+        assert all(not failed and seconds >= 0 for _, seconds, failed in events)
+
+    def test_failing_hook(self, caplog):
+        def hook(operation, seconds, failed):
+            raise RuntimeError("broken exporter")
+
+        instrumentation.add_hook(hook)
+        try:
+            with instrumentation.instrumented():
+                # Neither the result nor the original exception is replaced
+                assert Duration.parse("1:00") == Duration(60)
+                with pytest.raises(ValueError):
+                    Duration.parse("fast")
+        finally:
+            instrumentation.remove_hook(hook)
+        assert instrumentation.stats()["Duration.parse"].failures == 1
+        assert "broken exporter" in caplog.text
+
+    def test_reset(self):
+        with instrumentation.instrumented():
+            Distance(km=1)
+        instrumentation.reset()
+        assert instrumentation.stats() == {}
+
+    def test_module_imported_while_enabled(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "py42195.live", raising=False)
+        with instrumentation.instrumented():
+            import py42195.live as live
+
+            assert live.parse_interval_seconds is utils.parse_interval_seconds
+            live.parse_read("1,10 km,40:00")
+        assert instrumentation.stats()["parse_interval_seconds"].calls >= 1
+        assert live.parse_interval_seconds is types.parse_interval_seconds
+
+    def test_input_pattern(self):
+        assert instrumentation.input_pattern(" 1:02:03.5 ") == "9:9:9.9"
+
+
+def test_environment_variable():
+    env = dict(os.environ, **{INSTRUMENT_ENV_VARIABLE: "1"})
+    code = (
+        "import py42195; from py42195 import instrumentation; "
+        "py42195.distance('10 km'); "
+        "print(instrumentation.is_enabled(), instrumentation.stats()['Distance.parse'].calls)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["True", "1"]
@@ -0,0 +1,103 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py42195.arrays import DistanceArray, DurationArray, PaceArray
+from py42195.lazy import Expression, lazy
+from py42195.types import Distance, Duration, Pace, Speed, duration, pace
+
+
+@pytest.fixture
+def distances():
+    return DistanceArray(km=np.linspace(1, 42, 1001))
+
+
+@pytest.fixture
+def rests():
+    return DurationArray(np.linspace(0, 120, 1001))
+
+
+class TestBuild:
+    def test_dimensions(self, distances):
+        expr = lazy(pace("4:07")) * distances
+        assert isinstance(expr, Expression)
+        assert expr.quantity is Duration
+        assert expr.shape == (1001,)
+        assert (expr / distances).quantity is Pace
+        assert (distances / expr).quantity is Speed
+        assert (expr / expr).quantity is None
+
+    def test_invalid_dimensions(self, distances):
+        with pytest.raises(TypeError):
+            lazy(pace("4:07")) + distances
+        with pytest.raises(TypeError):
+            lazy(distances) * distances
+        with pytest.raises(TypeError):
+            lazy("4:07")
+
+    def test_shape_mismatch(self):
+        with pytest.raises(ValueError):
+            lazy(DistanceArray(km=[1, 2])) + DistanceArray(km=[1, 2, 3])
+
+    def test_incomplete_node(self):
+        class Node(Expression):
+            __slots__ = ()
+
+        with pytest.raises(TypeError):
+            Node()
+
+    def test_repr(self, distances):
+        assert repr(lazy(distances) * 2) == "Expression(Distance, shape=(1001,))"
+
+
+class TestEvaluate:
+    def test_matches_eager(self, distances, rests):
+        total = Distance.MARATHON
+        eager = (pace("4:07") * distances + rests) / total
+        expr = (lazy(pace("4:07")) * distances + rests) / total
+        for block_size in (1, 100, 65536):
+            result = expr.evaluate(block_size=block_size)
+            assert isinstance(result, PaceArray)
+            np.testing.assert_array_equal(result.seconds_per_km, eager.seconds_per_km)
+
+    def test_reflected(self, distances):
+        eager = Distance(km=50) - distances / 2
+        result = (Distance(km=50) - lazy(distances) / 2).evaluate()
+        np.testing.assert_array_equal(result.km, eager.km)
+        ratio = (2 * (lazy(distances) / distances)).evaluate()
+        np.testing.assert_array_equal(ratio, np.full(1001, 2.0))
+
+    def test_negative(self, rests):
+        result = (-lazy(rests) + duration("2:00")).evaluate()
+        np.testing.assert_array_equal(result.seconds, 120 - rests.seconds)
+
+    def test_scalars(self):
+        result = (lazy(duration("1:00:00")) / Distance(km=12)).evaluate()
+        assert result == pace("5:00")
+        assert (lazy(Distance(km=10)) / Distance(km=4)).evaluate() == 2.5
+
+    def test_broadcasting(self):
+        goals = DurationArray([[3600.0], [4200.0]])
+        distances = DistanceArray(km=[10.0, 12.0, 15.0])
+        eager = goals / distances
+        for block_size in (1, 3, 100):
+            result = (lazy(goals) / distances).evaluate(block_size=block_size)
+            assert result.shape == (2, 3)
+            np.testing.assert_array_equal(result.seconds_per_km, eager.seconds_per_km)
+
+    def test_sum(self, distances, rests):
+        expr = lazy(pace("4:07")) * distances + rests
+        expected = math.fsum((pace("4:07") * distances + rests).seconds)
+        for block_size in (7, 65536):
+            assert expr.sum(block_size=block_size).seconds == pytest.approx(expected)
+        assert (lazy(Distance(km=1)) * 2).sum() == Distance(km=2)
+
+    def test_sum_broadcast(self):
+        expr = lazy(DistanceArray(km=[[1.0], [2.0]])) + DistanceArray(km=[0.0, 1.0])
+        assert expr.sum(block_size=1) == Distance(km=8)
+
+    def test_sum_of_paces(self, distances):
+        with pytest.raises(TypeError):
+            (lazy(Duration(600)) / distances).sum()
@@ -0,0 +1,173 @@
+import asyncio
+import random
+
+import pytest
+
+from py42195 import Distance, Duration, Pace
+from py42195.live import Leaderboard, LiveTiming, Read, parse_read, replay_server
+
+READS = [
+    "1,10 km,40:00",
+    "2,10 km,41:00",
+    "1,21.0975 km,1:25:00",
+    "3,10 km,39:30",
+    "2,21.0975 km,1:24:00",
+]
+
+
+class TestParseRead:
+    def test_valid(self):
+        read = parse_read("1234, 21.0975 km, 1:30:12.3")
+        assert read == Read("1234", Distance.HALF_MARATHON, Duration(5412.3))
+
+    @pytest.mark.parametrize("line", ["1234,10 km", "1,2,3,4", "1,10 km,abc"])
+    def test_invalid(self, line):
+        with pytest.raises(ValueError):
+            parse_read(line)
+
+
+class TestLeaderboard:
+    def test_in_order(self):
+        board = Leaderboard()
+        assert board.add("a", 100.0) == 1
+        assert board.add("b", 110.0) == 2
+        assert board.add("c", 110.0) == 3
+        assert list(board) == ["a", "b", "c"]
+
+    def test_out_of_order(self):
+        board = Leaderboard()
+        board.add("a", 100.0)
+        board.add("b", 110.0)
+        assert board.add("c", 90.0) == 1
+        assert board.rank("a") == 2
+        assert board.rank("b") == 3
+        assert board.top(2) == [("c", Duration(90)), ("a", Duration(100))]
+
+    def test_first_read_counts(self):
+        board = Leaderboard()
+        board.add("a", 100.0)
+        assert board.add("a", 50.0) == 1
+        assert len(board) == 1
+        assert board.elapsed("a") == Duration(100)
+        assert "a" in board
+        assert "b" not in board
+
+    def test_many_late_reads(self):
+        rng = random.Random(42)
+        reads = [(f"{i}", rng.uniform(0, 3 * 3600)) for i in range(2000)]
+        reads += [(f"same{i}", 1000.5) for i in range(10)]
+        rng.shuffle(reads)
+        board = Leaderboard()
+        for bib, seconds in reads:
+            board.add(bib, seconds)
+        expected = sorted(reads, key=lambda read: (read[1], read[0]))
+        assert list(board) == [bib for bib, _ in expected]
+        assert [board.rank(bib) for bib, _ in expected] == list(range(1, 2011))
+        assert board.top(3) == [(bib, Duration(s)) for bib, s in expected[:3]]
+        assert len(board) == 2010
+
+    @pytest.mark.parametrize("seconds", [-1.0, float("nan"), 1e9])
+    def test_invalid_time(self, seconds):
+        board = Leaderboard()
+        with pytest.raises(ValueError):
+            board.add("a", seconds)
+        assert "a" not in board
+
+
+class TestLiveTiming:
+    def test_process(self):
+        timing = LiveTiming(Distance(km=20))
+        first = timing.process("1,10 km,40:00")
+        assert first.rank == 1
+        assert first.pace == Pace(seconds_per_km=240)
+        assert first.projected == Duration(4800)
+
+        update = timing.process(Read("1", Distance(km=15), Duration(3000)))
+        # Pace since the previous mat
+        assert update.pace == Pace(seconds_per_km=120)
+        assert update.projected == Duration(3600)
+        assert timing.projected_finish("1") == Duration(3600)
+        assert timing.projected_finish("2") is None
+
+    def test_late_read_keeps_state(self):
+        timing = LiveTiming(Distance(km=20))
+        timing.process("1,10 km,40:00")
+        update = timing.process("1,5 km,20:00")
+        assert update.mat == Distance(km=5)
+        assert update.projected == Duration(4800)
+
+    def test_leaderboards(self):
+        timing = LiveTiming()
+        ranks = [timing.process(read).rank for read in READS]
+        assert ranks == [1, 2, 1, 1, 1]
+        board = timing.leaderboards[Distance(km=10)]
+        assert list(board) == ["3", "1", "2"]
+        assert list(timing.leaderboards[Distance.HALF_MARATHON]) == ["2", "1"]
+
+    def test_subscribe(self):
+        async def run():
+            timing = LiveTiming()
+            queue = timing.subscribe()
+            timing.process(READS[0])
+            timing.unsubscribe(queue)
+            timing.process(READS[1])
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        updates = asyncio.run(run())
+        assert [update.bib for update in updates] == ["1"]
+
+    def test_slow_subscriber(self):
+        async def run():
+            timing = LiveTiming()
+            queue = timing.subscribe(maxsize=2)
+            for read in READS:
+                timing.process(read)
+            return timing, [queue.get_nowait() for _ in range(queue.qsize())]
+
+        timing, updates = asyncio.run(run())
+        # The oldest updates are dropped, the state is complete
+        assert [(u.bib, u.mat) for u in updates] == [
+            ("3", Distance(km=10)),
+            ("2", Distance.HALF_MARATHON),
+        ]
+        assert len(timing.leaderboards[Distance(km=10)]) == 3
+
+    def test_datagram_protocol(self):
+        timing = LiveTiming()
+        protocol = timing.datagram_protocol()
+        protocol.datagram_received("\n".join(READS[:2]).encode(), ("127.0.0.1", 0))
+        assert len(timing.leaderboards[Distance(km=10)]) == 2
+
+
+class TestReplay:
+    @pytest.mark.parametrize("speed", [None, 36000.0])
+    def test_tcp(self, speed):
+        async def run():
+            server = await replay_server(READS, speed=speed)
+            port = server.sockets[0].getsockname()[1]
+            timing = LiveTiming()
+            queue = timing.subscribe()
+            async with server:
+                count = await timing.ingest_tcp("127.0.0.1", port)
+            return timing, count, queue.qsize()
+
+        timing, count, updates = asyncio.run(run())
+        assert count == updates == len(READS)
+        assert list(timing.leaderboards[Distance(km=10)]) == ["3", "1", "2"]
+
+    @pytest.mark.parametrize("speed", [None, 36000.0])
+    def test_invalid_lines_are_skipped(self, caplog, speed):
+        lines = [READS[0], "garbage", "2,10 km,4x:00", READS[1]]
+
+        async def run():
+            server = await replay_server(lines, speed=speed)
+            port = server.sockets[0].getsockname()[1]
+            timing = LiveTiming()
+            async with server:
+                count = await timing.ingest_tcp("127.0.0.1", port)
+            return timing, count
+
+        timing, count = asyncio.run(run())
+        assert count == 2
+        assert list(timing.leaderboards[Distance(km=10)]) == ["1", "2"]
+        assert len([r for r in caplog.records if "invalid read" in r.message]) == 2
@@ -0,0 +1,183 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from py42195.arrays import DistanceArray, PaceArray
+from py42195.config import IMPERIAL, set_unit_system
+from py42195.pandas import (
+    DistanceExtensionArray,
+    DurationExtensionArray,
+    PaceDtype,
+    PaceExtensionArray,
+)
+from py42195.types import Distance, Duration, Pace, Speed, pace
+
+
+@pytest.fixture
+def paces():
+    return pd.Series(["4:07", "4:15/km", None], dtype="pace")
+
+
+@pytest.fixture
+def distances():
+    return pd.Series([5, 10, 21.0975]).py42195.to_distance()
+
+
+class TestConstruction:
+    def test_dtype_from_string(self, paces):
+        assert paces.dtype == PaceDtype()
+        assert isinstance(paces.array, PaceExtensionArray)
+        assert paces.array._data[:2].tolist() == [247, 255]
+        assert paces.isna().tolist() == [False, False, True]
+
+    def test_from_scalars(self):
+        series = pd.Series([Distance(km=1), Distance(mi=1)], dtype="distance")
+        assert series[1] == Distance(mi=1)
+
+    def test_from_quantity_array(self):
+        array = DistanceExtensionArray(DistanceArray(km=[1, 2]))
+        assert array.to_quantity_array().km.tolist() == [1, 2]
+        with pytest.raises(TypeError):
+            DistanceExtensionArray(PaceArray(seconds_per_km=[1]))
+
+    def test_read_csv(self):
+        source = io.StringIO("split\n4:07\n1:26:51\n")
+        df = pd.read_csv(source, dtype={"split": "duration"})
+        assert df["split"].tolist() == [Duration(247), Duration(5211)]
+
+
+class TestAccessor:
+    def test_parse_with_errors(self):
+        series = pd.Series(["4:07", "fast"]).py42195.to_pace(errors="nan")
+        assert series.dtype == "pace"
+        assert series.isna().tolist() == [False, True]
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            pd.Series(["4:07", "fast"]).py42195.to_pace()
+
+    def test_numbers_in_default_unit(self):
+        with set_unit_system(IMPERIAL):
+            series = pd.Series([1.0]).py42195.to_distance()
+        assert series[0] == Distance(mi=1)
+
+
+class TestArithmetics:
+    def test_pace_times_distance(self, paces, distances):
+        result = paces * distances
+        assert result.dtype == "duration"
+        assert result[0] == pace("4:07") * Distance(km=5)
+        assert pd.isna(result[2])
+
+    def test_scalar_broadcasting(self, distances):
+        result = pace("4:00") * distances
+        assert result.dtype == "duration"
+        assert (distances * pace("4:00")).equals(result)
+        assert (result / distances)[0] == pace("4:00")
+
+    def test_same_type_ratio(self, distances):
+        result = distances / Distance(km=5)
+        assert result.dtype == np.float64
+        assert result.tolist() == pytest.approx([1, 2, 4.2195])
+
+    def test_numbers(self, distances):
+        assert (distances * 2).dtype == "distance"
+        assert (distances + distances)[0] == Distance(km=10)
+
+    def test_to_speed(self, distances):
+        speeds = distances / pd.Series([Duration(1800)] * 3, dtype="duration")
+        assert speeds.dtype == "speed"
+        assert speeds[0] == Speed(km_h=10)
+
+    def test_comparison(self, paces):
+        assert (paces < pace("4:10")).tolist() == [True, False, False]
+
+    def test_incompatible_comparison(self, paces, distances):
+        assert (paces == distances).tolist() == [False, False, False]
+
+    def test_incompatible_arithmetics(self, paces, distances):
+        with pytest.raises(TypeError):
+            paces + distances
+
+
+class TestReductions:
+    def test_sum_and_mean(self, distances):
+        assert distances.sum() == Distance(km=36.0975)
+        assert distances.mean().km == pytest.approx(12.0325)
+        assert distances.max() == Distance(km=21.0975)
+
+    def test_skipna(self, paces):
+        assert paces.sum() == Pace(seconds_per_km=502)
+        assert pd.isna(paces.sum(skipna=False))
+
+    def test_unsupported(self, distances):
+        with pytest.raises(TypeError):
+            distances.prod()
+
+    def test_groupby(self, paces, distances):
+        df = pd.DataFrame(
+            {"group": ["a", "b", "a"], "pace": paces, "distance": distances}
+        )
+        totals = df.groupby("group")["distance"].sum()
+        assert totals.dtype == "distance"
+        assert totals["a"] == Distance(km=26.0975)
+        assert df.groupby("group")["pace"].mean()["b"] == pace("4:15")
+
+    def test_min_count(self, paces):
+        missing = pd.Series([None, None], dtype="pace")
+        assert missing.sum() == Pace(seconds_per_km=0)
+        assert pd.isna(missing.sum(min_count=1))
+        assert paces.sum(min_count=2) == Pace(seconds_per_km=502)
+        assert pd.isna(paces.sum(min_count=3))
+
+    def test_groupby_ops(self, paces):
+        df = pd.DataFrame({"group": ["a", "b", "a", None], "pace": [*paces, None]})
+        df["pace"] = df["pace"].astype("pace")
+        grouped = df.groupby("group")["pace"]
+        totals = grouped.sum(min_count=1)
+        assert totals.dtype == "pace"
+        assert totals.tolist() == [pace("4:07"), pace("4:15")]
+        assert grouped.cumsum().tolist()[:2] == [pace("4:07"), pace("4:15")]
+        assert grouped.rank().tolist()[:2] == [1.0, 1.0]
+        only_missing = df.assign(group=["a", "b", "c", "c"]).groupby("group")["pace"]
+        assert pd.isna(only_missing.sum(min_count=1)["c"])
+        assert only_missing.sum()["c"] == Pace(seconds_per_km=0)
+
+    def test_sort(self, paces):
+        assert paces.sort_values().index.tolist() == [0, 1, 2]
+        assert paces.sort_values(ascending=False).index.tolist() == [1, 0, 2]
+
+
+class TestMisc:
+    def test_setitem(self, distances):
+        distances[0] = Distance(km=1)
+        distances[1] = None
+        assert distances[0] == Distance(km=1)
+        assert pd.isna(distances[1])
+
+    def test_concat_and_take(self, distances):
+        result = pd.concat([distances, distances], ignore_index=True)
+        assert len(result) == 6
+        assert result.array.take([0, -1], allow_fill=True).isna().tolist() == [
+            False,
+            True,
+        ]
+
+    def test_astype(self, paces):
+        assert paces.astype(str).tolist()[:2] == ["4:07.0/km", "4:15.0/km"]
+        assert paces.astype(float).tolist()[:2] == [247, 255]
+
+    def test_display_uses_unit_system(self, distances):
+        with set_unit_system(IMPERIAL):
+            assert "3.11 mi" in str(distances)
+        assert "5.00 km" in str(distances)
+
+    def test_unique(self, paces):
+        assert len(pd.concat([paces, paces]).unique()) == 3
+
+    def test_durations(self):
+        array = DurationExtensionArray([60.0, 120.0])
+        assert array.astype(str).tolist() == ["1:00.0", "2:00.0"]
@@ -0,0 +1,101 @@
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from py42195 import IMPERIAL, Distance, Duration, Pace, set_unit_system
+from py42195.parallel import (
+    convert_parallel,
+    format_parallel,
+    imap_ordered,
+    multiply,
+    parse_parallel,
+)
+
+PACES = [f"{3 + i % 4}:{i % 60:02d}" for i in range(1000)]
+
+
+@pytest.fixture(scope="module")
+def spawn_executor():
+    # Workers not sharing any state with the parent process
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        yield executor
+
+
+class TestImapOrdered:
+    def test_serial(self):
+        assert list(imap_ordered(len, [[1], [1, 2]])) == [1, 2]
+
+    def test_keeps_order(self, spawn_executor):
+        chunks = [[i] * (i % 7) for i in range(50)]
+        result = imap_ordered(len, chunks, spawn_executor, prefetch=4)
+        assert list(result) == [len(chunk) for chunk in chunks]
+
+
+class TestParseParallel:
+    def test_same_as_serial(self):
+        result = parse_parallel(Pace, PACES, jobs=2, chunk_size=64)
+        assert isinstance(result, array)
+        assert result == Pace.parse_values(PACES)
+
+    def test_compute(self):
+        result = parse_parallel(Pace, ["4:00"], compute=multiply(2), jobs=1)
+        assert result.tolist() == [480.0]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            parse_parallel(Pace, ["4:00", "abc"], jobs=2, chunk_size=1)
+        result = parse_parallel(Pace, ["4:00", "abc"], jobs=1, errors="nan")
+        assert result[1] != result[1]
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            parse_parallel(Pace, PACES, chunk_size=0)
+
+
+class TestFormatParallel:
+    def test_same_as_serial(self):
+        values = array("d", (200 + i / 10 for i in range(1000)))
+        result = format_parallel(Duration, values, jobs=2, chunk_size=100)
+        assert result == Duration.format_many(values)
+
+    def test_quantity_array(self):
+        pytest.importorskip("numpy")
+        from py42195.arrays import DurationArray
+
+        result = format_parallel(Duration, DurationArray([60, 90]), jobs=1)
+        assert result == ["1:00.0", "1:30.0"]
+
+
+class TestConvertParallel:
+    def test_finish_times(self, spawn_executor):
+        result = list(
+            convert_parallel(
+                PACES,
+                parse=Pace,
+                compute=multiply(Distance.MARATHON.km),
+                format=Duration,
+                chunk_size=100,
+                executor=spawn_executor,
+            )
+        )
+        expected = [str(Pace.parse(p) * Distance.MARATHON) for p in PACES]
+        assert result == expected
+
+    def test_unit_system_in_workers(self, spawn_executor):
+        with set_unit_system(IMPERIAL):
+            result = list(
+                convert_parallel(
+                    ["8:00", "10:00"], parse=Pace, chunk_size=1, executor=spawn_executor
+                )
+            )
+        assert result == ["8:00.0/mi", "10:00.0/mi"]
+
+    def test_format_options(self):
+        result = convert_parallel(
+            ["1:02:03.4"], parse=Duration, jobs=1, int_seconds=True
+        )
+        assert list(result) == ["1:02:03"]
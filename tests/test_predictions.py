@@ -0,0 +1,146 @@
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+from py42195 import Distance, distance, duration
+from py42195.arrays import DistanceArray, DurationArray
+from py42195.predictions import (
+    RACE_DISTANCES,
+    VDOT,
+    Cameron,
+    Model,
+    Riegel,
+    fit,
+    predict,
+)
+
+
+class TestModels:
+    def test_riegel(self):
+        result = predict([Distance(km=10)], [[duration("40:00")]], [Distance.MARATHON])
+        assert result.seconds[0, 0] == pytest.approx(2400 * 4.2195**1.06)
+
+    def test_riegel_exponent(self):
+        result = predict(
+            [Distance(km=10)],
+            [[duration("40:00")]],
+            [Distance(km=20)],
+            model=Riegel(exponent=1.0),
+        )
+        assert result.seconds[0, 0] == pytest.approx(4800)
+
+    def test_cameron(self):
+        def factor(miles):
+            return 13.49681 - 0.048865 * miles + 2.438936 / miles**0.7905
+
+        old, new = 10 / 1.609344, Distance.MARATHON.mi
+        expected = 2400 / old * factor(old) / factor(new) * new
+        result = predict(
+            [Distance(km=10)],
+            [[duration("40:00")]],
+            [Distance.MARATHON],
+            model="cameron",
+        )
+        assert result.seconds[0, 0] == pytest.approx(expected)
+
+    def test_vdot_matches_daniels_tables(self):
+        # VDOT 50: 5 km in 19:57, marathon in 3:10:49
+        assert VDOT.vdot(5.0, 1197.0) == pytest.approx(50, abs=0.1)
+        result = predict([Distance(km=5)], [[duration("19:57")]], model="vdot")
+        expected = [duration(s).seconds for s in ("41:21", "1:31:35", "3:10:49")]
+        assert result.seconds[0, 1:] == pytest.approx(expected, abs=5)
+
+    @pytest.mark.parametrize("model", ["riegel", Cameron(), "vdot"])
+    def test_same_distance(self, model):
+        result = predict(
+            [Distance(km=10)], [[duration("40:00")]], [Distance(km=10)], model=model
+        )
+        assert result.seconds[0, 0] == pytest.approx(2400, rel=1e-6)
+
+    def test_unknown_model(self):
+        with pytest.raises(ValueError):
+            predict([Distance(km=10)], [[duration("40:00")]], model="magic")
+
+    def test_incomplete_model(self):
+        class Incomplete(Model):
+            name = "incomplete"
+
+            def fit(self, km, seconds):
+                return seconds
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestPredict:
+    def test_shape(self):
+        result = predict(
+            DistanceArray(km=[5, 10]),
+            DurationArray([[1200, 2490], [1500, 3100], [1100, 2300]]),
+        )
+        assert isinstance(result, DurationArray)
+        assert result.shape == (3, len(RACE_DISTANCES))
+
+    def test_matches_scalar_loop(self):
+        performances = [[duration("20:00")], [duration("25:30")]]
+        targets = [Distance(km=10), Distance.HALF_MARATHON]
+        result = predict([Distance(km=5)], performances, targets)
+        for row, (performance,) in zip(result.seconds, performances):
+            for value, target in zip(row, targets):
+                expected = performance * (target / Distance(km=5)) ** 1.06
+                assert value == pytest.approx(expected.seconds)
+
+    def test_missing_performances(self):
+        result = predict(
+            [distance("5 km"), distance("10 km")],
+            [[duration("20:00"), None], [None, None]],
+            [Distance(km=5)],
+        )
+        assert result.seconds[0, 0] == pytest.approx(1200)
+        assert math.isnan(result.seconds[1, 0])
+
+    def test_nan_performances(self):
+        result = predict(
+            [distance("5 km"), distance("10 km")],
+            [[math.nan, duration("40:00")], [np.nan, None]],
+            [Distance(km=10)],
+            model=Riegel(exponent=1.0),
+        )
+        assert result.seconds[0, 0] == pytest.approx(2400)
+        assert math.isnan(result.seconds[1, 0])
+
+    def test_distances_per_athlete(self):
+        result = predict(
+            [[Distance(km=5)], [Distance(km=10)]],
+            [[duration("20:00")], [duration("40:00")]],
+            [Distance(km=5)],
+            model=Riegel(exponent=1.0),
+        )
+        assert result.seconds[:, 0] == pytest.approx([1200, 1200])
+
+    def test_wrong_quantity(self):
+        with pytest.raises(TypeError):
+            predict(DurationArray([1, 2]), DurationArray([[1200, 2400]]))
+
+
+class TestFit:
+    def test_reuse(self):
+        fitted = fit([Distance(km=5)], [[duration("20:00")]])
+        first = fitted.predict([Distance(km=10)])
+        second = fitted.predict([Distance(km=10), Distance.MARATHON])
+        assert first.seconds[0, 0] == second.seconds[0, 0]
+
+    def test_memo(self):
+        memo: dict = {}
+        durations = [[duration("20:00")], [duration("22:00")]]
+        fitted = fit([Distance(km=5)], durations, memo=memo)
+        assert len(memo) == 2
+        fitted_again = fit(
+            [Distance(km=5)], durations[:1] + [[duration("23:00")]], memo=memo
+        )
+        assert len(memo) == 3
+        np.testing.assert_array_equal(fitted.params[0], fitted_again.params[0])
@@ -0,0 +1,112 @@
+import pytest
+
+from py42195 import IMPERIAL, Distance, duration, set_unit_system
+from py42195.splits import (
+    Course,
+    even,
+    goal_range,
+    negative_split,
+    split_grid,
+    split_plan,
+)
+
+
+class TestSplitPlan:
+    def test_even(self):
+        splits = list(split_plan(duration("50:00"), Distance(km=10)))
+        assert len(splits) == 10
+        assert [str(split.elapsed) for split in splits[:2]] == ["5:00.0", "10:00.0"]
+        assert splits[-1].distance == Distance(km=10)
+        assert splits[-1].elapsed == duration("50:00")
+
+    def test_marathon_ends_at_finish(self):
+        splits = list(split_plan(duration("3:00:00"), Distance.MARATHON))
+        assert len(splits) == 43
+        assert splits[-2].distance == Distance(km=42)
+        assert splits[-1].distance == Distance.MARATHON
+        assert splits[-1].elapsed.seconds == pytest.approx(3 * 3600)
+
+    def test_imperial_unit_system(self):
+        with set_unit_system(IMPERIAL):
+            splits = list(split_plan(duration("3:00:00"), Distance.MARATHON))
+        assert len(splits) == 27
+        assert splits[0].distance.mi == pytest.approx(1)
+
+    def test_every(self):
+        splits = list(
+            split_plan(duration("20:00"), Distance(km=5), every=Distance(m=400))
+        )
+        assert splits[0].elapsed == duration("1:36")
+        assert splits[-1].distance == Distance(km=5)
+
+    def test_is_lazy(self):
+        plan = split_plan(duration("20:00"), Distance(km=5))
+        assert next(plan).distance == Distance(km=1)
+
+    @pytest.mark.parametrize("strategy", ["even", "negative", negative_split(0.05)])
+    def test_goal_is_kept(self, strategy):
+        *_, finish = split_plan(
+            duration("1:45:00"), Distance.HALF_MARATHON, strategy=strategy
+        )
+        assert finish.elapsed.seconds == pytest.approx(6300)
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            list(split_plan(duration("20:00"), Distance(km=5), strategy="crazy"))
+
+
+class TestStrategies:
+    def test_negative_split_halves(self):
+        strategy = negative_split(0.02)
+        first_half = strategy(0.5)
+        assert first_half - (1 - first_half) == pytest.approx(0.02)
+
+    def test_invalid_negative_split(self):
+        with pytest.raises(ValueError):
+            negative_split(0.6)
+
+    def test_course(self):
+        # Up 50 m in the first half, down in the second
+        course = Course(
+            [Distance(km=0), Distance(km=5), Distance(km=10)], [100, 150, 100]
+        )
+        assert course(0.0) == 0.0
+        assert course(1.0) == pytest.approx(1.0)
+        assert course(0.5) > 0.5
+
+    def test_invalid_course(self):
+        with pytest.raises(ValueError):
+            Course([Distance(km=0)], [100])
+
+
+class TestSplitGrid:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    def test_goal_range(self):
+        goals = goal_range(duration("2:00:00"), duration("6:30:00"), duration("0:30"))
+        assert len(goals) == 541
+        assert goals[-1] == duration("6:30:00")
+
+    def test_same_as_plan(self):
+        goals = [duration("3:00:00"), duration("4:15:00")]
+        strategy = negative_split(0.01)
+        marks, times = split_grid(goals, Distance.MARATHON, strategy=strategy)
+        assert times.shape == (2, len(marks))
+        for goal, row in zip(goals, times.seconds):
+            plan = split_plan(goal, Distance.MARATHON, strategy=strategy)
+            assert row.tolist() == [split.elapsed.seconds for split in plan]
+
+    def test_course(self):
+        course = Course([Distance(km=0), Distance(km=10)], [0, 100])
+        _, times = split_grid(
+            goal_range(duration("40:00"), duration("60:00"), duration("10:00")),
+            Distance(km=10),
+            strategy=course,
+        )
+        assert times.seconds[:, 4] == pytest.approx([1200, 1500, 1800])
+
+    def test_default_strategy_is_even(self):
+        _, times = split_grid([duration("50:00")], Distance(km=10))
+        assert times.seconds[0].tolist() == [even(i / 10) * 3000 for i in range(1, 11)]
@@ -0,0 +1,143 @@
+import json
+import pickle
+
+import pytest
+
+from py42195 import Distance, Duration, Pace, duration
+from py42195.codec import QuantityView
+from py42195.store import MAGIC, PREFIX, SplitStore, open_store, write_store
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "splits.q42"
+
+
+class TestStore:
+    def test_roundtrip(self, path):
+        finishes = [Duration(3 * 3600 + i / 3) for i in range(100)]
+        paces = [Pace(seconds_per_km=240 + i / 7) for i in range(100)]
+        write_store(path, {"finish": finishes, "pace": paces})
+        with open_store(path) as store:
+            assert store.rows == 100
+            assert list(store) == ["finish", "pace"]
+            assert isinstance(store["finish"], QuantityView)
+            assert list(store["finish"]) == finishes
+            assert list(store["pace"]) == paces
+            assert store["pace"][42] == paces[42]
+
+    def test_header_is_aligned(self, path):
+        write_store(path, {"a": [Distance(km=1)]})
+        data = path.read_bytes()
+        assert len(data) % 8 == 0
+        assert b'"unit": "km"' in data
+
+    def test_views_are_read_only(self, path):
+        write_store(path, {"a": [Distance(km=1)]})
+        with open_store(path) as store:
+            with pytest.raises(TypeError):
+                store["a"].values[0] = 2.0
+
+    def test_empty_store(self, path):
+        write_store(path, {})
+        with open_store(path) as store:
+            assert store.rows == 0
+            assert len(store) == 0
+
+    def test_different_lengths(self, path):
+        with pytest.raises(ValueError):
+            write_store(path, {"a": [Duration(1)], "b": [Duration(1), Duration(2)]})
+
+    def test_mixed_types(self, path):
+        with pytest.raises(TypeError):
+            write_store(path, {"a": [Duration(1), Distance(km=1)]})
+
+    def test_invalid_file(self, path):
+        path.write_bytes(b"NOTASTORE" + bytes(100))
+        with pytest.raises(ValueError):
+            open_store(path)
+
+    def test_truncated_file(self, path):
+        write_store(
+            path, {"a": [Duration(i) for i in range(1000)], "b": [Duration(1)] * 1000}
+        )
+        data = path.read_bytes()
+        path.write_bytes(data[:-4000])
+        with pytest.raises(ValueError, match="Truncated"):
+            open_store(path)
+
+    @pytest.mark.parametrize("header_length", [12, 10**6])
+    def test_invalid_header_length(self, path, header_length):
+        write_store(path, {"a": [Duration(1)]})
+        data = bytearray(path.read_bytes())
+        data[8:12] = header_length.to_bytes(4, "little")
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError):
+            open_store(path)
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            [],
+            {"version": 1, "rows": 1, "columns": 3},
+            {"version": 1, "rows": "10", "columns": []},
+            {"version": 1, "rows": 1, "columns": [["duration"]]},
+            {"version": 1, "rows": 1, "columns": [{"quantity": "duration"}]},
+            {"version": 1, "columns": []},
+        ],
+    )
+    def test_invalid_header(self, path, header):
+        header_bytes = json.dumps(header).encode()
+        header_bytes += b" " * (-len(header_bytes) % 8)
+        path.write_bytes(
+            PREFIX.pack(MAGIC, len(header_bytes)) + header_bytes + bytes(80)
+        )
+        with pytest.raises(ValueError, match="Invalid"):
+            open_store(path)
+
+    def test_short_prefix(self, path):
+        path.write_bytes(MAGIC)
+        with pytest.raises(ValueError):
+            open_store(path)
+
+    def test_pickle_reopens(self, path):
+        write_store(path, {"a": [duration("1:00")]})
+        with open_store(path) as store:
+            copy = pickle.loads(pickle.dumps(store))
+        with copy:
+            assert isinstance(copy, SplitStore)
+            assert copy["a"][0] == duration("1:00")
+
+    def test_views_survive_close(self, path):
+        write_store(path, {"a": [duration("1:00")]})
+        store = open_store(path)
+        view = store["a"]
+        store.close()
+        assert view[0] == duration("1:00")
+
+
+class TestStoreArrays:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    def test_zero_copy(self, path, numpy):
+        from py42195.arrays import DurationArray
+
+        values = DurationArray(numpy.linspace(3600, 7200, 1000))
+        write_store(
+            path,
+            {
+                "finish": values,
+                "copy": QuantityView(Duration, memoryview(values.seconds)),
+            },
+        )
+        with open_store(path) as store:
+            result = store.array("finish")
+            assert isinstance(result, DurationArray)
+            numpy.testing.assert_array_equal(result.seconds, values.seconds)
+            assert not result.seconds.flags.writeable
+            numpy.testing.assert_array_equal(
+                store.array("copy").seconds, values.seconds
+            )
+            del result
@@ -0,0 +1,130 @@
+import io
+from datetime import timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py42195 import IMPERIAL, Distance, Duration, duration, pace, set_unit_system
+from py42195.activities import read_csv
+from py42195.arrays import DistanceArray, DurationArray, PaceArray
+from py42195.tracks import TrackIndex, elapsed_at_many
+
+# 4:00/km for 2 km, a 30 s stop, then 5:00/km
+KM = [0.0, 1.0, 2.0, 2.0, 3.0, 4.0]
+SECONDS = [0.0, 240.0, 480.0, 510.0, 810.0, 1110.0]
+
+
+@pytest.fixture
+def index():
+    return TrackIndex(DistanceArray(km=KM), DurationArray(SECONDS))
+
+
+class TestTrackIndex:
+    def test_totals(self, index):
+        assert len(index) == 6
+        assert index.distance == Distance(km=4)
+        assert index.duration == Duration(1110)
+
+    def test_elapsed_at(self, index):
+        assert index.elapsed_at(Distance(km=0.5)) == Duration(120)
+        assert index.elapsed_at(Distance(km=3.5)) == Duration(960)
+        assert index.elapsed_at(Distance(km=0)) == Duration(0)
+        assert index.elapsed_at(Distance(km=4)) == Duration(1110)
+
+    def test_elapsed_at_stop_is_first_reach(self, index):
+        assert index.elapsed_at(Distance(km=2)) == Duration(480)
+
+    def test_distance_at(self, index):
+        assert index.distance_at(duration("2:00")) == Distance(km=0.5)
+        assert index.distance_at(duration("8:15")) == Distance(km=2)
+        assert index.distance_at(duration("16:00")) == Distance(km=3.5)
+
+    def test_outside_of_track(self, index):
+        with pytest.raises(ValueError):
+            index.elapsed_at(Distance(km=5))
+        with pytest.raises(ValueError):
+            index.distance_at(Duration(-1))
+
+    def test_batch(self, index):
+        result = index.elapsed_at(DistanceArray(km=[0.5, 2, 3.5, 5]))
+        assert isinstance(result, DurationArray)
+        np.testing.assert_allclose(result.seconds, [120, 480, 960, np.nan])
+        result = index.distance_at([Duration(120), Duration(960)])
+        assert isinstance(result, DistanceArray)
+        np.testing.assert_allclose(result.km, [0.5, 3.5])
+
+    def test_matches_scalar_queries(self, index):
+        km = np.linspace(0, 4, 97)
+        batch = index.elapsed_at(DistanceArray(km=km)).seconds
+        scalars = [index.elapsed_at(Distance(km=value)).seconds for value in km]
+        np.testing.assert_allclose(batch, scalars)
+
+    def test_pace_between(self, index):
+        assert index.pace_between(Distance(km=0), Distance(km=1)) == pace("4:00")
+        assert index.pace_between(Distance(km=3), Distance(km=4)) == pace("5:00")
+        paces = index.pace_between(Distance(km=0), DistanceArray(km=[1, 4]))
+        assert isinstance(paces, PaceArray)
+        np.testing.assert_allclose(paces.seconds_per_km, [240, 277.5])
+        with pytest.raises(ValueError):
+            index.pace_between(Distance(km=2), Distance(km=2))
+
+    def test_splits(self, index):
+        marks, elapsed = index.splits()
+        np.testing.assert_allclose(marks.km, [1, 2, 3, 4])
+        np.testing.assert_allclose(elapsed.seconds, [240, 480, 810, 1110])
+        with set_unit_system(IMPERIAL):
+            marks, _ = index.splits()
+        assert len(marks) == 3
+
+    def test_from_samples(self):
+        csv = io.StringIO("time,distance\n0,0\n60,0.25\n120,0.5\n")
+        index = TrackIndex.from_samples(read_csv(csv))
+        assert index.elapsed_at(Distance(m=375)) == Duration(90)
+
+    def test_from_activity(self):
+        csv = io.StringIO("time,distance\n0,0\n60,0.25\n120,0.5\n")
+        index = TrackIndex.from_activity(csv, format="csv")
+        assert index.distance_at(Duration(30)) == Distance(m=125)
+
+    @pytest.mark.parametrize(
+        "km, seconds",
+        [([0.0], [0.0]), ([0.0, 1.0], [0.0]), ([0.0, 2.0, 1.0], [0.0, 1.0, 2.0])],
+    )
+    def test_invalid(self, km, seconds):
+        with pytest.raises(ValueError):
+            TrackIndex(DistanceArray(km=km), DurationArray(seconds))
+
+    def test_wrong_quantity(self, index):
+        with pytest.raises(TypeError):
+            index.elapsed_at(Duration(10))
+        with pytest.raises(TypeError):
+            TrackIndex(DurationArray(SECONDS), DurationArray(SECONDS))
+
+    def test_timedelta_query(self, index):
+        assert index.distance_at(timedelta(minutes=2)) == Distance(km=0.5)
+
+
+class TestElapsedAtMany:
+    def test_many(self, index):
+        short = TrackIndex(
+            [Distance(km=0), Distance(km=2)], [Duration(0), Duration(600)]
+        )
+        result = elapsed_at_many([index, short], DistanceArray(km=[1, 3]))
+        np.testing.assert_allclose(result.seconds, [[240, 810], [300, np.nan]])
+
+    def test_empty(self):
+        assert elapsed_at_many([], DistanceArray(km=[1, 2])).shape == (0, 2)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_matches_scalar_with_stops(seed):
+    from py42195.tracks import _interpolate, _interpolate_one
+
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([0.0, 0.25, 0.5], size=40)
+    km = np.concatenate([[0.0], np.cumsum(steps)])
+    seconds = np.arange(41, dtype=float) * 60
+    queries = np.concatenate([km, rng.uniform(-1, km[-1] + 1, 100)])
+    expected = [_interpolate_one(x, km, seconds) for x in queries]
+    np.testing.assert_allclose(_interpolate(queries, km, seconds), expected, rtol=1e-12)
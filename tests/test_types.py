@@ -1,10 +1,21 @@
+import io
 import math
+import pickle
 from datetime import timedelta
 
 import pytest
 
 from py42195.config import IMPERIAL, METRIC, set_unit_system
-from py42195.types import Distance, Pace, Speed, distance, duration, pace, speed
+from py42195.types import (
+    Distance,
+    Duration,
+    Pace,
+    Speed,
+    distance,
+    duration,
+    pace,
+    speed,
+)
 
 
 @pytest.fixture
@@ -65,6 +76,11 @@ class TestDistance:
         with set_unit_system(unit_system or METRIC):
             assert str(a_distance) == expected
 
+    def test_parse_values(self):
+        sources = ["1.4", "2mi", "750 m", "1760yd"]
+        values = Distance.parse_values(sources)
+        assert list(values) == [Distance.parse(s).km for s in sources]
+
     def test_rtruediv(self):
         duration = timedelta(seconds=240)
         distance = Distance(km=1)
@@ -113,6 +129,17 @@ class TestPace:
             pace = Pace.parse("4:00")
             assert pace.seconds_per_mile == pytest.approx(240)
 
+        def test_parse_values(self):
+            values = Pace.parse_values(["4:00", "4:00/mi", "1:00:01/km"])
+            expected = [
+                Pace.parse(s).seconds_per_km for s in ["4:00", "4:00/mi", "1:00:01"]
+            ]
+            assert list(values) == expected
+
+        def test_parse_values_imperial(self, use_imperial_units):
+            values = Pace.parse_values(["4:00", "4:00/km"])
+            assert list(values) == pytest.approx([149.1, 240], abs=0.1)
+
     @pytest.mark.parametrize(
         ("seconds_per_km", "seconds_per_mile"), [(240, 386.24), (math.inf, math.inf)]
     )
@@ -166,6 +193,117 @@ class TestSpeed:
             )
 
 
+class TestValueObjects:
+    @pytest.mark.parametrize(
+        "value", [Distance(km=1), Duration(1), Pace(seconds_per_km=240), Speed(km_h=1)]
+    )
+    def test_immutable(self, value):
+        assert not hasattr(value, "__dict__")
+        with pytest.raises(AttributeError):
+            value.km = 2
+        with pytest.raises(AttributeError):
+            del value.km
+
+    @pytest.mark.parametrize(
+        "value", [Distance(km=1), Duration(1), Pace(seconds_per_km=240), Speed(km_h=1)]
+    )
+    def test_pickle(self, value):
+        assert pickle.loads(pickle.dumps(value)) == value
+
+    @pytest.mark.parametrize(
+        ("a", "b"),
+        [
+            (Distance(km=1), Distance(m=1000)),
+            (Duration(90), Duration(timedelta(seconds=90))),
+            (Pace(seconds_per_km=240), pace("4:00")),
+            (Speed(km_h=18), Speed(m_s=5)),
+        ],
+    )
+    def test_hash(self, a, b):
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+        assert {a: "x"}[b] == "x"
+
+    @pytest.mark.parametrize("seconds", [0.5, 90, 1e-6, 86400 * 3])
+    def test_duration_hash_matches_timedelta(self, seconds):
+        assert hash(Duration(seconds)) == hash(timedelta(seconds=seconds))
+
+    def test_duration_equal_to_timedelta_in_sets(self):
+        # Durations compare equal to timedeltas, so they must be interchangeable keys
+        assert Duration(90) == timedelta(seconds=90)
+        assert timedelta(seconds=90) in {Duration(90)}
+        assert {timedelta(seconds=247.3): "x"}[Duration(247.3)] == "x"
+
+    def test_hash_of_non_finite_duration(self):
+        assert hash(Duration(math.inf)) == hash(math.inf)
+
+    def test_fast_constructors(self):
+        assert Distance._from_km(2.0) == Distance(km=2.0)
+        assert Duration._from_seconds(2.0) == Duration(2.0)
+        assert Pace._from_seconds_per_km(2.0) == Pace(seconds_per_km=2.0)
+        assert Speed._from_km_h(2.0) == Speed(km_h=2.0)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"mph": 1, "km_h": 2}, ValueError),
+            ({}, ValueError),
+            ({"km_h": "x"}, ValueError),
+        ],
+    )
+    def test_invalid_speed_args(self, kwargs, error):
+        with pytest.raises(error):
+            Speed(**kwargs)
+
+
+class TestInterning:
+    def test_standard_distances(self):
+        assert Distance.parse("42.195 km") is Distance.MARATHON
+        assert distance("5 km") is distance(5)
+        assert Distance.intern(Distance(km=21.0975)) is Distance.HALF_MARATHON
+
+    def test_other_distances_not_interned(self):
+        value = Distance(km=4.2)
+        assert Distance.intern(value) is value
+
+    @pytest.mark.parametrize("source", ["4:00", "4:00/km", "8:00/mi"])
+    def test_whole_second_paces(self, source):
+        assert Pace.parse(source) is Pace.parse(source)
+
+    def test_fractional_paces_not_interned(self):
+        assert pace("4:00.5") is not pace("4:00.5")
+
+    def test_intern_pace(self):
+        value = Pace(seconds_per_km=301)
+        assert Pace.intern(Pace(seconds_per_km=301.0)) is Pace.intern(value)
+
+
+class TestFormatMany:
+    @pytest.mark.parametrize("unit_system", [METRIC, IMPERIAL])
+    @pytest.mark.parametrize(
+        ("quantity", "values"),
+        [
+            (Distance, [Distance(km=1), Distance.MARATHON, Distance(m=400)]),
+            (Duration, [Duration(247), Duration(5211.08), Duration(0.04)]),
+            (Pace, [pace("4:07"), pace("2:50.6"), Pace(seconds_per_km=599.99)]),
+            (Speed, [Speed(km_h=12), Speed(mph=13.1)]),
+        ],
+    )
+    def test_same_as_str(self, unit_system, quantity, values):
+        attr = {Distance: "km", Duration: "seconds", Pace: "seconds_per_km"}.get(
+            quantity, "km_h"
+        )
+        with set_unit_system(unit_system):
+            expected = [str(value) for value in values]
+            raw = [getattr(value, attr) for value in values]
+            assert quantity.format_many(raw) == expected
+
+    def test_write_to_file(self):
+        stream = io.StringIO()
+        Pace.format_many([240, 300], file=stream)
+        assert stream.getvalue() == "4:00.0/km\n5:00.0/km\n"
+
+
 class TestArithmetics:
     def test_marathon_record_pace(self):
         pace = duration("2:00:35") / Distance.MARATHON
@@ -175,5 +313,73 @@ class TestArithmetics:
         duration = Distance.MARATHON * pace("4:00")
         assert str(duration) == "2:48:46.8"
 
+    def test_distance_by_duration(self):
+        speed = Distance(km=10) / duration("1:00:00")
+        assert speed == Speed(km_h=10)
+
     def test_sum(self):
         assert sum([Distance(km=1), Distance(km=3)]) == Distance(km=4)
+
+    def test_add_incompatible(self):
+        with pytest.raises(TypeError):
+            Distance(km=1) + duration("1:00")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [Distance(km=5), Duration(12.5), Pace(seconds_per_km=240), Speed(km_h=12)],
+)
+def test_repr_roundtrip(value):
+    assert eval(repr(value)) == value
+
+
+class TestAggregation:
+    def test_duration_sum(self):
+        splits = [Duration(0.1)] * 10
+        assert Duration.sum(splits) == Duration(1.0)
+        assert sum(splits) != Duration(1.0)
+
+    def test_distance_sum(self):
+        assert Distance.sum(Distance(km=1) for _ in range(3)) == Distance(km=3)
+        assert Distance.sum([]) == Distance(km=0)
+
+    def test_sum_of_array(self):
+        pytest.importorskip("numpy")
+        from py42195.arrays import DurationArray
+
+        assert Duration.sum(DurationArray([0.1] * 10)) == Duration(1.0)
+
+    def test_pace_mean_equal_distances(self):
+        paces = [pace("4:00"), pace("5:00")]
+        assert Pace.mean(paces) == pace("4:30")
+
+    def test_pace_mean_weighted_by_distance(self):
+        paces = [pace("4:00"), pace("5:00")]
+        distances = [Distance(km=10), Distance(km=30)]
+        assert Pace.mean(paces, weights=distances) == pace("4:45")
+
+    def test_pace_mean_weighted_by_duration(self):
+        # 20 minutes at each pace = 5 km + 4 km in 40 minutes
+        paces = [pace("4:00"), pace("5:00")]
+        durations = [duration("20:00"), duration("20:00")]
+        mean = Pace.mean(paces, weights=durations)
+        assert mean.seconds_per_km == pytest.approx(2400 / 9)
+
+    def test_speed_mean(self):
+        speeds = [Speed(km_h=10), Speed(km_h=15)]
+        assert Speed.mean(speeds) == Speed(km_h=12.5)
+        # Same distance at each speed
+        distances = [Distance(km=5), Distance(km=5)]
+        assert Speed.mean(speeds, weights=distances).km_h == pytest.approx(12)
+
+    def test_mean_of_empty(self):
+        with pytest.raises(ValueError):
+            Pace.mean([])
+
+    def test_mismatched_weights(self):
+        with pytest.raises(ValueError):
+            Pace.mean([pace("4:00")], weights=[Distance(km=1), Distance(km=2)])
+
+    def test_invalid_weights(self):
+        with pytest.raises(TypeError):
+            Pace.mean([pace("4:00")], weights=[Speed(km_h=10)])
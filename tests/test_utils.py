@@ -1,4 +1,13 @@
-from py42195.utils import parse_interval
+import io
+import math
+
+from py42195.utils import (
+    format_interval,
+    format_intervals,
+    parse_interval,
+    parse_interval_seconds,
+    parse_intervals,
+)
 from py42195.types import Duration
 
 import pytest
@@ -39,3 +48,86 @@ class TestParseInterval:
     def test_invalid_type(self, source):
         with pytest.raises(TypeError):
             parse_interval(source)
+
+
+class TestParseIntervalSeconds:
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [("59.5", 59.5), ("4:07", 247), ("1:26:51", 5211), ("100:00:00", 360000)],
+    )
+    def test_valid(self, source, expected):
+        assert parse_interval_seconds(source) == expected
+
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [("0:75", 75), ("0:75:00", 4500), ("00:00:75", 75), ("4:07\n", 247)],
+    )
+    def test_same_grammar_as_parse_interval(self, source, expected):
+        # Fields are only range-checked below a nonzero field
+        assert parse_interval_seconds(source) == expected
+        assert parse_interval(source) == timedelta(seconds=expected)
+
+    @pytest.mark.parametrize("source", ["1:75", "1:75:00", "4:07 ", "4:07\n\n"])
+    def test_invalid(self, source):
+        with pytest.raises(ValueError):
+            parse_interval_seconds(source)
+
+
+class TestParseIntervals:
+    def test_valid(self):
+        assert list(parse_intervals(["1", "1:12", "1:12:12"])) == [1, 72, 4332]
+
+    def test_raise(self):
+        with pytest.raises(ValueError):
+            parse_intervals(["1", "x"])
+
+    def test_nan(self):
+        result = parse_intervals(["1", "x", "2"], errors="nan")
+        assert result[0] == 1
+        assert math.isnan(result[1])
+
+    def test_collect(self):
+        bad_rows = []
+        result = parse_intervals(["1", "1:74", None, "3"], errors=bad_rows)
+        assert bad_rows == [1, 2]
+        assert len(result) == 4
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            parse_intervals(["1"], errors="ignore")
+
+
+class TestFormatInterval:
+    @pytest.mark.parametrize(
+        ("value", "kwargs", "expected"),
+        [
+            (247, {}, "4:07.0"),
+            (5211.08, {}, "1:26:51.1"),
+            (5211.08, {"int_seconds": True}, "1:26:51"),
+            (5211.08, {"precision": 2}, "1:26:51.08"),
+            (247.4, {"precision": 0}, "4:07"),
+            (247, {"pad_hours": True}, "00:04:07.0"),
+            (59.96, {}, "1:00.0"),
+            (609.96, {}, "10:10.0"),
+            (math.inf, {}, "-"),
+            (timedelta(minutes=5), {}, "5:00.0"),
+        ],
+    )
+    def test_format(self, value, kwargs, expected):
+        assert format_interval(value, **kwargs) == expected
+
+
+class TestFormatIntervals:
+    values = [0, 9.96, 59.99, 247, 3599.95, 5211.08, 100000.5, math.nan]
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"int_seconds": True}, {"precision": 3, "pad_hours": True}]
+    )
+    def test_same_as_scalar(self, kwargs):
+        expected = [format_interval(value, **kwargs) for value in self.values]
+        assert format_intervals(self.values, **kwargs) == expected
+
+    def test_write_to_file(self):
+        stream = io.StringIO()
+        assert format_intervals([60, 120], suffix="/km", file=stream) is None
+        assert stream.getvalue() == "1:00.0/km\n2:00.0/km\n"
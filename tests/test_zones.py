@@ -0,0 +1,130 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py42195 import Distance, Duration, pace, speed
+from py42195.arrays import DistanceArray, DurationArray, PaceArray
+from py42195.zones import Zones, parse_range
+
+
+@pytest.fixture
+def zones():
+    return Zones.parse(
+        {
+            "easy": "6:00-5:00/km",
+            "steady": "5:00-4:30/km",
+            "tempo": "4:30-4:00/km",
+        }
+    )
+
+
+class TestParse:
+    def test_parse_range(self):
+        assert parse_range("4:10-4:25/km") == (pace("4:10/km"), pace("4:25/km"))
+        assert parse_range("4:10–4:25") == (pace("4:10"), pace("4:25"))
+        assert parse_range("12-14 km/h") == (speed("12 km/h"), speed("14 km/h"))
+        with pytest.raises(ValueError):
+            parse_range("fast")
+
+    def test_zones(self, zones):
+        assert zones.names == ["easy", "steady", "tempo"]
+        assert zones.quantity is type(pace("4:00"))
+        assert [str(b) for b in zones.boundaries] == [
+            "6:00.0/km",
+            "5:00.0/km",
+            "4:30.0/km",
+            "4:00.0/km",
+        ]
+        assert repr(zones).startswith("Zones(easy: 6:00.0/km-5:00.0/km")
+
+    def test_any_order(self, zones):
+        reordered = Zones.parse(
+            {"tempo": "4:00-4:30/km", "easy": "5:00-6:00/km", "steady": "4:30-5:00/km"}
+        )
+        assert reordered.names == zones.names
+        assert reordered.boundaries == zones.boundaries
+
+    def test_not_contiguous(self):
+        with pytest.raises(ValueError):
+            Zones.parse(["6:00-5:00/km", "4:50-4:30/km"])
+
+    def test_speeds(self):
+        zones = Zones.parse(["10-12 km/h", "12-14 km/h"])
+        assert zones.names == ["Z1", "Z2"]
+        assert zones.zone(speed("13 km/h")) == "Z2"
+        assert zones.zone(pace("4:20")) == "Z2"
+
+    def test_relative(self):
+        zones = Zones.relative(pace("4:00"), [1.25, 1.1, 1.0, 0.95])
+        assert [b.seconds_per_km for b in zones.boundaries] == pytest.approx(
+            [300, 264, 240, 228]
+        )
+        assert len(zones) == 3
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Zones([pace("4:00")])
+        with pytest.raises(ValueError):
+            Zones([pace("4:00"), pace("4:00")])
+        with pytest.raises(ValueError):
+            Zones([pace("4:00"), pace("5:00")], ["a", "b"])
+
+
+class TestClassify:
+    def test_zone(self, zones):
+        assert zones.zone(pace("5:30")) == "easy"
+        assert zones.zone(pace("4:15")) == "tempo"
+        assert zones.zone(pace("3:30")) is None
+        assert zones.zone(pace("7:00")) is None
+
+    def test_classify(self, zones):
+        paces = PaceArray(seconds_per_km=[330, 290, 255, 200, 400])
+        np.testing.assert_array_equal(zones.classify(paces), [0, 1, 2, -1, -1])
+        np.testing.assert_array_equal(
+            zones.classify(paces.to_speed()), [0, 1, 2, -1, -1]
+        )
+        np.testing.assert_array_equal(
+            zones.classify([pace("5:30"), speed("14.5 km/h")]), [0, 2]
+        )
+
+    def test_matches_scalar_comparisons(self, zones):
+        values = np.random.default_rng(0).uniform(200, 400, 1000)
+        bins = zones.classify(PaceArray(seconds_per_km=values))
+        names = [zones.zone(p) for p in PaceArray(seconds_per_km=values)]
+        assert [None if i < 0 else zones.names[i] for i in bins] == names
+
+
+class TestTotals:
+    # 1 km easy (5:30), 1 km tempo (4:15), 2 min stop, 1 km too fast (3:30)
+    KM = [0.0, 1.0, 2.0, 2.0, 3.0]
+    SECONDS = [0.0, 330.0, 585.0, 705.0, 915.0]
+
+    def test_totals(self, zones):
+        totals = zones.totals(DistanceArray(km=self.KM), DurationArray(self.SECONDS))
+        assert list(totals) == ["easy", "steady", "tempo"]
+        assert totals["easy"] == (Duration(330), Distance(km=1))
+        assert totals["steady"] == (Duration(0), Distance(km=0))
+        assert totals["tempo"].duration == Duration(255)
+
+    def test_scalars(self, zones):
+        totals = zones.totals(
+            [Distance(km=x) for x in self.KM], [Duration(s) for s in self.SECONDS]
+        )
+        assert totals["tempo"].distance == Distance(km=1)
+
+    def test_totals_many(self, zones):
+        activities = [
+            (DistanceArray(km=self.KM), DurationArray(self.SECONDS)),
+            (DistanceArray(km=[0.0, 2.0]), DurationArray([0.0, 580.0])),
+        ]
+        durations, distances = zones.totals_many(activities)
+        np.testing.assert_allclose(durations.seconds, [[330, 0, 255], [0, 580, 0]])
+        np.testing.assert_allclose(distances.km, [[1, 0, 1], [0, 2, 0]])
+
+    def test_totals_many_empty(self, zones):
+        durations, distances = zones.totals_many([])
+        assert durations.shape == distances.shape == (0, 3)
+
+    def test_mismatch(self, zones):
+        with pytest.raises(ValueError):
+            zones.totals(DistanceArray(km=[0, 1]), DurationArray([0.0]))